@@ -1,19 +1,46 @@
+from textCraftAI.components.startup import ModelWarmup, StartupTracer
+
+# Created before the other imports so their cost shows up in the startup trace
+startup_tracer = StartupTracer()
+
 from fastapi import FastAPI, Request, HTTPException, File, UploadFile, Form
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
 import uvicorn
 import os
+import json
+import time
 from fastapi.templating import Jinja2Templates
 from textCraftAI.pipeline.enhanced_prediction import EnhancedPredictionPipeline
+from textCraftAI.components.inference_batcher import InferenceBatcher
+from textCraftAI.components.inference_executor import InferenceExecutor, ExecutorSaturatedError
+from textCraftAI.components.token_budget import InputTooLongError, TokenizedInput
+from textCraftAI.components.bulk_inference import BatchRequestError, BulkProcessor
+from textCraftAI.components.job_queue import JobStore
+from textCraftAI.components.metrics import REQUEST_SECONDS, registry as metrics_registry
+from textCraftAI.components.upload_spool import SpooledUpload, UploadTooLargeError, spool_upload
+from textCraftAI.pipeline.job_worker import JobWorkerPool
+from textCraftAI.config.configuration import ConfigurationManager
+from textCraftAI.utils.process_memory import process_memory
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, Union
+
+startup_tracer.mark("imports done")
 
 # Request models
 class TextRequest(BaseModel):
     text: str
+    long_document: bool = False  # Map-reduce summarization for inputs longer than the encoder window
+    quality: Optional[str] = None  # Decoding profile: best, balanced or fast
+    latency_budget_ms: Optional[float] = None  # Adapt decoding to finish within this budget
 
 class ParaphraseRequest(BaseModel):
     text: str
     length_factor: float = 1.0  # Default to same length as input
+    seed: Optional[int] = None  # Deterministic sampling, makes the result cacheable
+    quality: Optional[str] = None  # Decoding profile: best, balanced or fast
+    latency_budget_ms: Optional[float] = None  # Adapt decoding to finish within this budget
 
 app = FastAPI(
     title="TextCraftAI",
@@ -23,11 +50,143 @@ app = FastAPI(
 
 templates = Jinja2Templates(directory="templates")
 
+# One pipeline per process; models are loaded once and shared through its registry
+with startup_tracer.phase("init:pipeline"):
+    predictor = EnhancedPredictionPipeline()
+
+config_manager = ConfigurationManager()
+
+# Models load and warm up in the background once the server is up; /readyz reports progress
+model_warmup = ModelWarmup(predictor, predictor.registry_config.warmup_models, startup_tracer)
+
+# Blocking model calls run on a bounded pool so the event loop stays responsive
+executor = InferenceExecutor(config_manager.get_inference_executor_config())
+
+# Concurrent summarize/paraphrase requests are grouped into batched generate calls
+batcher = InferenceBatcher(config_manager.get_inference_batcher_config(), predictor, executor)
+
+long_document_config = config_manager.get_long_document_config()
+
+# Many texts per request, generated as length-sorted batches and streamed back as NDJSON
+bulk_processor = BulkProcessor(config_manager.get_batch_api_config(), predictor, executor)
+
+# Uploads are read in chunks and spooled to disk above a threshold
+upload_config = config_manager.get_upload_config()
+max_upload_bytes = int(upload_config.max_file_mb * 1024 * 1024)
+
+# File jobs are persisted in SQLite and processed by worker processes outside the request
+job_queue_config = config_manager.get_job_queue_config()
+job_store = JobStore(job_queue_config)
+job_workers = JobWorkerPool(job_queue_config)
+
+# State other components already track is read when /metrics is scraped
+metrics_registry.callback(
+    "textcraft_model_load_seconds", "Seconds the last load of each model took",
+    lambda: {(model["name"],): model["load_seconds"] for model in predictor.registry.status()["models"]},
+    ("model",)
+)
+metrics_registry.callback(
+    "textcraft_model_resident", "Whether each model is loaded in this process",
+    lambda: {(model["name"],): int(model["resident"]) for model in predictor.registry.status()["models"]},
+    ("model",)
+)
+metrics_registry.callback(
+    "textcraft_cache_lookups_total", "Result cache lookups by outcome",
+    lambda: {(result,): predictor.result_cache.stats()[result] for result in ("memory_hits", "disk_hits", "misses")},
+    ("result",), kind="counter"
+)
+metrics_registry.callback(
+    "textcraft_cache_hit_ratio", "Share of result cache lookups served from memory or disk",
+    lambda: predictor.result_cache.stats()["hit_rate"]
+)
+metrics_registry.callback(
+    "textcraft_executor_queue_depth", "Inference calls waiting for a worker thread",
+    lambda: executor.stats()["queue_depth"]
+)
+metrics_registry.callback(
+    "textcraft_executor_active_workers", "Inference calls running",
+    lambda: executor.stats()["active_workers"]
+)
+metrics_registry.callback(
+    "textcraft_ready", "Whether every warm-up model is loaded and warmed", lambda: int(model_warmup.ready)
+)
+
+
+@app.on_event("startup")
+def start_model_warmup():
+    startup_tracer.mark("server starting")
+    model_warmup.start()
+
+
+@app.on_event("startup")
+def start_job_workers():
+    job_workers.start()
+
+
+@app.on_event("shutdown")
+def stop_executor():
+    executor.shutdown()
+    predictor.document_extractor.shutdown()
+
+
+@app.on_event("shutdown")
+def stop_job_workers():
+    job_workers.stop()
+
+
+# Fail fast when the inference queue is full instead of letting requests pile up
+@app.exception_handler(ExecutorSaturatedError)
+async def executor_saturated_handler(request: Request, exc: ExecutorSaturatedError):
+    return JSONResponse(
+        status_code=429,
+        content={"detail": "Server is busy. Please retry shortly."},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
+# Inputs that do not fit the model's encoder window are rejected rather than truncated
+@app.exception_handler(InputTooLongError)
+async def input_too_long_handler(request: Request, exc: InputTooLongError):
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+@app.exception_handler(BatchRequestError)
+async def batch_request_error_handler(request: Request, exc: BatchRequestError):
+    return JSONResponse(status_code=exc.status_code, content={"detail": str(exc)})
+
+# Reject oversized uploads from their Content-Length before the form is parsed
+@app.middleware("http")
+async def reject_oversized_uploads(request: Request, call_next):
+    if request.method == "POST" and request.url.path in ("/upload", "/upload/stream", "/jobs"):
+        content_length = request.headers.get("content-length")
+        # Allow for the multipart boundaries and the other form fields
+        if content_length and content_length.isdigit() and int(content_length) > max_upload_bytes + 64 * 1024:
+            return JSONResponse(
+                status_code=413,
+                content={"detail": str(UploadTooLargeError(max_upload_bytes))}
+            )
+    return await call_next(request)
+
+# Request latency by route template, so /jobs/{job_id} is one series rather than one per job
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        REQUEST_SECONDS.observe(
+            time.perf_counter() - started, request.method,
+            route.path if route is not None else "unmatched", str(status)
+        )
+
 # Health check endpoint for Railway
 @app.get("/health")
 async def health_check():
     return {
         "status": "healthy", 
+        "ready": model_warmup.ready,
         "service": "TextCraftAI",
         "version": "2.0.0",
         "features": [
@@ -41,77 +200,176 @@ async def health_check():
         ]
     }
 
+# Liveness: the process is up and its event loop responds
+@app.get("/livez")
+async def liveness():
+    return {"status": "alive"}
+
+# Readiness: every warm-up model is loaded and has run a generate
+@app.get("/readyz")
+async def readiness():
+    status = model_warmup.status()
+    return JSONResponse(
+        status_code=200 if status["ready"] else 503,
+        content={**status, "startup": startup_tracer.report()}
+    )
+
+# Resident models and their load times
+@app.get("/models", tags=["api"])
+async def models_status():
+    return predictor.registry.status()
+
+# Serving statistics for tuning throughput against latency
+@app.get("/stats", tags=["api"])
+async def serving_stats():
+    return {
+        "batching": batcher.stats(),
+        "executor": executor.stats(),
+        "cache": predictor.result_cache.stats(),
+        "decoding": predictor.adaptive_decoder.stats(),
+        "jobs": {**job_store.stats(), **job_workers.status()},
+        "memory": _process_memory()
+    }
+
+def _process_memory() -> Optional[dict]:
+    # /proc is Linux-only and may be unreadable in a container, the rest of /stats is still useful
+    try:
+        return process_memory(os.getpid())
+    except OSError:
+        return None
+
+# Prometheus metrics of this process (each serve.py worker keeps its own)
+@app.get("/metrics", tags=["api"])
+async def metrics():
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
+
 # Main web interface (only summarization)
 @app.get("/", tags=["web"])
 async def index(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
+def _plan_decoding(task: str, model_input: TokenizedInput, gen_kwargs: dict, quality: Optional[str],
+                   latency_budget_ms: Optional[float]):
+    """Adapt decoding to the request's quality tier and latency budget"""
+    try:
+        # The input was tokenized when it was prepared, so planning is cheap enough for the event loop
+        return predictor.plan_decoding(task, model_input, gen_kwargs, quality, latency_budget_ms)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
 # Prediction API endpoint
 @app.post("/predict", tags=["api"])
 async def predict_route(request: TextRequest):
+    started = time.perf_counter()
     try:
         if not request.text.strip():
             raise HTTPException(status_code=400, detail="Text input cannot be empty")
         
-        if len(request.text) > 10000:
-            raise HTTPException(status_code=400, detail="Text too long. Maximum 10,000 characters allowed.")
+        if request.long_document:
+            if request.quality is not None or request.latency_budget_ms is not None:
+                raise HTTPException(
+                    status_code=400, detail="quality and latency_budget_ms are not supported for long documents"
+                )
+            if len(request.text) > long_document_config.max_document_chars:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Text too long. Maximum {long_document_config.max_document_chars:,} characters allowed."
+                )
+            summary = await executor.run(predictor.summarize_long_text, request.text)
+            return {"summary": summary}
         
-        obj = EnhancedPredictionPipeline()
-        summary = obj.summarize_text(request.text)
-        return {"summary": summary}
+        # Tokenizing may load the model; a full executor rejects the request here
+        model_input, gen_kwargs = await executor.run(predictor.prepare_summarization, request.text)
+        gen_kwargs, decoding = _plan_decoding(
+            "summarization", model_input, gen_kwargs, request.quality, request.latency_budget_ms
+        )
+        summary = await batcher.submit("summarization", model_input, gen_kwargs)
+        decoding["latency_ms"] = _elapsed_ms(started)
+        return {"summary": summary, "decoding": decoding}
+    except (HTTPException, ExecutorSaturatedError, InputTooLongError):
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Prediction failed: {str(e)}")
 
 # Paraphrasing API endpoint
 @app.post("/paraphrase", tags=["api"])
 async def paraphrase_route(request: ParaphraseRequest):
+    started = time.perf_counter()
     try:
         if not request.text.strip():
             raise HTTPException(status_code=400, detail="Text input cannot be empty")
         
-        if len(request.text) > 10000:
-            raise HTTPException(status_code=400, detail="Text too long. Maximum 10,000 characters allowed.")
-        
         if not (0.3 <= request.length_factor <= 2.0):
             raise HTTPException(status_code=400, detail="Length factor must be between 0.3 and 2.0")
         
-        obj = EnhancedPredictionPipeline()
-        paraphrased = obj.paraphrase_text(request.text, request.length_factor)
-        return {"paraphrased_text": paraphrased, "length_factor": request.length_factor}
+        model_input, gen_kwargs = await executor.run(
+            predictor.prepare_paraphrase, request.text, request.length_factor, request.seed
+        )
+        gen_kwargs, decoding = _plan_decoding(
+            "paraphrase", model_input, gen_kwargs, request.quality, request.latency_budget_ms
+        )
+        paraphrased = await batcher.submit("paraphrase", model_input, gen_kwargs)
+        decoding["latency_ms"] = _elapsed_ms(started)
+        return {"paraphrased_text": paraphrased, "length_factor": request.length_factor, "decoding": decoding}
+    except (HTTPException, ExecutorSaturatedError, InputTooLongError):
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Paraphrasing failed: {str(e)}")
 
+async def _read_upload(file: UploadFile, operation: str, length_factor: float) -> SpooledUpload:
+    """Validate an upload form and read the file in chunks, hashing it on the way
+    
+    The caller must close the returned upload.
+    """
+    # Validate operation
+    if operation not in ["summarize", "paraphrase"]:
+        raise HTTPException(status_code=400, detail="Invalid operation. Choose 'summarize' or 'paraphrase'")
+    
+    # Validate length_factor if paraphrasing
+    if operation == "paraphrase" and not (0.3 <= length_factor <= 2.0):
+        raise HTTPException(status_code=400, detail="Length factor must be between 0.3 and 2.0")
+    
+    # Validate file type
+    allowed_types = ['.pdf', '.docx', '.txt']
+    if not any(file.filename.lower().endswith(ext) for ext in allowed_types):
+        raise HTTPException(status_code=400, detail="Unsupported file type. Upload PDF, DOCX, or TXT files only.")
+    
+    # Read file content, stopping as soon as it crosses the size limit
+    try:
+        return await spool_upload(file, upload_config)
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
 # File upload and processing endpoint
 @app.post("/upload", tags=["api"])
 async def upload_file(
     file: UploadFile = File(...),
     operation: str = Form(...),
-    length_factor: float = Form(1.0)
+    length_factor: float = Form(1.0),
+    seed: Optional[int] = Form(None)
 ):
     try:
-        # Validate operation
-        if operation not in ["summarize", "paraphrase"]:
-            raise HTTPException(status_code=400, detail="Invalid operation. Choose 'summarize' or 'paraphrase'")
-        
-        # Validate length_factor if paraphrasing
-        if operation == "paraphrase" and not (0.3 <= length_factor <= 2.0):
-            raise HTTPException(status_code=400, detail="Length factor must be between 0.3 and 2.0")
-        
-        # Validate file type
-        allowed_types = ['.pdf', '.docx', '.txt']
-        if not any(file.filename.lower().endswith(ext) for ext in allowed_types):
-            raise HTTPException(status_code=400, detail="Unsupported file type. Upload PDF, DOCX, or TXT files only.")
-        
-        # Read file content
-        file_content = await file.read()
-        
-        # Validate file size
-        if len(file_content) > 5 * 1024 * 1024:  # 5MB limit
-            raise HTTPException(status_code=400, detail="File too large. Maximum 5MB allowed.")
-        
-        # Process file
-        obj = EnhancedPredictionPipeline()
-        result = obj.process_file(file_content, file.filename, operation, length_factor)
+        with await _read_upload(file, operation, length_factor) as upload:
+            # Repeated uploads of the same file are answered from the result cache
+            cache_key = await executor.run(
+                predictor.file_cache_key, upload.sha256, file.filename, operation, length_factor, seed
+            )
+            result = await executor.run(predictor.result_cache.get, cache_key) if cache_key else None
+            
+            # Process file
+            if result is None:
+                if operation == "summarize":
+                    # Documents are summarized in full, pages are summarized while later ones are extracted
+                    result = await executor.run(predictor.summarize_file, upload.file, file.filename)
+                else:
+                    text = await executor.run(predictor.extract_text, upload.file, file.filename, "paraphrase")
+                    # File text is not bounded like a request body; paraphrase what fits the encoder
+                    result = await batcher.paraphrase(text, length_factor, seed, truncate=True)
+                if cache_key:
+                    await executor.run(predictor.result_cache.put, cache_key, result)
         
         return {
             "filename": file.filename,
@@ -119,11 +377,221 @@ async def upload_file(
             "length_factor": length_factor if operation == "paraphrase" else None,
             "result": result
         }
-    except HTTPException:
+    except (HTTPException, ExecutorSaturatedError, InputTooLongError):
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"File processing failed: {str(e)}")
 
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+async def _stream_generation(request: Request, task: str, model_input: Union[str, TokenizedInput], gen_kwargs: dict,
+                             extra: Optional[dict] = None) -> StreamingResponse:
+    """Stream cleaned output of one generate call as server-sent events
+    
+    Events: ``delta`` carries new text to append, ``replace`` carries the full
+    text when cleaning rewrote something already sent, ``done`` carries the
+    final text and ``error`` a failure after streaming started.
+    """
+    stream = await executor.run(predictor.open_stream, task, model_input, gen_kwargs)
+    # Admission happens before the response starts, so a full queue still returns 429
+    executor.submit(stream.run)
+
+    async def events():
+        try:
+            async for delta, replaced in iterate_in_threadpool(iter(stream)):
+                if await request.is_disconnected():
+                    break
+                yield _sse("replace" if replaced else "delta", {"text": delta})
+            else:
+                yield _sse("done", {"text": stream.text, **(extra or {})})
+        except Exception as e:
+            yield _sse("error", {"detail": str(e)})
+        finally:
+            # Stops generation at the next decoder step if the client went away
+            stream.cancel()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# Streaming prediction API endpoint
+@app.post("/predict/stream", tags=["api"])
+async def predict_stream_route(request: Request, body: TextRequest):
+    if not body.text.strip():
+        raise HTTPException(status_code=400, detail="Text input cannot be empty")
+    
+    if body.long_document:
+        if body.quality is not None or body.latency_budget_ms is not None:
+            raise HTTPException(
+                status_code=400, detail="quality and latency_budget_ms are not supported for long documents"
+            )
+        if len(body.text) > long_document_config.max_document_chars:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Text too long. Maximum {long_document_config.max_document_chars:,} characters allowed."
+            )
+        # Map/reduce levels run up front, only the final summary is streamed
+        model_input = await executor.run(predictor.long_document_summarizer.reduce, body.text)
+        gen_kwargs = predictor.summarization_gen_kwargs()
+    else:
+        model_input, gen_kwargs = await executor.run(predictor.prepare_summarization, body.text)
+        gen_kwargs, _ = _plan_decoding(
+            "summarization", model_input, gen_kwargs, body.quality, body.latency_budget_ms
+        )
+    
+    return await _stream_generation(request, "summarization", model_input, gen_kwargs)
+
+# Streaming paraphrasing API endpoint
+@app.post("/paraphrase/stream", tags=["api"])
+async def paraphrase_stream_route(request: Request, body: ParaphraseRequest):
+    if not body.text.strip():
+        raise HTTPException(status_code=400, detail="Text input cannot be empty")
+    
+    if not (0.3 <= body.length_factor <= 2.0):
+        raise HTTPException(status_code=400, detail="Length factor must be between 0.3 and 2.0")
+    
+    model_input, gen_kwargs = await executor.run(
+        predictor.prepare_paraphrase, body.text, body.length_factor, body.seed
+    )
+    gen_kwargs, _ = _plan_decoding("paraphrase", model_input, gen_kwargs, body.quality, body.latency_budget_ms)
+    return await _stream_generation(
+        request, "paraphrase", model_input, gen_kwargs, {"length_factor": body.length_factor}
+    )
+
+# Streaming file upload and processing endpoint
+@app.post("/upload/stream", tags=["api"])
+async def upload_stream(
+    request: Request,
+    file: UploadFile = File(...),
+    operation: str = Form(...),
+    length_factor: float = Form(1.0)
+):
+    # The file is only needed until its text is extracted, not while the output streams
+    with await _read_upload(file, operation, length_factor) as upload:
+        try:
+            if operation == "summarize":
+                # Map/reduce levels consume pages as they are extracted, only the final summary is streamed
+                model_input = await executor.run(
+                    predictor.long_document_summarizer.reduce, predictor.iter_document(upload.file, file.filename)
+                )
+            else:
+                text = await executor.run(predictor.extract_text, upload.file, file.filename, "paraphrase")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    if operation == "summarize":
+        return await _stream_generation(
+            request, "summarization", model_input, predictor.summarization_gen_kwargs(),
+            {"filename": file.filename, "operation": operation}
+        )
+    
+    model_input, gen_kwargs = await executor.run(predictor.prepare_paraphrase, text, length_factor, None, True)
+    return await _stream_generation(
+        request, "paraphrase", model_input, gen_kwargs,
+        {"filename": file.filename, "operation": operation, "length_factor": length_factor}
+    )
+
+async def _read_batch_body(request: Request):
+    """Return the raw items of a batch request and whether they are NDJSON
+    
+    Accepts a JSON array body, an NDJSON body (``application/x-ndjson``) or a
+    multipart upload with a ``file`` field holding either format.
+    """
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > bulk_processor.max_body_bytes:
+        raise BatchRequestError(
+            f"Request body too large. Maximum {bulk_processor.config.max_body_mb:g}MB allowed.", status_code=413
+        )
+    
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("file")
+        if upload is None or isinstance(upload, str):
+            raise HTTPException(status_code=400, detail="Upload the items as a 'file' field")
+        body = await upload.read()
+        # Uploaded files are sniffed: a JSON array starts with '[', anything else is NDJSON
+        return body, not body.lstrip().startswith(b"[")
+    
+    body = await request.body()
+    return body, "ndjson" in content_type or "jsonl" in content_type
+
+async def _batch_response(request: Request, task: str) -> StreamingResponse:
+    body, ndjson = await _read_batch_body(request)
+    # Parsing and tokenizing every item is the admission point for the whole request
+    items = await executor.run(bulk_processor.prepare, task, body, ndjson)
+    return StreamingResponse(
+        bulk_processor.stream(task, items, request.is_disconnected),
+        media_type="application/x-ndjson",
+        headers={"X-Batch-Items": str(len(items))}
+    )
+
+# Bulk summarization endpoint, results stream back as NDJSON in input order
+@app.post("/batch/summarize", tags=["api"])
+async def batch_summarize_route(request: Request):
+    return await _batch_response(request, "summarization")
+
+# Bulk paraphrasing endpoint, results stream back as NDJSON in input order
+@app.post("/batch/paraphrase", tags=["api"])
+async def batch_paraphrase_route(request: Request):
+    return await _batch_response(request, "paraphrase")
+
+def _job_status(job: dict) -> dict:
+    status = {key: job[key] for key in ("status", "operation", "filename", "attempts", "max_attempts",
+                                        "error", "created_at", "started_at", "finished_at")}
+    status["job_id"] = job["id"]
+    status["length_factor"] = job["length_factor"] if job["operation"] == "paraphrase" else None
+    return status
+
+async def _get_job(job_id: str) -> dict:
+    job = await run_in_threadpool(job_store.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return job
+
+# Asynchronous file processing: submit returns a job id immediately
+@app.post("/jobs", tags=["api"], status_code=202)
+async def submit_job(
+    file: UploadFile = File(...),
+    operation: str = Form(...),
+    length_factor: float = Form(1.0),
+    seed: Optional[int] = Form(None)
+):
+    with await _read_upload(file, operation, length_factor) as upload:
+        job = await run_in_threadpool(
+            job_store.submit, upload.read_bytes(), file.filename, operation, length_factor, seed, upload.sha256
+        )
+    job_id = job["id"]
+    return {
+        "job_id": job_id,
+        "status": job["status"],
+        "status_url": f"/jobs/{job_id}",
+        "result_url": f"/jobs/{job_id}/result"
+    }
+
+@app.get("/jobs/{job_id}", tags=["api"])
+async def job_status(job_id: str):
+    return _job_status(await _get_job(job_id))
+
+@app.get("/jobs/{job_id}/result", tags=["api"])
+async def job_result(job_id: str):
+    job = await _get_job(job_id)
+    if job["status"] == "failed":
+        raise HTTPException(status_code=422, detail=f"Job failed: {job['error']}")
+    if job["status"] != "succeeded":
+        # Not finished yet, poll again later
+        return JSONResponse(status_code=202, content=_job_status(job))
+    return {
+        "job_id": job["id"],
+        "filename": job["filename"],
+        "operation": job["operation"],
+        "length_factor": job["length_factor"] if job["operation"] == "paraphrase" else None,
+        "result": job["result"]
+    }
+
 # For Railway deployment - use PORT environment variable
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8080))
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+DOCX Extraction Benchmark for TextCraftAI
+Generates large synthetic DOCX files (paragraphs, tables, a header and a
+footer) and compares python-docx with the streaming extractor in
+textCraftAI.components.document_extraction. Each variant runs in a fresh
+process so its peak RSS is not hidden by the others. Reports blocks/sec,
+time to the first block and peak RSS, and checks that the streaming output
+matches python-docx's paragraphs and table cells.
+
+Usage: python benchmarks/docx_extraction_benchmark.py [--paragraphs 5000 20000]
+"""
+
+import argparse
+import hashlib
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape
+
+import docx
+from docx.text.paragraph import Paragraph
+
+from textCraftAI.entity.config_entity import DocumentExtractionConfig
+from textCraftAI.components.document_extraction import DocumentExtractor
+
+
+WORDS = ("summary dialogue meeting report budget customer schedule project review team quarter "
+         "results delivery contract update question answer planning travel invoice support").split()
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/header1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.header+xml"/>'
+    '<Override PartName="/word/footer1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.footer+xml"/>'
+    '</Types>'
+)
+PACKAGE_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    f'<Relationship Id="rId1" Type="{REL_TYPE}officeDocument" Target="word/document.xml"/>'
+    '</Relationships>'
+)
+DOCUMENT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    f'<Relationship Id="rId1" Type="{REL_TYPE}header" Target="header1.xml"/>'
+    f'<Relationship Id="rId2" Type="{REL_TYPE}footer" Target="footer1.xml"/>'
+    f'<Relationship Id="rId3" Type="{REL_TYPE}hyperlink" Target="https://example.com" TargetMode="External"/>'
+    '</Relationships>'
+)
+
+
+def _paragraph(rng: random.Random) -> str:
+    """A paragraph of a few runs, sometimes with a tab, a line break or a hyperlink"""
+    runs = []
+    for _ in range(rng.randint(1, 4)):
+        words = escape(" ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 14))))
+        extra = rng.choice(("", "", "<w:tab/>", "<w:br/>"))
+        runs.append(f'<w:r><w:rPr><w:b/></w:rPr><w:t xml:space="preserve">{words} </w:t>{extra}</w:r>')
+    if rng.random() < 0.1:
+        runs.append(f'<w:hyperlink r:id="rId3"><w:r><w:t>{rng.choice(WORDS)}</w:t></w:r></w:hyperlink>')
+    return '<w:p><w:pPr><w:tabs><w:tab w:val="left" w:pos="720"/></w:tabs></w:pPr>' + "".join(runs) + "</w:p>"
+
+
+def _table(rng: random.Random, rows: int = 4, cols: int = 3) -> str:
+    cells = "".join(
+        "<w:tr>" + "".join(f"<w:tc>{_paragraph(rng)}{_paragraph(rng)}</w:tc>" for _ in range(cols)) + "</w:tr>"
+        for _ in range(rows)
+    )
+    return f'<w:tbl><w:tblPr/><w:tblGrid>{"<w:gridCol/>" * cols}</w:tblGrid>{cells}</w:tbl>'
+
+
+def make_docx(path: str, num_paragraphs: int, table_every: int = 50, seed: int = 0):
+    """Write a DOCX with ``num_paragraphs`` body paragraphs and a 4x3 table every ``table_every``"""
+    rng = random.Random(seed)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", CONTENT_TYPES)
+        archive.writestr("_rels/.rels", PACKAGE_RELS)
+        archive.writestr("word/_rels/document.xml.rels", DOCUMENT_RELS)
+        for part, root in (("header1", "hdr"), ("footer1", "ftr")):
+            archive.writestr(f"word/{part}.xml", f'<w:{root} xmlns:w="{W_NS}" xmlns:r="{R_NS}">'
+                                                 f'{_paragraph(rng)}</w:{root}>')
+        with archive.open("word/document.xml", "w") as document:
+            document.write(f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                           f'<w:document xmlns:w="{W_NS}" xmlns:r="{R_NS}"><w:body>'.encode())
+            for index in range(num_paragraphs):
+                document.write(_paragraph(rng).encode())
+                if index % table_every == table_every - 1:
+                    document.write(_table(rng).encode())
+            document.write(b'<w:sectPr><w:headerReference w:type="default" r:id="rId1"/>'
+                           b'<w:footerReference w:type="default" r:id="rId2"/></w:sectPr></w:body></w:document>')
+
+
+def legacy_blocks(path: str):
+    """The original extract_text_from_docx: paragraphs only, concatenated"""
+    doc = docx.Document(path)
+    text = ""
+    for paragraph in doc.paragraphs:
+        text += paragraph.text + "\n"
+    yield text.strip()
+
+
+def python_docx_blocks(path: str):
+    """Paragraphs and table cells in document order through the python-docx object model"""
+    doc = docx.Document(path)
+    for block in doc.iter_inner_content():
+        if isinstance(block, Paragraph):
+            yield block.text
+        else:
+            for row in block.rows:
+                for cell in row.cells:
+                    yield cell.text
+
+
+def streaming_blocks(path: str):
+    extractor = DocumentExtractor(DocumentExtractionConfig(
+        max_workers=1, parallel_min_pages=1, pages_per_task=1, max_pages=None, docx_headers_footers=False
+    ))
+    with open(path, "rb") as stream:
+        yield from extractor.iter_docx_blocks(stream)
+
+
+VARIANTS = {
+    "legacy python-docx": legacy_blocks,
+    "python-docx + tables": python_docx_blocks,
+    "streaming": streaming_blocks,
+}
+
+
+def run_variant(name: str, path: str):
+    """Extract ``path`` with one variant (runs in a fresh process)"""
+    started = time.perf_counter()
+    first_block = None
+    digest = hashlib.sha256()
+    blocks = 0
+    for block in VARIANTS[name](path) if name else ():
+        if first_block is None:
+            first_block = time.perf_counter() - started
+        digest.update(block.encode() + b"\n")
+        blocks += 1
+    seconds = time.perf_counter() - started
+    return blocks, seconds, first_block, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, digest.hexdigest()
+
+
+def in_fresh_process(name: str, path: str):
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return pool.submit(run_variant, name, path).result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--paragraphs", type=int, nargs="+", default=[5000, 20000])
+    args = parser.parse_args()
+
+    identical = True
+    with tempfile.TemporaryDirectory() as tmp:
+        for num_paragraphs in args.paragraphs:
+            path = os.path.join(tmp, f"bench-{num_paragraphs}.docx")
+            make_docx(path, num_paragraphs)
+            with zipfile.ZipFile(path) as archive:
+                xml_mb = archive.getinfo("word/document.xml").file_size / 2**20
+            print(f"\n{num_paragraphs} paragraphs, {os.path.getsize(path) / 2**20:.1f} MB file, "
+                  f"{xml_mb:.1f} MB document.xml")
+
+            *_, baseline_rss, _ = in_fresh_process("", path)
+            print(f"  {'(imports only)':<22} peak RSS {baseline_rss:7.0f} MB")
+            digests = {}
+            for name in VARIANTS:
+                blocks, seconds, first_block, rss, digests[name] = in_fresh_process(name, path)
+                rate = f"{blocks / seconds:9.0f} blocks/s" if name != "legacy python-docx" else f"{'':>17}"
+                print(f"  {name:<22} {seconds:7.2f} s {rate}  first block {first_block * 1000:8.1f} ms  "
+                      f"peak RSS {rss:7.0f} MB")
+            if digests["streaming"] != digests["python-docx + tables"]:
+                print("  ❌ streaming output differs from python-docx")
+                identical = False
+    return identical
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
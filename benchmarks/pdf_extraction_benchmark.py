@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+PDF Extraction Benchmark for TextCraftAI
+Generates synthetic multi-hundred-page PDFs and compares the original
+extraction loop (string concatenation, without its 10-page cap) with the
+page generator in textCraftAI.components.document_extraction, run in the
+calling thread and on a process pool. Reports pages/sec, time to the first
+page and peak memory, and checks that every variant extracts the same text.
+
+Usage: python benchmarks/pdf_extraction_benchmark.py [--pages 200 500] [--workers N]
+"""
+
+import argparse
+import io
+import os
+import random
+import resource
+import sys
+import time
+import tracemalloc
+
+import PyPDF2
+
+from textCraftAI.entity.config_entity import DocumentExtractionConfig
+from textCraftAI.components.document_extraction import DocumentExtractor
+
+
+WORDS = ("summary dialogue meeting report budget customer schedule project review team quarter "
+         "results delivery contract update question answer planning travel invoice support").split()
+
+
+def make_pdf(num_pages: int, lines_per_page: int = 45, seed: int = 0) -> bytes:
+    """Build a PDF with ``num_pages`` pages of Helvetica text lines"""
+    rng = random.Random(seed)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in once the page ids are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+    for _ in range(num_pages):
+        lines = [" ".join(rng.choice(WORDS) for _ in range(12)) for _ in range(lines_per_page)]
+        stream = b"BT /F1 10 Tf 12 TL 40 800 Td " + b" ".join(
+            b"(" + line.encode("latin-1") + b") Tj T*" for line in lines
+        ) + b" ET"
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        page_ids.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % num_pages
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def legacy_extract(file_content: bytes) -> str:
+    """The original extract_text_from_pdf loop, without the 10-page cap"""
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
+    text = ""
+    for page_num in range(len(pdf_reader.pages)):
+        page = pdf_reader.pages[page_num]
+        text += page.extract_text() + "\n"
+    return text.strip()
+
+
+def measure(name: str, num_pages: int, extract):
+    """Run ``extract`` (a callable returning an iterator of pages) and report its cost
+
+    Timing and memory come from separate runs, tracing allocations would slow
+    down only the work done in this process.
+    """
+    started = time.perf_counter()
+    first_page = None
+    pages = []
+    for page in extract():
+        if first_page is None:
+            first_page = time.perf_counter() - started
+        pages.append(page)
+    seconds = time.perf_counter() - started
+
+    tracemalloc.start()
+    for _ in extract():
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {name:<22} {num_pages / seconds:8.1f} pages/s  first page {first_page * 1000:8.1f} ms  "
+          f"peak traced {peak / 2**20:7.1f} MB")
+    return pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[200, 500])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--pages-per-task", type=int, default=8)
+    args = parser.parse_args()
+
+    sequential = DocumentExtractor(DocumentExtractionConfig(
+        max_workers=1, parallel_min_pages=1, pages_per_task=args.pages_per_task, max_pages=None,
+        docx_headers_footers=False
+    ))
+    parallel = DocumentExtractor(DocumentExtractionConfig(
+        max_workers=max(2, args.workers), parallel_min_pages=1, pages_per_task=args.pages_per_task, max_pages=None,
+        docx_headers_footers=False
+    ))
+
+    identical = True
+    try:
+        # Start the pool processes outside the measurements
+        list(parallel.iter_pdf_pages(io.BytesIO(make_pdf(2))))
+        for num_pages in args.pages:
+            pdf = make_pdf(num_pages)
+            print(f"\n{num_pages} pages, {len(pdf) / 2**20:.1f} MB")
+            legacy = measure("legacy concatenation", num_pages, lambda: iter([legacy_extract(pdf)]))[0]
+            in_thread = measure("generator, in thread", num_pages,
+                                lambda: sequential.iter_pdf_pages(io.BytesIO(pdf)))
+            pooled = measure(f"generator, {parallel.max_workers} procs", num_pages,
+                             lambda: parallel.iter_pdf_pages(io.BytesIO(pdf)))
+            for name, pages in (("in thread", in_thread), ("process pool", pooled)):
+                if "\n".join(pages).strip() != legacy:
+                    print(f"  ❌ {name} output differs from the legacy extraction")
+                    identical = False
+    finally:
+        # Wait so the pool processes are reaped and count towards RUSAGE_CHILDREN
+        parallel.shutdown(wait=True)
+
+    children_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    print(f"\nPeak RSS: main process {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB, "
+          f"largest pool process {children_rss:.0f} MB")
+    return identical
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
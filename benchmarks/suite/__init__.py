@@ -0,0 +1,12 @@
+"""
+Serving Benchmark Suite for TextCraftAI
+Runs offline against tiny randomly initialized seq2seq models built locally:
+microbenchmarks (text cleaning, PDF/DOCX extraction, tokenization),
+end-to-end pipeline benchmarks (summarize_text, paraphrase_text,
+process_file) and a load generator against the FastAPI app that reports
+throughput and p50/p95/p99 latency at several concurrency levels. Results
+are compared with a JSON baseline and the run fails when a result regresses
+by more than the threshold.
+
+Usage: python -m benchmarks.suite [--groups micro e2e load] [--threshold 0.2] [--update-baseline]
+"""
@@ -0,0 +1,111 @@
+import argparse
+import json
+import os
+import sys
+
+import benchmarks.suite as suite
+from benchmarks.suite import baseline
+from benchmarks.suite.tiny_models import prepare_workdir
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+GROUPS = ("micro", "e2e", "load")
+
+
+def run_groups(groups, workdir: str, concurrency, quick: bool) -> dict:
+    results = {}
+    if "micro" in groups or "e2e" in groups:
+        # The pipeline reads its config relative to the working directory
+        cwd = os.getcwd()
+        os.chdir(workdir)
+        try:
+            from textCraftAI.pipeline.enhanced_prediction import EnhancedPredictionPipeline
+            from benchmarks.suite import end_to_end, micro
+
+            predictor = EnhancedPredictionPipeline()
+            if "micro" in groups:
+                print("Running microbenchmarks...")
+                results.update(micro.run(predictor, quick))
+            if "e2e" in groups:
+                print("Running end-to-end benchmarks...")
+                results.update(end_to_end.run(predictor, quick))
+            predictor.document_extractor.shutdown()
+        finally:
+            os.chdir(cwd)
+    if "load" in groups:
+        from benchmarks.suite import load
+
+        print(f"Running load benchmarks at concurrency {', '.join(map(str, concurrency))}...")
+        results.update(load.run(workdir, REPO_ROOT, concurrency, quick))
+    return results
+
+
+def report(results: dict, reference: dict):
+    print(f"\n{'benchmark':<52}{'value':>12}  {'unit':<13}{'baseline':>12}{'change':>9}")
+    for name, current in sorted(results.items()):
+        previous = (reference or {}).get("results", {}).get(name)
+        line = f"{name:<52}{current['value']:>12.2f}  {current['unit']:<13}"
+        if previous is not None and previous["value"]:
+            change = (current["value"] - previous["value"]) / previous["value"]
+            line += f"{previous['value']:>12.2f}{change:>+8.0%}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=suite.__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--groups", nargs="+", choices=GROUPS, default=list(GROUPS), help="benchmark groups to run")
+    parser.add_argument("--workdir", default=os.path.join(REPO_ROOT, "artifacts", "benchmarks"),
+                        help="where the tiny models, the benchmark config and the results are written")
+    parser.add_argument("--baseline", default=os.path.join(REPO_ROOT, "benchmarks", "baselines", "baseline.json"),
+                        help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="fail when a result is worse than its baseline by more than this fraction")
+    parser.add_argument("--update-baseline", action="store_true", help="write these results to the baseline")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16], help="load test concurrency levels")
+    parser.add_argument("--quick", action="store_true", help="fewer repetitions and shorter load runs")
+    parser.add_argument("--rebuild-models", action="store_true", help="rebuild the tiny models")
+    args = parser.parse_args()
+
+    os.environ.setdefault("HF_HUB_OFFLINE", "1")
+    os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+    workdir = os.path.abspath(args.workdir)
+    print(f"Preparing tiny models in {workdir}...")
+    prepare_workdir(workdir, REPO_ROOT, args.rebuild_models)
+
+    results = run_groups(args.groups, workdir, args.concurrency, args.quick)
+    output = os.path.join(workdir, "results.json")
+    baseline.save(output, results)
+
+    reference = baseline.load(args.baseline)
+    report(results, reference)
+    print(f"\nResults written to {output}")
+
+    if args.update_baseline:
+        # Keep results of groups not run this time, and any per-result thresholds
+        merged = dict((reference or {}).get("results", {}))
+        for name, current in results.items():
+            previous = merged.get(name, {})
+            merged[name] = {**current, **({"threshold": previous["threshold"]} if "threshold" in previous else {})}
+        baseline.save(args.baseline, merged)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    if reference is None:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one")
+        return 0
+    if reference.get("environment") != baseline.environment():
+        print(f"⚠️  Baseline was recorded on a different setup: {json.dumps(reference.get('environment'))}")
+
+    regressions = baseline.compare(results, reference, args.threshold)
+    if regressions:
+        print(f"❌ {len(regressions)} regressions:")
+        for regression in regressions:
+            print(f"  {regression['name']}: {regression['baseline']:.2f} -> {regression['current']:.2f} "
+                  f"{regression['unit']} ({regression['change']:+.0%}, threshold {regression['threshold']:.0%})")
+        return 1
+    print(f"✅ No result regressed by more than {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+import json
+import os
+import platform
+from importlib import metadata
+from typing import Dict, List, Optional
+
+
+def environment() -> dict:
+    """Where the results were measured; baselines only compare fairly on the same setup"""
+    env = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+    for package in ("torch", "transformers", "tokenizers"):
+        try:
+            env[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            env[package] = None
+    return env
+
+
+def load(path: str) -> Optional[dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save(path: str, results: Dict[str, dict]):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"environment": environment(), "results": results}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(results: Dict[str, dict], baseline: dict, threshold: float) -> List[dict]:
+    """Gated results worse than their baseline by more than ``threshold`` (a fraction, e.g. 0.2)
+
+    Per-result thresholds stored in the baseline file (``"threshold": 0.5``)
+    override the default, for results known to be noisy.
+    """
+    regressions = []
+    for name, current in sorted(results.items()):
+        reference = baseline.get("results", {}).get(name)
+        if reference is None or not current.get("gate", True) or not reference["value"]:
+            continue
+        limit = reference.get("threshold", threshold)
+        change = (current["value"] - reference["value"]) / reference["value"]
+        worse = change > limit if current["better"] == "lower" else change < -limit
+        if worse:
+            regressions.append({
+                "name": name,
+                "baseline": reference["value"],
+                "current": current["value"],
+                "unit": current["unit"],
+                "change": change,
+                "threshold": limit,
+            })
+    return regressions
@@ -0,0 +1,32 @@
+from typing import Any, Dict
+
+from benchmarks.suite.inputs import make_docx_bytes, make_pdf_bytes, make_text
+from benchmarks.suite.timing import latencies, latency_results
+
+
+def run(predictor: Any, quick: bool = False) -> Dict[str, dict]:
+    """Latency of the pipeline's public entry points, models included"""
+    calls = 5 if quick else 20
+    results = {}
+
+    for label, words in (("short", 60), ("long", 400)):
+        text = make_text(words, seed=words)
+        results.update(latency_results(
+            f"e2e.summarize_text.{label}", latencies(lambda: predictor.summarize_text(text), calls)
+        ))
+        results.update(latency_results(
+            f"e2e.paraphrase_text.{label}", latencies(lambda: predictor.paraphrase_text(text, seed=0), calls)
+        ))
+
+    files = {
+        "report.txt": make_text(600, seed=1).encode("utf-8"),
+        "report.pdf": make_pdf_bytes(3),
+        "report.docx": make_docx_bytes(60),
+    }
+    for filename, content in files.items():
+        extension = filename.rsplit(".", 1)[1]
+        results.update(latency_results(
+            f"e2e.process_file.{extension}",
+            latencies(lambda: predictor.process_file(content, filename, "summarize"), max(2, calls // 4))
+        ))
+    return results
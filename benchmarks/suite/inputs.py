@@ -0,0 +1,29 @@
+import io
+import random
+
+from benchmarks.docx_extraction_benchmark import make_docx
+from benchmarks.pdf_extraction_benchmark import make_pdf
+from benchmarks.suite.tiny_models import WORDS
+
+
+def make_text(num_words: int, seed: int = 0) -> str:
+    """Dialogue-like text built from the tiny tokenizer's vocabulary"""
+    rng = random.Random(seed)
+    sentences = []
+    while sum(len(sentence) for sentence in sentences) < num_words:
+        sentences.append([rng.choice(WORDS) for _ in range(rng.randint(6, 14))])
+    words = [word for sentence in sentences for word in sentence][:num_words]
+    return " ".join(
+        ("#Person1#: " if i % 40 == 0 else "") + word + ("." if i % 12 == 11 else "")
+        for i, word in enumerate(words)
+    )
+
+
+def make_pdf_bytes(num_pages: int, seed: int = 0) -> bytes:
+    return make_pdf(num_pages, seed=seed)
+
+
+def make_docx_bytes(num_paragraphs: int, seed: int = 0) -> bytes:
+    buffer = io.BytesIO()
+    make_docx(buffer, num_paragraphs, seed=seed)
+    return buffer.getvalue()
@@ -0,0 +1,136 @@
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List, Sequence, Tuple
+
+from benchmarks.suite.inputs import make_text
+from benchmarks.suite.timing import latency_results, result
+
+
+ENDPOINTS = {
+    "predict": "/predict",
+    "paraphrase": "/paraphrase",
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class AppServer:
+    """The FastAPI app served by uvicorn in a subprocess, run from the benchmark working directory"""
+
+    def __init__(self, workdir: str, repo_root: str, startup_timeout: float = 300.0):
+        self.workdir = workdir
+        self.repo_root = repo_root
+        self.startup_timeout = startup_timeout
+        self.port = _free_port()
+        self._process = None
+
+    def __enter__(self) -> "AppServer":
+        env = dict(os.environ, HF_HUB_OFFLINE="1", TRANSFORMERS_OFFLINE="1")
+        env["PYTHONPATH"] = os.pathsep.join(
+            [self.repo_root, os.path.join(self.repo_root, "src")] + [p for p in [env.get("PYTHONPATH")] if p]
+        )
+        self._process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app:app", "--host", "127.0.0.1", "--port", str(self.port),
+             "--log-level", "warning"],
+            cwd=self.workdir, env=env
+        )
+        self._wait_ready()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._process.terminate()
+        try:
+            self._process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+
+    def _wait_ready(self):
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"Server exited with code {self._process.returncode} during startup")
+            try:
+                connection = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+                connection.request("GET", "/readyz")
+                if connection.getresponse().status == 200:
+                    return
+            except OSError:
+                pass
+            time.sleep(0.5)
+        raise TimeoutError(f"Server was not ready within {self.startup_timeout:.0f}s")
+
+
+def _client(port: int, path: str, bodies: Sequence[bytes], offset: int, stop_at: float,
+            samples: List[float], errors: List[int]):
+    """Closed loop: send the next request as soon as the previous one completes"""
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=120)
+    headers = {"Content-Type": "application/json"}
+    i = offset
+    while time.perf_counter() < stop_at:
+        body = bodies[i % len(bodies)]
+        i += 1
+        started = time.perf_counter()
+        try:
+            connection.request("POST", path, body=body, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            ok = response.status == 200
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=120)
+            ok = False
+        if ok:
+            samples.append(time.perf_counter() - started)
+        else:
+            errors.append(1)
+    connection.close()
+
+
+def measure(port: int, path: str, bodies: Sequence[bytes], concurrency: int,
+            duration: float) -> Tuple[List[float], int, float]:
+    """Run ``concurrency`` closed-loop clients for ``duration`` seconds; returns latencies, errors and wall time"""
+    samples: List[float] = []
+    errors: List[int] = []
+    started = time.perf_counter()
+    stop_at = started + duration
+    threads = [
+        threading.Thread(target=_client, args=(port, path, bodies, i * 7, stop_at, samples, errors))
+        for i in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples, len(errors), time.perf_counter() - started
+
+
+def run(workdir: str, repo_root: str, concurrency_levels: Sequence[int] = (1, 4, 16),
+        quick: bool = False) -> Dict[str, dict]:
+    """Throughput and latency percentiles of the HTTP API at each concurrency level"""
+    duration = 5.0 if quick else 20.0
+    bodies = [json.dumps({"text": make_text(60, seed=seed)}).encode("utf-8") for seed in range(64)]
+    results = {}
+    with AppServer(workdir, repo_root) as server:
+        for name, path in ENDPOINTS.items():
+            # Untimed, so lazy initialization on the request path is not measured
+            measure(server.port, path, bodies, 1, 1.0)
+            for concurrency in concurrency_levels:
+                samples, errors, wall = measure(server.port, path, bodies, concurrency, duration)
+                prefix = f"load.{name}.c{concurrency}"
+                print(f"  {prefix}: {len(samples)} requests, {errors} errors in {wall:.1f}s")
+                results[f"{prefix}.requests_per_s"] = result(len(samples) / wall, "req/s", "higher")
+                if samples:
+                    results.update(latency_results(prefix, samples))
+                results[f"{prefix}.errors"] = result(errors, "requests", "lower", gate=False)
+    return results
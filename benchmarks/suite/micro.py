@@ -0,0 +1,39 @@
+import io
+import random
+from typing import Any, Dict
+
+from benchmarks.suite.inputs import make_docx_bytes, make_pdf_bytes, make_text
+from benchmarks.suite.timing import result, time_per_call
+from benchmarks.text_cleaner_benchmark import make_output
+
+
+def run(predictor: Any, quick: bool = False) -> Dict[str, dict]:
+    """Time text cleaning, document extraction and tokenization in isolation"""
+    repeat = 3 if quick else 7
+    results = {}
+
+    rng = random.Random(0)
+    for label, words in (("short", 60), ("long", 4000)):
+        output = make_output(words, rng)
+        seconds = time_per_call(lambda: predictor._clean_text(output), max(1, 20000 // words), repeat)
+        results[f"micro.clean_text.{label}.us"] = result(seconds * 1e6, "us", "lower")
+
+    extractor = predictor.document_extractor
+    num_pages = 20 if quick else 100
+    pdf = make_pdf_bytes(num_pages)
+    seconds = time_per_call(lambda: list(extractor.iter_pdf_pages(io.BytesIO(pdf))), 1, repeat)
+    results["micro.pdf_extraction.pages_per_s"] = result(num_pages / seconds, "pages/s", "higher")
+
+    num_paragraphs = 1000 if quick else 5000
+    docx = make_docx_bytes(num_paragraphs)
+    seconds = time_per_call(lambda: list(extractor.iter_docx_blocks(io.BytesIO(docx))), 1, repeat)
+    results["micro.docx_extraction.paragraphs_per_s"] = result(num_paragraphs / seconds, "paragraphs/s", "higher")
+
+    for task in ("summarization", "paraphrase"):
+        # The first call loads the model's tokenizer
+        predictor.token_budget.encode(task, "Warm-up.")
+        for label, words in (("short", 50), ("long", 400)):
+            text = make_text(words, seed=words)
+            seconds = time_per_call(lambda: predictor.token_budget.encode(task, text), 200, repeat)
+            results[f"micro.tokenization.{task}.{label}.us"] = result(seconds * 1e6, "us", "lower")
+    return results
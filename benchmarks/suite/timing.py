@@ -0,0 +1,49 @@
+import math
+import time
+from typing import Callable, Dict, List, Optional
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile of ``values`` (``q`` in 0..100)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def time_per_call(fn: Callable[[], object], number: int, repeat: int) -> float:
+    """Median over ``repeat`` rounds of the mean time of ``number`` calls, in seconds"""
+    rounds = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        rounds.append((time.perf_counter() - started) / number)
+    return percentile(rounds, 50)
+
+
+def latencies(fn: Callable[[], object], calls: int, warmup: int = 1) -> List[float]:
+    """Seconds taken by each of ``calls`` calls, after ``warmup`` untimed ones"""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def result(value: float, unit: str, better: str, gate: bool = True) -> Dict[str, object]:
+    """One benchmark result; ``better`` is "lower" or "higher", ``gate`` includes it in regression checks"""
+    return {"value": round(value, 6), "unit": unit, "better": better, "gate": gate}
+
+
+def latency_results(prefix: str, samples: List[float]) -> Dict[str, dict]:
+    """p50/p95/p99 latency results in milliseconds; p99 is reported but not gated, it is too noisy"""
+    return {
+        f"{prefix}.p50_ms": result(percentile(samples, 50) * 1000, "ms", "lower"),
+        f"{prefix}.p95_ms": result(percentile(samples, 95) * 1000, "ms", "lower"),
+        f"{prefix}.p99_ms": result(percentile(samples, 99) * 1000, "ms", "lower", gate=False),
+    }
@@ -0,0 +1,101 @@
+import json
+import os
+import shutil
+
+import yaml
+
+
+# Vocabulary of the tiny word-level tokenizer: the words the synthetic inputs are built from
+WORDS = (
+    "summary dialogue meeting report budget customer schedule project review team quarter "
+    "results delivery contract update question answer planning travel invoice support "
+    "the a and to of in is was he she they we you i it that this for on with at by from "
+    "asks about refund agent explains policy person1 person2 says hi waves back will can "
+    "need want call tomorrow today office price order please thanks yes no ok"
+).split()
+SPECIAL_TOKENS = ("<pad>", "</s>", "<unk>")
+
+# Small enough to build in seconds and run on any CPU, large enough that generate does real work
+MODEL_SIZE = {"d_model": 64, "d_ff": 128, "num_layers": 2, "num_decoder_layers": 2, "num_heads": 2, "d_kv": 32}
+
+TASKS = ("summarization", "paraphrase")
+_MARKER = "tiny_model.json"
+
+
+def build_tiny_model(output_dir: str, seed: int = 0):
+    """Save a randomly initialized T5 model and a word-level fast tokenizer to ``output_dir``
+
+    Everything is built locally, so benchmarks never download anything.
+    """
+    import torch
+    from tokenizers import Tokenizer, models, pre_tokenizers, processors
+    from transformers import PreTrainedTokenizerFast, T5Config, T5ForConditionalGeneration
+
+    vocab = {token: index for index, token in enumerate(SPECIAL_TOKENS + WORDS)}
+    tokenizer = Tokenizer(models.WordLevel(vocab, unk_token="<unk>"))
+    tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+    tokenizer.post_processor = processors.TemplateProcessing(
+        single="$A </s>", pair="$A </s> $B </s>", special_tokens=[("</s>", vocab["</s>"])]
+    )
+    fast_tokenizer = PreTrainedTokenizerFast(
+        tokenizer_object=tokenizer, pad_token="<pad>", eos_token="</s>", unk_token="<unk>", model_max_length=512
+    )
+
+    torch.manual_seed(seed)
+    config = T5Config(
+        vocab_size=len(vocab),
+        pad_token_id=vocab["<pad>"],
+        eos_token_id=vocab["</s>"],
+        decoder_start_token_id=vocab["<pad>"],
+        **MODEL_SIZE
+    )
+    model = T5ForConditionalGeneration(config).eval()
+
+    os.makedirs(output_dir, exist_ok=True)
+    model.save_pretrained(output_dir, safe_serialization=True)
+    fast_tokenizer.save_pretrained(output_dir)
+    with open(os.path.join(output_dir, _MARKER), "w") as f:
+        json.dump({"seed": seed, "vocab_size": len(vocab), **MODEL_SIZE}, f, indent=2)
+
+
+def prepare_workdir(workdir: str, repo_root: str, rebuild_models: bool = False) -> dict:
+    """Create a working directory whose config serves the tiny models
+
+    The pipeline reads ``config/config.yaml`` and ``params.yaml`` relative to
+    the working directory, so benchmarks run from ``workdir`` load the tiny
+    models without any change to the repo's own config. Results are not
+    cached, so repeated inputs measure real work. Returns the model paths.
+    """
+    workdir = os.path.abspath(workdir)
+    model_paths = {}
+    for index, task in enumerate(TASKS):
+        path = os.path.join(workdir, "models", task)
+        if rebuild_models and os.path.isdir(path):
+            shutil.rmtree(path)
+        if not os.path.exists(os.path.join(path, _MARKER)):
+            build_tiny_model(path, seed=index)
+        model_paths[task] = path
+
+    with open(os.path.join(repo_root, "config", "config.yaml")) as f:
+        config = yaml.safe_load(f)
+    config["model_evaluation"]["model_path"] = model_paths["summarization"]
+    config["model_evaluation"]["tokenizer_path"] = model_paths["summarization"]
+    config["model_registry"].update({
+        "summarization_fallback_model": model_paths["summarization"],
+        "paraphrase_model": model_paths["paraphrase"],
+        "warmup_models": list(TASKS),
+        "memory_budget_mb": 0,
+    })
+    config["result_cache"]["enabled"] = False
+    config["model_quantization"]["mode"] = "none"
+    config["inference_backend"]["backend"] = "torch"
+    config["job_queue"]["num_workers"] = 0
+
+    os.makedirs(os.path.join(workdir, "config"), exist_ok=True)
+    with open(os.path.join(workdir, "config", "config.yaml"), "w") as f:
+        yaml.safe_dump(config, f, sort_keys=False)
+    shutil.copy(os.path.join(repo_root, "params.yaml"), os.path.join(workdir, "params.yaml"))
+    templates = os.path.join(workdir, "templates")
+    if not os.path.exists(templates):
+        os.symlink(os.path.join(repo_root, "templates"), templates)
+    return model_paths
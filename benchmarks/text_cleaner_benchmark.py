@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Text Cleaner Microbenchmark for TextCraftAI
+Checks that the compiled cleaner in textCraftAI.utils.text_cleaner produces
+exactly the same output as the original per-call regex implementation, then
+times both on short and long generated outputs.
+
+Usage: python benchmarks/text_cleaner_benchmark.py [--repeat N]
+"""
+
+import argparse
+import random
+import re
+import sys
+import timeit
+
+from textCraftAI.utils.text_cleaner import SPECIAL_TOKENS, clean_text, clean_texts
+
+
+def legacy_clean_text(text: str) -> str:
+    """The original _clean_text, kept verbatim as the reference implementation"""
+    special_tokens = [
+        '<n>', '</s>', '<pad>', '<unk>', '<s>', '<mask>',
+        '<|endoftext|>', '<|startoftext|>', '<bos>', '<eos>',
+        '[UNK]', '[PAD]', '[CLS]', '[SEP]', '[MASK]',
+        '<extra_id_0>', '<extra_id_1>', '<extra_id_2>',
+        '<<UNK>>', '##', '<|im_start|>', '<|im_end|>'
+    ]
+
+    cleaned_text = text
+    for token in special_tokens:
+        cleaned_text = re.sub(re.escape(token), '', cleaned_text, flags=re.IGNORECASE)
+    cleaned_text = re.sub(r'<[^>]+>', '', cleaned_text)
+    cleaned_text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', cleaned_text)
+    cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
+    cleaned_text = re.sub(r'\n+', ' ', cleaned_text)
+    cleaned_text = cleaned_text.strip()
+    cleaned_text = re.sub(r'^[^\w\'"]*', '', cleaned_text)
+    cleaned_text = re.sub(r'[^\w\'".,!?;:]*$', '', cleaned_text)
+    cleaned_text = re.sub(r'\s+([.,!?;:])', r'\1', cleaned_text)
+    cleaned_text = re.sub(r'([.,!?;:])([A-Za-z])', r'\1 \2', cleaned_text)
+    if cleaned_text and not cleaned_text[0].isupper():
+        cleaned_text = cleaned_text[0].upper() + cleaned_text[1:]
+    cleaned_text = re.sub(r'[.]{2,}', '.', cleaned_text)
+    cleaned_text = re.sub(r'[!]{2,}', '!', cleaned_text)
+    cleaned_text = re.sub(r'[?]{2,}', '?', cleaned_text)
+    return cleaned_text
+
+
+# (input, expected output) pairs recorded from the original implementation
+GOLDEN_CASES = [
+    ('the man is going to the store.<n>He buys milk .',
+     'The man is going to the store. He buys milk.'),
+    ('<pad> summary of the dialogue </s>',
+     'Summary of the dialogue'),
+    ('  ,,hello world!!!  how are you??',
+     'Hello world! how are you?'),
+    ('Person1 says hi <n><n> Person2 waves back..',
+     'Person1 says hi Person2 waves back.'),
+    ('[CLS] tokens [SEP] everywhere [PAD][PAD]',
+     'Tokens everywhere'),
+    ('<<UNK>> weird <unk> token',
+     'Weird token'),
+    ('a <<UNK>> b',
+     'A <> b'),
+    ('#[PAD]# left over hashes',
+     'Left over hashes'),
+    ('<extra_id_0> the cat sat <extra_id_1> on the mat <extra_id_2>',
+     'The cat sat on the mat'),
+    ('text with <b>html</b> tags and\ttabs\r\nnewlines',
+     'Text with html tags andtabsnewlines'),
+    ('already clean sentence.',
+     'Already clean sentence.'),
+    ('missing space after comma,like this.and period',
+     'Missing space after comma, like this. and period'),
+    ('<|im_start|>assistant reply<|im_end|>',
+     'Assistant reply'),
+    ('"quoted start" stays',
+     '"quoted start" stays'),
+    ("'single quoted' too ...",
+     "'single quoted' too."),
+    ('',
+     ''),
+    ('   ',
+     ''),
+    ('<n>',
+     ''),
+    ('ends with junk ---',
+     'Ends with junk'),
+    ('émile was here.ok',
+     'Émile was here. ok'),
+]
+
+# Fragments that exercise token removal order, tags, control characters and punctuation
+_FUZZ_ATOMS = (
+    list(SPECIAL_TOKENS) + [token.upper() for token in SPECIAL_TOKENS]
+    + list("<>[]#|_ \n\t\r.,!?;:'\"-()aAbZ9\x00\x85\xa0ſKéßİıﬀ")
+    + ["word", "The", " .", "..", "!!", "??", "<b>", "</p>", "<<", ">>", "<n", "n>", "UNK", "[", "]"]
+)
+
+
+def check_equivalence(fuzz_cases: int, seed: int = 0) -> int:
+    """Return the number of mismatches against the golden cases and random inputs"""
+    mismatches = 0
+    for text, expected in GOLDEN_CASES:
+        if clean_text(text) != expected or legacy_clean_text(text) != expected:
+            print(f"  golden mismatch: {text!r} -> {clean_text(text)!r}, expected {expected!r}")
+            mismatches += 1
+
+    rng = random.Random(seed)
+    for _ in range(fuzz_cases):
+        text = "".join(rng.choice(_FUZZ_ATOMS) for _ in range(rng.randint(0, 25)))
+        if clean_text(text) != legacy_clean_text(text):
+            print(f"  fuzz mismatch: {text!r} -> {clean_text(text)!r}, expected {legacy_clean_text(text)!r}")
+            mismatches += 1
+    return mismatches
+
+
+def make_output(words: int, rng: random.Random) -> str:
+    """Synthetic model output with the artifacts PEGASUS/T5 typically leave behind"""
+    vocabulary = ["the", "customer", "asks", "about", "a", "refund", "and", "agent", "explains", "policy"]
+    parts = ["<pad>"]
+    for i in range(words):
+        parts.append(rng.choice(vocabulary))
+        if i % 12 == 11:
+            parts.append(rng.choice([" .<n>", " ,", "..", "!!"]))
+    parts.append("</s>")
+    return " ".join(parts)
+
+
+def benchmark(repeat: int):
+    rng = random.Random(0)
+    print(f"{'output':<12}{'legacy us':>12}{'compiled us':>14}{'speedup':>10}")
+    for label, words in [("short", 60), ("medium", 400), ("long", 4000)]:
+        text = make_output(words, rng)
+        number = max(1, 20000 // words)
+        legacy = min(timeit.repeat(lambda: legacy_clean_text(text), number=number, repeat=repeat)) / number
+        compiled = min(timeit.repeat(lambda: clean_text(text), number=number, repeat=repeat)) / number
+        print(f"{label:<12}{legacy * 1e6:>12.1f}{compiled * 1e6:>14.1f}{legacy / compiled:>9.1f}x")
+
+    batch = [make_output(400, rng) for _ in range(64)]
+    legacy = min(timeit.repeat(lambda: [legacy_clean_text(t) for t in batch], number=5, repeat=repeat)) / 5
+    compiled = min(timeit.repeat(lambda: clean_texts(batch), number=5, repeat=repeat)) / 5
+    print(f"{'batch x64':<12}{legacy * 1e6:>12.1f}{compiled * 1e6:>14.1f}{legacy / compiled:>9.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions, best is reported")
+    parser.add_argument("--fuzz-cases", type=int, default=20000, help="random inputs compared against the original")
+    args = parser.parse_args()
+
+    print("Checking output equivalence...")
+    mismatches = check_equivalence(args.fuzz_cases)
+    if mismatches:
+        print(f"❌ {mismatches} mismatches against the original cleaner")
+        return 1
+    print(f"✅ {len(GOLDEN_CASES)} golden cases and {args.fuzz_cases} random inputs match\n")
+
+    benchmark(args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,8 +7,6 @@ Downloads required models during Docker build to cache them.
 from transformers import (
     AutoTokenizer, 
     AutoModelForSeq2SeqLM, 
-    T5Tokenizer, 
-    T5ForConditionalGeneration,
     pipeline
 )
 import os
@@ -32,8 +30,8 @@ def download_models():
         {
             "name": "T5-Base (Paraphrasing)",
             "model_id": "t5-base", 
-            "tokenizer_class": T5Tokenizer,
-            "model_class": T5ForConditionalGeneration
+            "tokenizer_class": AutoTokenizer,
+            "model_class": AutoModelForSeq2SeqLM
         }
     ]
     
@@ -47,8 +45,10 @@ def download_models():
         try:
             # Download tokenizer
             print("  - Downloading tokenizer...")
+            # The fast (Rust) tokenizer is what the API tokenizes with
             tokenizer = model_config['tokenizer_class'].from_pretrained(
                 model_config['model_id'],
+                use_fast=True,
                 cache_dir="/root/.cache/huggingface/transformers"
             )
             
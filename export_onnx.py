@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+ONNX Export Script for TextCraftAI
+Exports the summarization and paraphrase models to ONNX encoder, decoder and
+decoder-with-past graphs for the onnxruntime inference backend, then checks
+that the ONNX Runtime outputs match PyTorch.
+
+Usage: python export_onnx.py [--tasks summarization paraphrase] [--skip-parity]
+"""
+
+import argparse
+import os
+import sys
+
+from textCraftAI.config.configuration import ConfigurationManager
+from textCraftAI.components.inference_backend import (OnnxRuntimeBackend, TorchBackend,
+                                                      check_parity, export_onnx)
+
+
+CACHE_DIR = os.environ.get('TRANSFORMERS_CACHE', '/root/.cache/huggingface/transformers')
+
+# Deterministic decoding for the parity check; sampled outputs cannot be compared
+PARITY_GEN_KWARGS = {
+    "summarization": [
+        {"num_beams": 1, "max_length": 64, "do_sample": False},
+        {"length_penalty": 0.8, "num_beams": 8, "max_length": 128, "no_repeat_ngram_size": 3,
+         "do_sample": False, "early_stopping": True},
+    ],
+    "paraphrase": [
+        {"num_beams": 1, "max_length": 64, "do_sample": False},
+        {"num_beams": 4, "max_length": 64, "do_sample": False, "early_stopping": True},
+    ],
+}
+
+PARITY_INPUTS = [
+    "#Person1#: Hi, I'd like to book a table for two tonight. #Person2#: Sure, what time would you like? "
+    "#Person1#: Around seven, please. #Person2#: Seven o'clock is available. May I have your name?",
+    "#Person1#: Did you finish the report? #Person2#: Not yet, the sales numbers only came in this morning. "
+    "#Person1#: The manager wants it by Friday. #Person2#: I'll have a draft ready by Thursday afternoon.",
+    "The city council approved the new budget on Monday after a long debate about funding for public "
+    "transport, parks and road repairs.",
+]
+
+
+def get_sources(config_manager, task):
+    """Return the (model, tokenizer) the API would load for ``task``"""
+    if task == "paraphrase":
+        model = config_manager.get_model_registry_config().paraphrase_model
+        return model, model
+
+    evaluation_config = config_manager.get_model_evaluation_config()
+    if os.path.exists(evaluation_config.model_path) and os.path.exists(evaluation_config.tokenizer_path):
+        return evaluation_config.model_path, evaluation_config.tokenizer_path
+    fallback = config_manager.get_model_registry_config().summarization_fallback_model
+    print(f"  Trained model not found, exporting base model {fallback}")
+    return fallback, fallback
+
+
+def run_parity(task, model, tokenizer, output_dir):
+    reference = TorchBackend.from_pretrained(task, model, tokenizer, cache_dir=CACHE_DIR)
+    candidate = OnnxRuntimeBackend.from_export(task, output_dir)
+    model_inputs = [f"paraphrase: {text}" if task == "paraphrase" else text for text in PARITY_INPUTS]
+
+    samples = matches = 0
+    for gen_kwargs in PARITY_GEN_KWARGS[task]:
+        result = check_parity(reference, candidate, model_inputs, gen_kwargs)
+        samples += result["samples"]
+        matches += result["exact_matches"]
+        for mismatch in result["mismatches"]:
+            print(f"  ⚠️  Mismatch with {gen_kwargs}:")
+            print(f"     torch:       {mismatch['torch']!r}")
+            print(f"     onnxruntime: {mismatch['onnxruntime']!r}")
+    return matches / samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", nargs="+", default=["summarization", "paraphrase"],
+                        choices=["summarization", "paraphrase"])
+    parser.add_argument("--skip-parity", action="store_true", help="do not compare outputs with PyTorch")
+    parser.add_argument("--min-match-rate", type=float, default=1.0,
+                        help="fail when fewer parity outputs match exactly")
+    args = parser.parse_args()
+
+    config_manager = ConfigurationManager()
+    onnx_model_dir = config_manager.get_inference_backend_config().onnx_model_dir
+
+    print("=" * 60)
+    print("TextCraftAI ONNX Export Script")
+    print("=" * 60)
+
+    success = True
+    for task in args.tasks:
+        model, tokenizer = get_sources(config_manager, task)
+        output_dir = os.path.join(onnx_model_dir, task)
+        print(f"\nExporting {task} model {model} -> {output_dir}")
+        export_onnx(model, output_dir, tokenizer_name_or_path=tokenizer, cache_dir=CACHE_DIR)
+        print(f"  ✅ Exported {sorted(name for name in os.listdir(output_dir) if name.endswith('.onnx'))}")
+
+        if args.skip_parity:
+            continue
+        match_rate = run_parity(task, model, tokenizer, output_dir)
+        print(f"  Parity with PyTorch: {match_rate:.0%} of outputs identical")
+        if match_rate < args.min_match_rate:
+            print(f"  ❌ Below the required {args.min_match_rate:.0%}")
+            success = False
+
+    print("\n" + "=" * 60)
+    print("Set inference_backend.backend: onnxruntime in config/config.yaml to serve the exported models.")
+    return success
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Job Worker Script for TextCraftAI
+Runs worker processes for the /jobs queue without the API, e.g. when the API
+is started with job_queue.num_workers: 0 and workers are scaled separately.
+Workers share the job database under job_queue.root_dir with the API.
+
+Usage: python job_worker.py [--workers N]
+"""
+
+import argparse
+
+from textCraftAI.config.configuration import ConfigurationManager
+from textCraftAI.pipeline.job_worker import JobWorkerPool
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of worker processes (default: job_queue.num_workers, at least 1)")
+    args = parser.parse_args()
+
+    config = ConfigurationManager().get_job_queue_config()
+    pool = JobWorkerPool(config, num_workers=args.workers or max(1, config.num_workers))
+    pool.start()
+    try:
+        pool.join()
+    except KeyboardInterrupt:
+        pool.stop()
+
+
+if __name__ == "__main__":
+    main()
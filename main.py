@@ -4,6 +4,7 @@ from textCraftAI.pipeline.stage_02_data_validation import DataValidationTraining
 from textCraftAI.pipeline.stage_03_data_transformation import DataTransformationTrainingPipeline
 from textCraftAI.pipeline.stage_04_model_trainer import ModelTrainerTrainingPipeline
 from textCraftAI.pipeline.stage_05_model_evaluation import ModelEvaluationTrainingPipeline
+from textCraftAI.pipeline.stage_06_model_quantization import ModelQuantizationTrainingPipeline
 
 
 STAGE_NAME = "Data Ingestion stage"
@@ -57,6 +58,17 @@ try:
     model_evaluation = ModelEvaluationTrainingPipeline()
     model_evaluation.main()
     logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+except Exception as e:
+    logger.exception(e)
+    raise e
+
+STAGE_NAME = "Model Quantization stage"
+try: 
+    logger.info(f"*******************")
+    logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
+    model_quantization = ModelQuantizationTrainingPipeline()
+    model_quantization.main()
+    logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
 except Exception as e:
     logger.exception(e)
     raise e
\ No newline at end of file
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Memory Report for TextCraftAI
+Reports the unique (private) and shared memory of serving processes from
+/proc/<pid>/smaps_rollup, to check how much model memory serve.py workers
+share as the worker count grows. Pass the serve.py master's pid to report
+the master and all of its worker processes.
+
+Usage: python memory_report.py PID [PID ...] [--no-children] [--interval SECONDS] [--json]
+"""
+
+import argparse
+import json
+import time
+
+from textCraftAI.utils.process_memory import child_pids, process_memory
+
+
+def _command(pid):
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            return f.read().replace(b"\0", b" ").decode(errors="replace").strip()[:60]
+    except OSError:
+        return "?"
+
+
+def collect(pids, children=True):
+    rows = []
+    for pid in pids:
+        for member in [pid] + (child_pids(pid) if children else []):
+            try:
+                rows.append({**process_memory(member), "command": _command(member)})
+            except OSError:
+                # The process exited while we were reading it
+                continue
+    totals = {
+        "processes": len(rows),
+        "rss_mb": round(sum(row["rss_mb"] for row in rows), 1),
+        "pss_mb": round(sum(row["pss_mb"] for row in rows), 1),
+        "unique_mb": round(sum(row["unique_mb"] for row in rows), 1),
+    }
+    # Summed RSS counts shared pages once per process; summed PSS counts them once
+    totals["shared_savings_mb"] = round(totals["rss_mb"] - totals["pss_mb"], 1)
+    return {"processes": rows, "totals": totals}
+
+
+def print_report(report):
+    print(f"{'pid':>8} {'rss MB':>9} {'pss MB':>9} {'unique MB':>10} {'shared MB':>10}  command")
+    for row in report["processes"]:
+        print(f"{row['pid']:>8} {row['rss_mb']:>9.1f} {row['pss_mb']:>9.1f} {row['unique_mb']:>10.1f} "
+              f"{row['shared_mb']:>10.1f}  {row['command']}")
+    totals = report["totals"]
+    print(f"{'total':>8} {totals['rss_mb']:>9.1f} {totals['pss_mb']:>9.1f} {totals['unique_mb']:>10.1f}")
+    print(f"Footprint of {totals['processes']} processes: {totals['pss_mb']:.1f} MB (PSS), "
+          f"{totals['shared_savings_mb']:.1f} MB less than their summed RSS")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pids", type=int, nargs="+")
+    parser.add_argument("--no-children", action="store_true", help="only report the given processes")
+    parser.add_argument("--interval", type=float, default=0, help="repeat every INTERVAL seconds")
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    args = parser.parse_args()
+
+    while True:
+        report = collect(args.pids, children=not args.no_children)
+        if args.json:
+            print(json.dumps(report))
+        else:
+            print_report(report)
+        if not args.interval:
+            break
+        time.sleep(args.interval)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Multi-worker Server for TextCraftAI
+Loads the models once, then forks HTTP worker processes that share the
+weights copy-on-write, instead of every worker loading its own copy as with
+uvicorn --workers. Job workers (job_queue.num_workers) run under the master.
+Run memory_report.py against the master's pid to see each worker's unique
+and shared memory.
+
+Usage: python serve.py [--workers N] [--port PORT]
+"""
+
+import argparse
+import dataclasses
+import os
+import random
+
+import torch
+
+from textCraftAI.config.configuration import ConfigurationManager
+from textCraftAI.pipeline.prefork_server import PreforkServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=None, help="HTTP worker processes (default: serving.workers)")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 8080)))
+    args = parser.parse_args()
+
+    config = ConfigurationManager().get_serving_config()
+    if args.workers:
+        config = dataclasses.replace(config, workers=args.workers)
+    threads = config.threads_per_worker or max(1, (os.cpu_count() or 1) // config.workers)
+
+    # Builds the pipeline and the rest of the app's state; models are loaded by preload()
+    import app as api
+
+    def preload():
+        # Keep torch single-threaded in the master: thread pools do not survive fork
+        torch.set_num_threads(1)
+        with api.startup_tracer.phase("preload"):
+            api.predictor.registry.warmup()
+
+    def post_fork(index):
+        # The master owns the job workers; this worker's startup and shutdown must not touch them
+        api.job_workers.detach()
+        torch.set_num_threads(threads)
+        # Every fork starts from the master's RNG state; unseeded sampling must differ between workers
+        random.seed()
+        torch.seed()
+
+    def when_ready():
+        # Started after the HTTP workers are forked, so none of them inherits the pool's monitor thread
+        api.job_workers.start()
+
+    server = PreforkServer(config, api.app, host=args.host, port=args.port, preload=preload, post_fork=post_fork,
+                           when_ready=when_ready)
+    try:
+        server.run()
+    finally:
+        api.job_workers.stop()
+
+
+if __name__ == "__main__":
+    main()
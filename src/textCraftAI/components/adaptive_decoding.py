@@ -0,0 +1,145 @@
+import math
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from textCraftAI.entity.config_entity import AdaptiveDecodingConfig
+
+
+# Every decoder step attends over the input, so a step over this many input
+# tokens is counted as twice the work of a step over a very short input
+_CONTEXT_TOKENS_PER_UNIT = 512
+
+# Deadlines are rounded down to this step so requests with similar budgets share batches
+_DEADLINE_STEP_SECONDS = 0.05
+
+
+class AdaptiveDecoder:
+    """Chooses decoding settings from a quality tier and/or a latency budget.
+
+    Profiles per task are ordered from highest quality to fastest. For a
+    budget, the first profile whose estimated latency fits is chosen; if none
+    fits, the fastest one has its ``max_length`` cut to what the budget allows.
+    Estimates come from a moving average of the measured cost of one decoder
+    step per beam on this host, updated after every generate. Budgeted
+    requests also get ``max_time``, a hard deadline after which ``generate``
+    returns the best hypothesis found so far.
+    """
+
+    def __init__(self, config: AdaptiveDecodingConfig):
+        self.config = config
+        self._lock = threading.Lock()
+        self._ms_per_unit: Dict[str, float] = {}
+        self._samples: Dict[str, int] = {}
+
+    def qualities(self, task: str) -> List[str]:
+        return list(self.config.profiles[task])
+
+    def plan(self, task: str, gen_kwargs: dict, input_tokens: int, quality: Optional[str] = None,
+             latency_budget_ms: Optional[float] = None) -> Tuple[dict, dict]:
+        """Return the generation kwargs to use and a description of the chosen profile
+
+        Args:
+            task: "summarization" or "paraphrase"
+            gen_kwargs: Kwargs prepared for the input, adjusted rather than replaced
+            input_tokens: Encoder tokens of the input
+            quality: Profile name; with a budget, the highest quality to consider
+            latency_budget_ms: Wall-clock budget for generation
+        """
+        names = self.qualities(task)
+        if quality is not None and quality not in names:
+            raise ValueError(f"Unknown quality '{quality}'. Choose one of: {', '.join(names)}")
+        if latency_budget_ms is not None and latency_budget_ms <= 0:
+            raise ValueError("latency_budget_ms must be positive")
+        candidates = names[names.index(quality):] if quality is not None else names
+
+        if latency_budget_ms is None:
+            name = candidates[0]
+            kwargs = self._apply(task, gen_kwargs, self.config.profiles[task][name], input_tokens)
+            return kwargs, self._describe(name, kwargs, self._estimate(task, kwargs, input_tokens))
+
+        deadline_ms = latency_budget_ms * self.config.deadline_fraction
+        for name in candidates:
+            kwargs = self._apply(task, gen_kwargs, self.config.profiles[task][name], input_tokens)
+            estimate = self._estimate(task, kwargs, input_tokens)
+            if estimate <= deadline_ms:
+                break
+        else:
+            # Nothing fits: keep the fastest profile and decode only as many steps as the budget allows
+            step_ms = self.estimate_ms(task, kwargs["num_beams"], 1, input_tokens)
+            affordable = int(deadline_ms / step_ms) if step_ms > 0 else kwargs["max_length"]
+            kwargs["max_length"] = max(self.config.min_max_length, min(kwargs["max_length"], affordable))
+            if "min_length" in kwargs:
+                kwargs["min_length"] = min(kwargs["min_length"], kwargs["max_length"])
+            estimate = self._estimate(task, kwargs, input_tokens)
+
+        steps = math.floor(deadline_ms / 1000 / _DEADLINE_STEP_SECONDS)
+        kwargs["max_time"] = round(max(1, steps) * _DEADLINE_STEP_SECONDS, 2)
+        return kwargs, self._describe(name, kwargs, estimate)
+
+    def describe_default(self, gen_kwargs: dict) -> dict:
+        """Description of the task's fixed decoding, used when a request asks for no profile"""
+        return self._describe("default", gen_kwargs, None)
+
+    def estimate_ms(self, task: str, num_beams: int, max_length: int, input_tokens: int) -> float:
+        with self._lock:
+            ms_per_unit = self._ms_per_unit.get(task, self.config.initial_ms_per_step)
+        return ms_per_unit * num_beams * max_length * (1 + input_tokens / _CONTEXT_TOKENS_PER_UNIT)
+
+    def record(self, task: str, seconds: float, num_beams: int, steps: int, input_tokens: List[int]):
+        """Update the cost estimate from one batched generate
+
+        Items of a batch decode in lockstep, so the batch ran ``steps`` steps
+        (its longest output) for every item.
+        """
+        units = num_beams * steps * sum(1 + tokens / _CONTEXT_TOKENS_PER_UNIT for tokens in input_tokens)
+        if units <= 0:
+            return
+        observed = seconds * 1000 / units
+        with self._lock:
+            previous = self._ms_per_unit.get(task)
+            alpha = self.config.cost_smoothing
+            self._ms_per_unit[task] = observed if previous is None else alpha * observed + (1 - alpha) * previous
+            self._samples[task] = self._samples.get(task, 0) + 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                task: {
+                    "ms_per_step_per_beam": round(self._ms_per_unit[task], 3),
+                    "measurements": self._samples[task],
+                }
+                for task in sorted(self._ms_per_unit)
+            }
+
+    def _apply(self, task: str, gen_kwargs: dict, profile: dict, input_tokens: int) -> dict:
+        kwargs = dict(gen_kwargs)
+        kwargs["num_beams"] = profile["num_beams"]
+        if "early_stopping" in profile:
+            kwargs["early_stopping"] = profile["early_stopping"]
+
+        max_length = min(kwargs.get("max_length", profile.get("max_length", 128)), profile.get("max_length", math.inf))
+        if task == "summarization":
+            # A summary needs no more decoder steps than the input has tokens
+            max_length = min(max_length, max(self.config.min_max_length, input_tokens))
+        kwargs["max_length"] = int(max_length)
+        if "min_length" in kwargs:
+            kwargs["min_length"] = min(kwargs["min_length"], kwargs["max_length"])
+
+        if kwargs["num_beams"] == 1:
+            # Beam-only settings are ignored (and warned about) by greedy and sampled decoding
+            kwargs.pop("early_stopping", None)
+            kwargs.pop("length_penalty", None)
+        return kwargs
+
+    def _estimate(self, task: str, kwargs: dict, input_tokens: int) -> float:
+        return self.estimate_ms(task, kwargs["num_beams"], kwargs["max_length"], input_tokens)
+
+    def _describe(self, name: str, kwargs: dict, estimate: Optional[float]) -> dict:
+        return {
+            "profile": name,
+            "num_beams": kwargs.get("num_beams"),
+            "max_length": kwargs.get("max_length"),
+            "early_stopping": kwargs.get("early_stopping", False),
+            "deadline_s": kwargs.get("max_time"),
+            "estimated_ms": round(estimate, 1) if estimate is not None else None,
+        }
@@ -0,0 +1,192 @@
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from textCraftAI.logging import logger
+from textCraftAI.entity.config_entity import BatchApiConfig
+from textCraftAI.components.inference_executor import InferenceExecutor
+
+
+# Field holding the generated text in each result line, as in the single-item endpoints
+RESULT_FIELDS = {"summarization": "summary", "paraphrase": "paraphrased_text"}
+
+
+class BatchRequestError(ValueError):
+    """Raised when a whole batch request is rejected; per-item problems are reported inline instead"""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class BulkItem:
+    __slots__ = ("index", "id", "model_input", "gen_kwargs", "error")
+
+    def __init__(self, index: int, item_id: Any = None):
+        self.index = index
+        self.id = item_id
+        self.model_input = None
+        self.gen_kwargs: Optional[dict] = None
+        self.error: Optional[str] = None
+
+    def line(self, task: str, text: Optional[str] = None) -> bytes:
+        result = {"index": self.index}
+        if self.id is not None:
+            result["id"] = self.id
+        if self.error is not None:
+            result["error"] = self.error
+        else:
+            result[RESULT_FIELDS[task]] = text
+        return (json.dumps(result) + "\n").encode("utf-8")
+
+
+class BulkProcessor:
+    """Runs the texts of one bulk request as length-sorted batches and streams results as NDJSON.
+
+    Items are a JSON array or NDJSON lines, each a string or an object with
+    ``text`` (plus optional ``id`` and, for paraphrasing, ``length_factor`` and
+    ``seed``). Every item is tokenized up front so the request can be checked
+    against ``max_total_tokens``. Items sharing generation kwargs are then sorted
+    by token count and generated ``batch_size`` at a time, one batch after
+    another, so a bulk request never holds more than one inference worker.
+    Result lines are written in input order, with an ``error`` field for items
+    that could not be processed.
+    """
+
+    def __init__(self, config: BatchApiConfig, predictor: Any, executor: InferenceExecutor):
+        self.config = config
+        self.predictor = predictor
+        self.executor = executor
+        self.max_body_bytes = int(config.max_body_mb * 1024 * 1024)
+
+    def prepare(self, task: str, body: bytes, ndjson: bool) -> List[BulkItem]:
+        """Parse and tokenize every item of a request body (blocking, run on the executor)"""
+        raw_items = self._parse(body, ndjson)
+        items = [self._prepare_item(task, index, raw) for index, raw in enumerate(raw_items)]
+
+        total_tokens = sum(len(item.model_input) for item in items if item.error is None)
+        if total_tokens > self.config.max_total_tokens:
+            raise BatchRequestError(
+                f"Batch too large: {total_tokens:,} tokens, maximum {self.config.max_total_tokens:,} tokens allowed.",
+                status_code=413
+            )
+        return items
+
+    async def stream(self, task: str, items: List[BulkItem],
+                     is_disconnected: Callable[[], Awaitable[bool]]) -> AsyncIterator[bytes]:
+        """Generate prepared items batch by batch, yielding NDJSON lines in input order"""
+        results: Dict[int, bytes] = {item.index: item.line(task) for item in items if item.error is not None}
+        next_index = 0
+
+        for gen_kwargs, batch in self._batches(items):
+            if await is_disconnected():
+                logger.info(f"Bulk {task} client disconnected, {len(items) - next_index} items left unprocessed")
+                return
+            try:
+                # The request was admitted when its items were prepared
+                outputs = await self.executor.run(
+                    self.predictor.generate_batch, task, [item.model_input for item in batch], gen_kwargs,
+                    bypass_limit=True
+                )
+            except Exception as e:
+                logger.exception(f"Bulk {task} batch of {len(batch)} items failed: {e}")
+                outputs = [None] * len(batch)
+                for item in batch:
+                    item.error = f"Generation failed: {e}"
+            for item, text in zip(batch, outputs):
+                results[item.index] = item.line(task, text)
+
+            while next_index in results:
+                yield results.pop(next_index)
+                next_index += 1
+
+        while next_index in results:
+            yield results.pop(next_index)
+            next_index += 1
+
+    def _parse(self, body: bytes, ndjson: bool) -> List[Any]:
+        if len(body) > self.max_body_bytes:
+            raise BatchRequestError(f"Request body too large. Maximum {self.config.max_body_mb:g}MB allowed.", 413)
+        try:
+            text = body.decode("utf-8")
+        except UnicodeDecodeError:
+            raise BatchRequestError("Request body must be UTF-8 encoded")
+
+        if ndjson:
+            raw_items = []
+            # Split on "\n" only: str.splitlines() also breaks on U+2028 and similar characters,
+            # which may appear raw inside valid JSON strings
+            for number, line in enumerate(text.split("\n"), start=1):
+                line = line.removesuffix("\r")
+                if not line.strip():
+                    continue
+                try:
+                    raw_items.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    # One broken line fails only its own item
+                    raw_items.append(_InvalidLine(f"Invalid JSON on line {number}: {e.msg}"))
+        else:
+            try:
+                raw_items = json.loads(text)
+            except json.JSONDecodeError as e:
+                raise BatchRequestError(f"Invalid JSON: {e.msg}")
+            if not isinstance(raw_items, list):
+                raise BatchRequestError("Request body must be a JSON array of items")
+
+        if not raw_items:
+            raise BatchRequestError("No items to process")
+        if len(raw_items) > self.config.max_items:
+            raise BatchRequestError(
+                f"Too many items: {len(raw_items):,}, maximum {self.config.max_items:,} allowed.", status_code=413
+            )
+        return raw_items
+
+    def _prepare_item(self, task: str, index: int, raw: Any) -> BulkItem:
+        item = BulkItem(index, raw.get("id") if isinstance(raw, dict) else None)
+        try:
+            if isinstance(raw, _InvalidLine):
+                raise ValueError(raw.error)
+            fields = {"text": raw} if isinstance(raw, str) else raw
+            if not isinstance(fields, dict) or not isinstance(fields.get("text"), str):
+                raise ValueError("Item must be a string or an object with a 'text' string")
+            if not fields["text"].strip():
+                raise ValueError("Text input cannot be empty")
+
+            if task == "summarization":
+                item.model_input, item.gen_kwargs = self.predictor.prepare_summarization(fields["text"])
+            else:
+                length_factor = fields.get("length_factor", 1.0)
+                if (not isinstance(length_factor, (int, float)) or isinstance(length_factor, bool)
+                        or not (0.3 <= length_factor <= 2.0)):
+                    raise ValueError("Length factor must be between 0.3 and 2.0")
+                seed = fields.get("seed")
+                if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool)):
+                    raise ValueError("Seed must be an integer")
+                item.model_input, item.gen_kwargs = self.predictor.prepare_paraphrase(
+                    fields["text"], float(length_factor), seed
+                )
+        except ValueError as e:
+            item.error = str(e)
+        return item
+
+    def _batches(self, items: List[BulkItem]) -> List[Tuple[dict, List[BulkItem]]]:
+        """Group items by generation kwargs, sort each group by length and cut it into batches"""
+        groups: Dict[Tuple, List[BulkItem]] = {}
+        for item in items:
+            if item.error is None:
+                groups.setdefault(tuple(sorted(item.gen_kwargs.items())), []).append(item)
+
+        batches = []
+        for key, group in groups.items():
+            group.sort(key=lambda item: len(item.model_input))
+            for start in range(0, len(group), self.config.batch_size):
+                batches.append((dict(key), group[start:start + self.config.batch_size]))
+        # Batches holding the earliest items first, so results start streaming sooner
+        batches.sort(key=lambda batch: min(item.index for item in batch[1]))
+        return batches
+
+
+class _InvalidLine:
+    __slots__ = ("error",)
+
+    def __init__(self, error: str):
+        self.error = error
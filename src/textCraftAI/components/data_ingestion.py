@@ -1,16 +1,219 @@
-from datasets import load_dataset
+import hashlib
+import json
+import os
+import shutil
+from typing import Iterator, List, Optional
+
+import pyarrow as pa
+from datasets import DatasetInfo, Features, load_dataset, get_dataset_split_names
+from datasets.arrow_writer import ArrowWriter
+from huggingface_hub import HfApi
 from textCraftAI.logging import logger
 from textCraftAI.entity.config_entity import DataIngestionConfig
 
+
+MANIFEST_FILE = "manifest.json"
+
+# Loader for each supported local file type
+_FILE_FORMATS = {".jsonl": "json", ".json": "json", ".csv": "csv", ".parquet": "parquet"}
+
+
+def file_sha256(path: str, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_json(path: str, content: dict):
+    # Replaced atomically, so an interrupted run never leaves a half-written manifest
+    with open(f"{path}.tmp", "w") as f:
+        json.dump(content, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(f"{path}.tmp", path)
+
+
 class DataIngestion:
+    """Streams a dataset into fixed-size Arrow shards with a manifest of row counts and checksums.
+
+    Rows are read from the source one shard at a time (the Hub in streaming
+    mode, or local JSONL/CSV/Parquet files), so the full dataset is never
+    held in memory. Each split is written in the layout ``load_from_disk``
+    reads, and its shards are memory-mapped when loaded. The manifest is
+    updated after every shard, so an interrupted run continues from the last
+    complete shard.
+    """
+
     def __init__(self, config: DataIngestionConfig):
         self.config = config
+        self.manifest_path = os.path.join(self.config.save_path, MANIFEST_FILE)
+        # Hub revision the shards are read from, so a resumed run does not mix two versions
+        self.revision: Optional[str] = None
+
+    def source(self) -> dict:
+        """What is ingested; a manifest for a different source or shard size is started over
+
+        Local files are identified by path, size and content hash, Hub
+        datasets by their resolved revision, so edited files or an upstream
+        update are ingested again.
+        """
+        if self.config.data_files:
+            return {"data_files": {split: [self._file_state(path) for path in self._as_list(files)]
+                                   for split, files in self.config.data_files.items()},
+                    "shard_rows": self.config.shard_rows}
+        return {"dataset_name": self.config.dataset_name, "revision": self._hub_revision(),
+                "shard_rows": self.config.shard_rows}
 
     def load_and_save_dataset(self):
-        # Load dataset from Hugging Face Hub
-        dataset = load_dataset(self.config.dataset_name)
+        source = self.source()
+        manifest = self._load_manifest()
+        if manifest is not None and "dataset_name" in source and source["revision"] is None:
+            # The Hub is unreachable; keep what was ingested from it before
+            source["revision"] = manifest["source"].get("revision")
+        self.revision = source.get("revision")
+        if manifest is None or manifest["source"] != source:
+            if os.path.exists(self.config.save_path):
+                logger.info(f"Source changed, discarding the previous ingestion in {self.config.save_path}")
+                shutil.rmtree(self.config.save_path)
+            manifest = {"source": source, "complete": False, "splits": {}}
+        elif manifest["complete"]:
+            logger.info(f"Dataset already ingested in {self.config.save_path}, nothing to do")
+            return
+        os.makedirs(self.config.save_path, exist_ok=True)
+
+        splits = list(source["data_files"]) if self.config.data_files else get_dataset_split_names(
+            self.config.dataset_name, revision=self.revision
+        )
+        for split in splits:
+            self._ingest_split(split, manifest)
+
+        _write_json(os.path.join(self.config.save_path, "dataset_dict.json"), {"splits": splits})
+        manifest["complete"] = True
+        _write_json(self.manifest_path, manifest)
+
+        rows = {split: manifest["splits"][split]["rows"] for split in splits}
+        logger.info(f"Dataset ingested to {self.config.save_path} in shards of {self.config.shard_rows} rows: {rows}")
+
+    def _ingest_split(self, split: str, manifest: dict):
+        entry = manifest["splits"].setdefault(split, {"rows": 0, "complete": False, "features": None, "shards": []})
+        if entry["complete"]:
+            return
+        split_dir = os.path.join(self.config.save_path, split)
+        os.makedirs(split_dir, exist_ok=True)
+        self._discard_unrecorded_files(split_dir, entry)
+
+        if entry["shards"]:
+            logger.info(f"Resuming split '{split}' after {len(entry['shards'])} shards ({entry['rows']} rows)")
+        features = Features.from_dict(entry["features"]) if entry["features"] else None
+        rows = self._iter_rows(split, skip=entry["rows"])
+        while True:
+            batch = self._take(rows, self.config.shard_rows)
+            if not batch:
+                break
+            shard = self._write_shard(split_dir, len(entry["shards"]), batch, features)
+            if features is None:
+                features = shard.pop("features")
+                entry["features"] = features.to_dict()
+            entry["shards"].append(shard)
+            entry["rows"] += shard["rows"]
+            _write_json(self.manifest_path, manifest)
+
+        self._write_split_metadata(split, split_dir, entry, features)
+        entry["complete"] = True
+        _write_json(self.manifest_path, manifest)
+        logger.info(f"Split '{split}': {entry['rows']} rows in {len(entry['shards'])} shards")
+
+    def _iter_rows(self, split: str, skip: int) -> Iterator[dict]:
+        if self.config.data_files:
+            files = self._as_list(self.config.data_files[split])
+            extension = os.path.splitext(files[0])[1].lower()
+            if extension not in _FILE_FORMATS:
+                raise ValueError(f"Unsupported data file '{files[0]}', expected one of {sorted(_FILE_FORMATS)}")
+            dataset = load_dataset(_FILE_FORMATS[extension], data_files={split: files}, split=split, streaming=True)
+        else:
+            dataset = load_dataset(self.config.dataset_name, split=split, revision=self.revision, streaming=True)
+        if skip:
+            dataset = dataset.skip(skip)
+        return iter(dataset)
+
+    def _write_shard(self, split_dir: str, index: int, batch: List[dict], features: Optional[Features]) -> dict:
+        name = f"data-{index:05d}.arrow"
+        path = os.path.join(split_dir, name)
+        columns = {column: [row[column] for row in batch] for column in batch[0]}
+
+        writer = ArrowWriter(features=features, path=f"{path}.tmp")
+        try:
+            writer.write_batch(columns)
+            num_rows, _ = writer.finalize()
+        finally:
+            writer.close()
+        with open(f"{path}.tmp", "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(f"{path}.tmp", path)
+
+        shard = {
+            "file": f"{os.path.basename(split_dir)}/{name}",
+            "rows": num_rows,
+            "bytes": os.path.getsize(path),
+            "sha256": file_sha256(path),
+        }
+        if features is None:
+            # The first shard fixes the schema, so later shards are cast to the same types
+            with pa.memory_map(path) as source:
+                shard["features"] = Features.from_arrow_schema(pa.ipc.open_stream(source).schema)
+        return shard
+
+    def _write_split_metadata(self, split: str, split_dir: str, entry: dict, features: Optional[Features]):
+        """Files ``load_from_disk`` reads; the fingerprint is the shard checksums, so it changes only with the data"""
+        fingerprint = hashlib.sha256("".join(shard["sha256"] for shard in entry["shards"]).encode()).hexdigest()[:16]
+        DatasetInfo(features=features).write_to_directory(split_dir)
+        with open(os.path.join(split_dir, "state.json"), "w") as f:
+            json.dump({
+                "_data_files": [{"filename": os.path.basename(shard["file"])} for shard in entry["shards"]],
+                "_fingerprint": fingerprint,
+                "_format_columns": None,
+                "_format_kwargs": {},
+                "_format_type": None,
+                "_output_all_columns": False,
+                "_split": split,
+            }, f, indent=2)
+
+    def _discard_unrecorded_files(self, split_dir: str, entry: dict):
+        """Remove shards written after the manifest was last saved; they are written again"""
+        recorded = {os.path.basename(shard["file"]) for shard in entry["shards"]}
+        for name in os.listdir(split_dir):
+            if name not in recorded:
+                os.remove(os.path.join(split_dir, name))
+
+    def _hub_revision(self) -> Optional[str]:
+        try:
+            return HfApi().dataset_info(self.config.dataset_name).sha
+        except Exception as e:
+            logger.warning(f"Could not resolve the revision of '{self.config.dataset_name}': {e}")
+            return None
+
+    def _load_manifest(self) -> Optional[dict]:
+        if not os.path.exists(self.manifest_path):
+            return None
+        with open(self.manifest_path) as f:
+            return json.load(f)
+
+    @staticmethod
+    def _take(rows: Iterator[dict], count: int) -> List[dict]:
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == count:
+                break
+        return batch
 
-        # Save it to disk so it can be reused offline
-        dataset.save_to_disk(str(self.config.save_path))
+    @staticmethod
+    def _file_state(path: str) -> dict:
+        # Content, not mtime: a touch, re-checkout or dvc pull must not discard a complete ingestion
+        return {"path": path, "bytes": os.path.getsize(path), "sha256": file_sha256(path)}
 
-        logger.info(f"Dataset '{self.config.dataset_name}' downloaded and saved to {self.config.save_path}")
+    @staticmethod
+    def _as_list(files) -> List[str]:
+        return [str(files)] if isinstance(files, (str, os.PathLike)) else [str(f) for f in files]
@@ -1,33 +1,119 @@
+import hashlib
+import json
 import os
+import shutil
+import time
 from textCraftAI.logging import logger
 from transformers import AutoTokenizer
-from datasets import load_dataset, load_from_disk
+from datasets import load_from_disk
+from datasets.fingerprint import Hasher
 from textCraftAI.entity.config_entity import DataTransformationConfig
 
 
+# Bump when convert_examples_to_features changes, so previously tokenized splits are redone
+FEATURES_VERSION = 2
+
 
 class DataTransformation:
     def __init__(self, config: DataTransformationConfig):
         self.config = config
         self.tokenizer = AutoTokenizer.from_pretrained(config.tokenizer_name)
+        self.output_dir = os.path.join(self.config.root_dir, "dialogsum_dataset")
+
 
 
-    
     def convert_examples_to_features(self,example_batch):
-        input_encodings = self.tokenizer(example_batch['dialogue'] , max_length = 1024, truncation = True )
-        
-        with self.tokenizer.as_target_tokenizer():
-            target_encodings = self.tokenizer(example_batch['summary'], max_length = 128, truncation = True )
-            
+        input_encodings = self.tokenizer(
+            example_batch['dialogue'], max_length = self.config.max_input_length, truncation = True
+        )
+        target_encodings = self.tokenizer(
+            text_target = example_batch['summary'], max_length = self.config.max_target_length, truncation = True
+        )
+
         return {
             'input_ids' : input_encodings['input_ids'],
             'attention_mask': input_encodings['attention_mask'],
-            'labels': target_encodings['input_ids']
+            'labels': target_encodings['input_ids'],
+            # Token counts, so length-aware batching never rescans the ids
+            'input_length': [len(ids) for ids in input_encodings['input_ids']],
+            'labels_length': [len(ids) for ids in target_encodings['input_ids']]
         }
-    
+
+
+    def split_fingerprint(self, split_dataset, tokenizer_hash: str) -> str:
+        """Hash of the split's data, the tokenizer and the feature settings"""
+        digest = hashlib.sha256()
+        for part in (split_dataset._fingerprint, tokenizer_hash, FEATURES_VERSION,
+                     self.config.max_input_length, self.config.max_target_length):
+            digest.update(str(part).encode("utf-8"))
+        return digest.hexdigest()[:16]
+
 
     def convert(self):
         dataset_dialogsum = load_from_disk(self.config.data_path)
-        dataset_dialogsum_pt = dataset_dialogsum.map(self.convert_examples_to_features, batched = True)
-        dataset_dialogsum_pt.save_to_disk(os.path.join(self.config.root_dir,"dialogsum_dataset"))
+        os.makedirs(self.output_dir, exist_ok=True)
+        state = self._load_state()
+        tokenizer_hash = Hasher.hash(self.tokenizer)
+        num_proc = self.config.num_proc or os.cpu_count() or 1
+        if num_proc > 1:
+            # Worker processes tokenize in parallel; the tokenizer's own threads would only contend with them
+            os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+        for split, split_dataset in dataset_dialogsum.items():
+            fingerprint = self.split_fingerprint(split_dataset, tokenizer_hash)
+            previous = state.get(split, {})
+            if previous.get("fingerprint") == fingerprint and os.path.isdir(os.path.join(self.output_dir, split)):
+                logger.info(f"Split '{split}' is unchanged (fingerprint {fingerprint}), skipping tokenization")
+                continue
+
+            started = time.perf_counter()
+            split_pt = split_dataset.map(
+                self.convert_examples_to_features,
+                batched = True,
+                batch_size = self.config.batch_size,
+                num_proc = num_proc if num_proc > 1 and len(split_dataset) >= num_proc else None,
+                desc = f"Tokenizing {split}"
+            )
+            self._save_split(split, split_pt)
+            seconds = time.perf_counter() - started
+
+            state[split] = {
+                "fingerprint": fingerprint,
+                "examples": len(split_pt),
+                "seconds": round(seconds, 2),
+                "examples_per_second": round(len(split_pt) / seconds, 1) if seconds else None,
+            }
+            self._save_state(state)
+            logger.info(f"Tokenized split '{split}': {len(split_pt)} examples in {seconds:.1f}s "
+                        f"({state[split]['examples_per_second']} examples/sec, {num_proc} processes)")
+
+        # Splits that no longer exist in the input are dropped from the output
+        splits = list(dataset_dialogsum.keys())
+        for split in set(state) - set(splits):
+            shutil.rmtree(os.path.join(self.output_dir, split), ignore_errors=True)
+            del state[split]
+        self._save_state(state)
+        with open(os.path.join(self.output_dir, "dataset_dict.json"), "w") as f:
+            json.dump({"splits": splits}, f)
+
+
+    def _save_split(self, split: str, split_pt):
+        # Written next to the old split and swapped in, so an interrupted run never leaves half a split
+        target = os.path.join(self.output_dir, split)
+        staging = f"{target}.tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        split_pt.save_to_disk(staging)
+        shutil.rmtree(target, ignore_errors=True)
+        os.replace(staging, target)
+
+
+    def _load_state(self) -> dict:
+        if not os.path.exists(self.config.state_file):
+            return {}
+        with open(self.config.state_file) as f:
+            return json.load(f)
+
 
+    def _save_state(self, state: dict):
+        with open(self.config.state_file, "w") as f:
+            json.dump(state, f, indent=2)
@@ -1,6 +1,9 @@
+import json
 import os
+from typing import List
 from textCraftAI.logging import logger
 from textCraftAI.entity.config_entity import DataValidationConfig
+from textCraftAI.components.data_ingestion import file_sha256
 
 
 class DataValidation:
@@ -8,25 +11,60 @@ class DataValidation:
         self.config = config
 
     def validate_all_files_exist(self) -> bool:
-        try:
-            dataset_path = os.path.join("artifacts", "data_ingestion", "dialogsum_dataset")
-            present_files = os.listdir(dataset_path)
-
-            missing_files = [
-                required for required in self.config.ALL_REQUIRED_FILES
-                if required not in present_files
-            ]
+        """Check the ingested dataset against its manifest
 
-            validation_status = len(missing_files) == 0
+        Every required split must be complete, and every shard must exist with
+        the size and row counts the manifest records, so the check reads only
+        file metadata. Checksums are recomputed only with ``verify_checksums``.
+        """
+        try:
+            problems = self.manifest_problems()
+            validation_status = len(problems) == 0
 
             with open(self.config.STATUS_FILE, 'w') as f:
                 if validation_status:
-                    f.write("Validation status: True\nAll required files are present.")
+                    f.write("Validation status: True\nAll required splits match the manifest.")
                 else:
-                    f.write(f"Validation status: False\nMissing files: {missing_files}")
+                    f.write("Validation status: False\n" + "\n".join(problems))
 
             logger.info(f"Data validation status: {validation_status}")
+            for problem in problems:
+                logger.info(f"Data validation: {problem}")
             return validation_status
 
         except Exception as e:
             raise e
+
+    def manifest_problems(self) -> List[str]:
+        manifest_path = os.path.join(self.config.data_path, "manifest.json")
+        if not os.path.exists(manifest_path):
+            return [f"Missing manifest: {manifest_path}"]
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+        problems = []
+        if not manifest.get("complete"):
+            problems.append("Ingestion did not finish")
+        for split in self.config.ALL_REQUIRED_FILES:
+            entry = manifest["splits"].get(split)
+            if entry is None:
+                problems.append(f"Missing split: {split}")
+                continue
+            if not entry["complete"]:
+                problems.append(f"Split '{split}' is incomplete")
+            if sum(shard["rows"] for shard in entry["shards"]) != entry["rows"] or entry["rows"] == 0:
+                problems.append(f"Split '{split}' has {entry['rows']} rows, its shards disagree or it is empty")
+            for shard in entry["shards"]:
+                problems.extend(self._shard_problems(shard))
+        return problems
+
+    def _shard_problems(self, shard: dict) -> List[str]:
+        path = os.path.join(self.config.data_path, shard["file"])
+        if not os.path.exists(path):
+            return [f"Missing shard: {shard['file']}"]
+        size = os.path.getsize(path)
+        if size != shard["bytes"]:
+            return [f"Shard {shard['file']} is {size} bytes, the manifest records {shard['bytes']}"]
+        if self.config.verify_checksums and file_sha256(path) != shard["sha256"]:
+            return [f"Shard {shard['file']} does not match its checksum"]
+        return []
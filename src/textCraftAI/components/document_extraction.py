@@ -0,0 +1,224 @@
+import contextlib
+import itertools
+import multiprocessing
+import os
+import re
+import shutil
+import tempfile
+import threading
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Iterable, Iterator, List, Optional
+from xml.etree import ElementTree
+
+from textCraftAI.logging import logger
+from textCraftAI.entity.config_entity import DocumentExtractionConfig
+
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_P, _R, _T, _TC, _BR = _W + "p", _W + "r", _W + "t", _W + "tc", _W + "br"
+# Run children with a fixed text equivalent, as in python-docx's ``Run.text``
+_RUN_TEXT = {_W + "tab": "\t", _W + "ptab": "\t", _W + "cr": "\n", _W + "noBreakHyphen": "-"}
+_BR_TYPE = _W + "type"
+# Content repeated for consumers that do not understand the ``mc:Choice`` branch (e.g. text boxes)
+_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+_HEADER_FOOTER_PART = re.compile(r"word/(header|footer)(\d*)\.xml")
+
+
+def iter_docx_part(part: BinaryIO) -> Iterator[str]:
+    """Yield the paragraphs and table cells of a WordprocessingML part in document order
+
+    The XML is parsed incrementally and every element is detached from the
+    tree once it ends, so memory is bounded by the nesting depth rather than
+    the size of the document. A table cell is yielded as one block, its
+    paragraphs joined by newlines.
+    """
+    parents: List[ElementTree.Element] = []
+    paragraphs: List[List[str]] = []  # open paragraphs; text boxes nest paragraphs in paragraphs
+    cells: List[List[str]] = []  # open table cells; tables nest too
+    fallback_depth = 0
+
+    for event, element in ElementTree.iterparse(part, events=("start", "end")):
+        tag = element.tag
+        if event == "start":
+            if tag == _FALLBACK:
+                fallback_depth += 1
+            elif not fallback_depth:
+                if tag == _P:
+                    paragraphs.append([])
+                elif tag == _TC:
+                    cells.append([])
+            parents.append(element)
+            continue
+
+        parents.pop()
+        if tag == _FALLBACK:
+            fallback_depth -= 1
+        elif fallback_depth:
+            pass
+        elif tag == _T and paragraphs:
+            paragraphs[-1].append(element.text or "")
+        elif (tag in _RUN_TEXT or tag == _BR) and paragraphs and parents[-1].tag == _R:
+            # Page and column breaks have no text; ``w:tab`` outside runs is a tab stop
+            if tag != _BR:
+                paragraphs[-1].append(_RUN_TEXT[tag])
+            elif element.get(_BR_TYPE, "textWrapping") == "textWrapping":
+                paragraphs[-1].append("\n")
+        elif tag == _P:
+            text = "".join(paragraphs.pop())
+            if cells:
+                cells[-1].append(text)
+            else:
+                yield text
+        elif tag == _TC:
+            text = "\n".join(cells.pop())
+            if cells:
+                cells[-1].append(text)
+            else:
+                yield text
+
+        if parents:
+            # Everything before this element was detached already, so this is cheap
+            parents[-1].remove(element)
+
+
+def group_blocks(blocks: Iterable[str], max_chars: int = 20000) -> Iterator[str]:
+    """Join consecutive blocks with newlines into pieces of up to ``max_chars`` characters"""
+    piece: List[str] = []
+    size = 0
+    for block in blocks:
+        if piece and size + len(block) > max_chars:
+            yield "\n".join(piece)
+            piece, size = [], 0
+        piece.append(block)
+        size += len(block) + 1
+    if piece:
+        yield "\n".join(piece)
+
+
+def _extract_page_range(path: str, start: int, stop: int) -> List[str]:
+    """Text of pages ``start``..``stop`` of the PDF at ``path`` (runs in a pool process)"""
+    import PyPDF2
+
+    reader = PyPDF2.PdfReader(path)
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+class DocumentExtractor:
+    """Extracts document text page by page (PDF) or block by block (DOCX), as a generator.
+
+    Pages are yielded in order as soon as they are extracted, so callers can
+    start summarizing before the whole document is read. If
+    ``parallel_min_pages`` is set, PDFs with at least that many pages are split
+    into ranges of ``pages_per_task`` pages and extracted by a shared process
+    pool. At most two ranges per worker are in flight, which bounds memory
+    and keeps extraction running ahead of the consumer.
+    """
+
+    def __init__(self, config: DocumentExtractionConfig):
+        self.config = config
+        self.max_workers = config.max_workers or os.cpu_count() or 1
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def iter_pdf_pages(self, stream: BinaryIO) -> Iterator[str]:
+        """Yield the text of every page of a PDF, read from a binary stream, in page order"""
+        # Imported on first use, like the other document parsers, to keep API startup fast
+        import PyPDF2
+
+        reader = PyPDF2.PdfReader(stream)
+        num_pages = len(reader.pages)
+        if self.config.max_pages:
+            num_pages = min(num_pages, self.config.max_pages)
+
+        parallel_min_pages = self.config.parallel_min_pages
+        if not parallel_min_pages or num_pages < parallel_min_pages or not self._can_fork_pool():
+            for page_num in range(num_pages):
+                yield reader.pages[page_num].extract_text() or ""
+            return
+
+        del reader
+        yield from self._iter_parallel(stream, num_pages)
+
+    def iter_docx_blocks(self, stream: BinaryIO, headers_footers: Optional[bool] = None) -> Iterator[str]:
+        """Yield the paragraphs and table cells of a DOCX, read from a binary stream, in document order
+
+        ``word/document.xml`` is decompressed and parsed as it is read,
+        without building a python-docx object model. With ``headers_footers``
+        (default ``docx_headers_footers``) the text of all headers is yielded
+        first and that of all footers last.
+        """
+        if headers_footers is None:
+            headers_footers = self.config.docx_headers_footers
+        with zipfile.ZipFile(stream) as archive:
+            parts = ["word/document.xml"]
+            if headers_footers:
+                extra = sorted(
+                    (match.group(1) == "footer", int(match.group(2) or 0), name)
+                    for name, match in ((name, _HEADER_FOOTER_PART.fullmatch(name)) for name in archive.namelist())
+                    if match
+                )
+                parts = [name for is_footer, _, name in extra if not is_footer] + parts + \
+                        [name for is_footer, _, name in extra if is_footer]
+            for name in parts:
+                with archive.open(name) as part:
+                    yield from iter_docx_part(part)
+
+    def shutdown(self, wait: bool = False):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=wait, cancel_futures=True)
+                self._pool = None
+
+    def _iter_parallel(self, stream: BinaryIO, num_pages: int) -> Iterator[str]:
+        pool = self._get_pool()
+        step = self.config.pages_per_task
+        ranges = ((start, min(start + step, num_pages)) for start in range(0, num_pages, step))
+
+        # Workers read the PDF from disk instead of receiving a copy of it with every range
+        with self._on_disk(stream) as path:
+            in_flight = deque(
+                pool.submit(_extract_page_range, path, start, stop)
+                for start, stop in itertools.islice(ranges, 2 * self.max_workers)
+            )
+            try:
+                while in_flight:
+                    pages = in_flight.popleft().result()
+                    next_range = next(ranges, None)
+                    if next_range is not None:
+                        in_flight.append(pool.submit(_extract_page_range, path, *next_range))
+                    yield from pages
+            finally:
+                # The consumer stopped early (or failed): drop work that has not started
+                for future in in_flight:
+                    future.cancel()
+
+    @contextlib.contextmanager
+    def _on_disk(self, stream: BinaryIO) -> Iterator[str]:
+        """Path of the stream's file, copying it to a temporary file if it is only in memory"""
+        path = getattr(stream, "name", None)
+        if isinstance(path, str) and os.path.isfile(path):
+            # Spooled uploads already live in a named temporary file
+            stream.flush()
+            yield path
+            return
+        with tempfile.NamedTemporaryFile(suffix=".pdf") as pdf_file:
+            stream.seek(0)
+            shutil.copyfileobj(stream, pdf_file)
+            pdf_file.flush()
+            yield pdf_file.name
+
+    def _can_fork_pool(self) -> bool:
+        # Daemonic processes (e.g. job workers) may not start children of their own
+        return self.max_workers > 1 and not multiprocessing.current_process().daemon
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # spawn: the serving process has model and executor threads that must not be forked
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+                logger.info(f"Started PDF extraction pool with {self.max_workers} processes")
+            return self._pool
@@ -0,0 +1,183 @@
+import re
+import threading
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from transformers import StoppingCriteria, StoppingCriteriaList, TextIteratorStreamer
+
+
+class _CancelledCriteria(StoppingCriteria):
+    """Stops generation as soon as the stream is cancelled (e.g. the client disconnected)"""
+
+    def __init__(self, cancel_event: threading.Event):
+        self.cancel_event = cancel_event
+
+    def __call__(self, input_ids, scores, **kwargs) -> bool:
+        return self.cancel_event.is_set()
+
+
+# A sentence end followed by a capital letter. clean_text changes nothing across it (it
+# only capitalizes the very first letter), so the text before it is cleaned once and frozen.
+_SENTENCE_BOUNDARY = re.compile(r'(?<=\w[.!?])\s+(?=[A-Z])')
+
+
+class IncrementalCleaner:
+    """Applies a whole-text cleaner to a growing output and yields only the stable new part.
+
+    The cleaner trims trailing punctuation, collapses whitespace and removes
+    tags, so the last word of the cleaned text may still change. Text is only
+    emitted up to the last whitespace (and before any unclosed ``<``). Text
+    before the last sentence boundary is cleaned once and frozen, so each
+    token re-cleans only the current sentence. ``finish`` cleans the whole
+    output once more. If a later chunk rewrites text that was already
+    emitted, ``replaced`` is set and the caller should resend the full
+    cleaned text.
+    """
+
+    def __init__(self, clean: Callable[[str], str]):
+        self.clean = clean
+        self.chunks: List[str] = []
+        # Raw text after the last sentence boundary, and the cleaned text frozen before it
+        self.tail = ""
+        self.head = ""
+        # Text emitted after ``head``
+        self.tail_emitted = ""
+
+    @property
+    def emitted(self) -> str:
+        return self.head + self.tail_emitted
+
+    def feed(self, chunk: str) -> Tuple[str, bool]:
+        """Add raw ``chunk``; return ``(text, replaced)`` to send, ``text`` may be empty"""
+        self.chunks.append(chunk)
+        self.tail += chunk
+        frozen, frozen_replaced = self._freeze()
+
+        cleaned = self.clean(self.tail)
+        stable_end = max(cleaned.rfind(" "), 0)
+        open_tag = cleaned.rfind("<")
+        if open_tag > cleaned.rfind(">"):
+            stable_end = min(stable_end, open_tag)
+        stable = cleaned[:stable_end].rstrip()
+        delta, replaced = self._advance(" " + stable if stable and self.head else stable)
+        if replaced:
+            return delta, True
+        return frozen + delta, frozen_replaced
+
+    def finish(self) -> Tuple[str, bool]:
+        """Flush the remaining text once generation has ended"""
+        # One full clean, so the final text is exactly what the non-streaming path returns
+        cleaned = self.clean("".join(self.chunks))
+        emitted = self.emitted
+        self.head, self.tail_emitted = "", cleaned
+        if cleaned.startswith(emitted):
+            return cleaned[len(emitted):], False
+        return cleaned, True
+
+    def _freeze(self) -> Tuple[str, bool]:
+        """Clean the tail up to its last sentence boundary once and move it to ``head``"""
+        boundary = None
+        for match in _SENTENCE_BOUNDARY.finditer(self.tail):
+            before = self.tail[:match.start()]
+            # A tag still open before the boundary could close after it
+            if before.rfind("<") <= before.rfind(">"):
+                boundary = match
+        if boundary is None:
+            return "", False
+
+        sentence = self.clean(self.tail[:boundary.start()])
+        self.tail = self.tail[boundary.end():]
+        text = " " + sentence if self.head else sentence
+        if text.startswith(self.tail_emitted):
+            delta, replaced = text[len(self.tail_emitted):], False
+        else:
+            delta, replaced = self.head + text, True
+        self.head += text
+        self.tail_emitted = ""
+        return delta, replaced
+
+    def _advance(self, stable: str) -> Tuple[str, bool]:
+        if stable.startswith(self.tail_emitted):
+            delta = stable[len(self.tail_emitted):]
+            self.tail_emitted = stable
+            return delta, False
+        if len(stable) < len(self.tail_emitted) and self.tail_emitted.startswith(stable):
+            # Cleaned text is temporarily shorter (e.g. trailing space trimmed), nothing new yet
+            return "", False
+        self.tail_emitted = stable
+        return self.head + stable, True
+
+
+class GenerationStream:
+    """One streamed ``generate`` call: ``run`` produces tokens, iteration consumes them.
+
+    ``run`` blocks until generation finishes and is meant to be scheduled on the
+    inference executor; iterating yields ``(text, replaced)`` pairs of cleaned
+    output from another thread as tokens are decoded. ``cancel`` stops
+    generation at the next decoder step.
+    """
+
+    def __init__(self, model: Any, tokenizer: Any, model_input: Any, gen_kwargs: dict,
+                 clean: Callable[[str], str]):
+        self.model = model
+        self.tokenizer = tokenizer
+        self.model_input = model_input
+        self.gen_kwargs = dict(gen_kwargs)
+        self.cancel_event = threading.Event()
+        self._lock = threading.Lock()
+        self._started = False
+        self.cleaner = IncrementalCleaner(clean)
+        self.error: Optional[BaseException] = None
+        self.streamer = TextIteratorStreamer(tokenizer, skip_prompt=True, skip_special_tokens=True)
+
+        # Streaming emits one hypothesis token by token, which beam search cannot do
+        self.gen_kwargs["num_beams"] = 1
+        self.gen_kwargs.pop("early_stopping", None)
+        self.gen_kwargs.pop("length_penalty", None)
+
+    def run(self):
+        with self._lock:
+            if self.cancel_event.is_set():
+                # Cancelled while queued, cancel() already released the consumer
+                return
+            self._started = True
+        try:
+            input_ids = getattr(self.model_input, "input_ids", None)
+            if input_ids is not None:
+                # Already tokenized when the request was admitted
+                inputs = self.tokenizer.pad({"input_ids": [input_ids]}, return_tensors="pt").to(self.model.device)
+            else:
+                inputs = self.tokenizer(self.model_input, truncation=True, return_tensors="pt").to(self.model.device)
+            self.model.generate(
+                **inputs,
+                streamer=self.streamer,
+                stopping_criteria=StoppingCriteriaList([_CancelledCriteria(self.cancel_event)]),
+                **self.gen_kwargs
+            )
+        except BaseException as e:
+            self.error = e
+            # Unblock the consumer, which re-raises the error
+            self.streamer.end()
+            raise
+
+    def cancel(self):
+        with self._lock:
+            self.cancel_event.set()
+            if not self._started:
+                # Generation never began, so it will not end the streamer itself
+                self.streamer.end()
+
+    @property
+    def text(self) -> str:
+        """Full cleaned text emitted so far"""
+        return self.cleaner.emitted
+
+    def __iter__(self) -> Iterator[Tuple[str, bool]]:
+        for chunk in self.streamer:
+            delta, replaced = self.cleaner.feed(chunk)
+            if delta:
+                yield delta, replaced
+        if self.error is not None:
+            raise self.error
+        delta, replaced = self.cleaner.finish()
+        if delta or replaced:
+            yield delta, replaced
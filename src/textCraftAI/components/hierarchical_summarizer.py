@@ -0,0 +1,142 @@
+import itertools
+from typing import Any, Iterable, Iterator, List, Union
+
+from textCraftAI.logging import logger
+from textCraftAI.entity.config_entity import LongDocumentConfig
+from textCraftAI.components.token_budget import TokenizedInput
+
+
+# Split long strings at paragraph breaks (or whitespace) so they can be tokenized piece by piece
+_PIECE_CHARS = 20000
+
+
+def iter_text_pieces(text: str, piece_chars: int = _PIECE_CHARS) -> Iterator[str]:
+    """Yield ``text`` in pieces of roughly ``piece_chars`` characters, cut at whitespace"""
+    start = 0
+    while start < len(text):
+        end = start + piece_chars
+        if end < len(text):
+            # Prefer a paragraph break, then any whitespace, inside the second half of the piece
+            lower = start + piece_chars // 2
+            cut = text.rfind("\n\n", lower, end)
+            if cut == -1:
+                cut = max(text.rfind(" ", lower, end), text.rfind("\n", lower, end))
+            end = cut if cut != -1 else end
+        yield text[start:end]
+        start = end
+
+
+def _batched(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class HierarchicalSummarizer:
+    """Map-reduce summarization for documents longer than the model's encoder window.
+
+    The document is tokenized incrementally into overlapping windows of
+    ``chunk_tokens`` tokens (the map step). Windows are summarized
+    ``chunk_batch_size`` at a time with one batched generate. The partial
+    summaries are then joined and summarized again (the reduce step) until a
+    single summary remains or ``max_depth`` reduce levels have run. Only one
+    batch of windows and the partial summaries are held in memory at a time.
+    """
+
+    def __init__(self, config: LongDocumentConfig, predictor: Any):
+        if config.overlap_tokens >= config.chunk_tokens:
+            raise ValueError("overlap_tokens must be smaller than chunk_tokens")
+        self.config = config
+        self.predictor = predictor
+
+    def summarize(self, document: Union[str, Iterable[str]]) -> str:
+        """Summarize a string, or an iterable of text pieces such as pages, of any length"""
+        return self._summarize_windows([self.reduce(document)])[0]
+
+    def reduce(self, document: Union[str, Iterable[str]]) -> Union[str, TokenizedInput]:
+        """Run map/reduce levels until the remaining text fits one window and return it
+
+        The result is a model input, already tokenized unless the document was
+        short enough to pass through. It still needs one final summarization
+        pass, which lets callers run that pass themselves (e.g. streaming it
+        to the client).
+        """
+        if isinstance(document, str):
+            pieces, joiner = iter_text_pieces(document), ""
+        else:
+            pieces, joiner = document, "\n"
+        backend = self.predictor.registry.get("summarization")
+        tokenizer = backend.tokenizer
+        chunk_tokens = self._chunk_tokens(backend)
+
+        depth = 0
+        while True:
+            windows = self._iter_windows(backend, pieces, chunk_tokens, joiner)
+            first = next(windows, None)
+            if first is None:
+                raise ValueError("No text to summarize.")
+            second = next(windows, None)
+            if second is None:
+                return first
+
+            partials = []
+            for batch in _batched(itertools.chain([first, second], windows), self.config.chunk_batch_size):
+                partials.extend(self._summarize_windows(batch))
+
+            depth += 1
+            logger.info(f"Reduce level {depth}: combining {len(partials)} partial summaries")
+            combined = " ".join(partials)
+            if depth >= self.config.max_depth:
+                # Out of levels: keep what fits in a single window
+                logger.warning(f"Reached max_depth={self.config.max_depth}, truncating {len(partials)} partial summaries")
+                ids = tokenizer(combined, add_special_tokens=False)["input_ids"][:chunk_tokens]
+                return self._window(backend, ids)
+            pieces, joiner = [combined], ""
+
+    def _chunk_tokens(self, backend: Any) -> int:
+        # Leave room for the special tokens the tokenizer appends and the model's input prefix
+        model_max = getattr(backend.tokenizer, "model_max_length", None) or self.config.chunk_tokens
+        return min(self.config.chunk_tokens, model_max - 2) - len(backend.prefix_ids)
+
+    def _window(self, backend: Any, ids: List[int]) -> TokenizedInput:
+        # Keep the window's ids so generation does not tokenize the decoded text again
+        tokenizer = backend.tokenizer
+        return TokenizedInput(tokenizer.decode(ids, skip_special_tokens=True),
+                              tokenizer.build_inputs_with_special_tokens(backend.prefix_ids + ids))
+
+    def _iter_windows(self, backend: Any, pieces: Iterable[str], chunk_tokens: int,
+                      joiner: str) -> Iterator[Union[str, TokenizedInput]]:
+        """Yield windows of ``chunk_tokens`` tokens overlapping by ``overlap_tokens``"""
+        stride = chunk_tokens - self.config.overlap_tokens
+        buffer: List[int] = []
+        # Short documents are passed through untouched instead of round-tripping the tokenizer
+        raw_pieces: List[str] = []
+        emitted_any = False
+
+        for piece in pieces:
+            if not piece or not piece.strip():
+                continue
+            if not emitted_any:
+                raw_pieces.append(piece)
+            buffer.extend(backend.tokenizer(piece, add_special_tokens=False)["input_ids"])
+            while len(buffer) >= chunk_tokens:
+                yield self._window(backend, buffer[:chunk_tokens])
+                emitted_any = True
+                raw_pieces = []
+                buffer = buffer[stride:]
+
+        if not emitted_any:
+            if raw_pieces:
+                yield joiner.join(raw_pieces)
+        # After a window, the buffer starts with its overlap; only emit if new tokens followed
+        elif len(buffer) > self.config.overlap_tokens:
+            yield self._window(backend, buffer)
+
+    def _summarize_windows(self, windows: List[Union[str, TokenizedInput]]) -> List[str]:
+        gen_kwargs = self.predictor.summarization_gen_kwargs()
+        return self.predictor.generate_batch("summarization", windows, gen_kwargs)
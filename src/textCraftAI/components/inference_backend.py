@@ -0,0 +1,308 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type
+
+from textCraftAI.logging import logger
+from textCraftAI.entity.config_entity import InferenceBackendConfig
+
+if TYPE_CHECKING:
+    from textCraftAI.components.generation_stream import GenerationStream
+
+# torch and transformers are imported where models are loaded and run, not at
+# import time, so the API starts serving its cheap endpoints before they load
+
+
+# transformers pipeline task and output field for each registry task
+_PIPELINE_TASKS = {
+    "summarization": ("summarization", "summary_text"),
+    "paraphrase": ("text2text-generation", "generated_text"),
+}
+
+_EXPORT_METADATA = "export.json"
+
+# Backend classes by ``inference_backend.backend`` name, filled by ``register_backend``
+_BACKENDS: Dict[str, Type["InferenceBackend"]] = {}
+
+
+@dataclass(frozen=True)
+class BackendLoadConfig:
+    """Everything a backend may need to load a model; each backend reads the fields it uses"""
+
+    backend: InferenceBackendConfig
+    # Name, path or loaded tokenizer; the model path when not set
+    tokenizer: Any = None
+    cache_dir: Optional[str] = None
+    mmap_weights: bool = False
+    quantizer: Optional[Any] = None
+
+
+def register_backend(cls: Type["InferenceBackend"]) -> Type["InferenceBackend"]:
+    """Class decorator that makes a backend selectable as ``inference_backend.backend: <cls.name>``"""
+    _BACKENDS[cls.name] = cls
+    return cls
+
+
+def get_backend_class(name: str) -> Type["InferenceBackend"]:
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown inference backend '{name}', expected one of {tuple(_BACKENDS)}")
+    return _BACKENDS[name]
+
+
+class InferenceBackend:
+    """A seq2seq model loaded for one task, with batched and streaming generation.
+
+    ``generate`` returns raw decoded outputs; cleaning, caching and seeding stay
+    with the caller so they behave the same on every backend. ``model`` and
+    ``tokenizer`` expose the underlying objects for token counting and streaming.
+    A new engine subclasses this, implements ``load`` and is registered with
+    ``register_backend``; the prediction pipeline loads every task through it.
+    """
+
+    name = ""
+
+    def __init__(self, task: str, pipe: Any):
+        self.task = task
+        self.pipe = pipe
+        self.model = pipe.model
+        self.tokenizer = pipe.tokenizer
+        self.output_key = _PIPELINE_TASKS[task][1]
+
+        # What the transformers pipeline adds to every call: the model's task_specific_params
+        # for the pipeline task as default generation kwargs, and its input prefix (T5's "summarize: ")
+        config = getattr(self.model, "config", None)
+        task_params = dict((getattr(config, "task_specific_params", None) or {}).get(_PIPELINE_TASKS[task][0]) or {})
+        prefix = task_params.pop("prefix", None)
+        self.prefix = prefix if prefix is not None else (getattr(config, "prefix", None) or "")
+        self.task_gen_kwargs = task_params
+        self.prefix_ids: List[int] = (
+            self.tokenizer(self.prefix, add_special_tokens=False)["input_ids"] if self.prefix else []
+        )
+        # The pipeline's postprocess decodes without cleaning up spaces unless it was built to
+        self.clean_up_tokenization_spaces = bool(
+            getattr(pipe, "_postprocess_params", {}).get("clean_up_tokenization_spaces", False)
+        )
+
+    @classmethod
+    def load(cls, task: str, model_path: str, config: BackendLoadConfig) -> "InferenceBackend":
+        """Load the model at ``model_path`` (a trained checkpoint or Hub name) for ``task``"""
+        raise NotImplementedError(f"{cls.__name__} does not implement load()")
+
+    def encode(self, text: str, **kwargs) -> List[int]:
+        """Encoder token ids of ``text`` with the model's input prefix, as the pipeline tokenizes it"""
+        return self.tokenizer(self.prefix + text, **kwargs)["input_ids"]
+
+    def generation_kwargs(self, gen_kwargs: dict) -> dict:
+        """``gen_kwargs`` on top of the model's task-specific defaults"""
+        return {**self.task_gen_kwargs, **gen_kwargs}
+
+    def decode(self, output_ids: Any) -> List[str]:
+        """Decode generated sequences the way the pipeline's postprocess does"""
+        return [
+            self.tokenizer.decode(ids, skip_special_tokens=True,
+                                  clean_up_tokenization_spaces=self.clean_up_tokenization_spaces)
+            for ids in output_ids
+        ]
+
+    def generate(self, model_inputs: List[str], gen_kwargs: dict) -> List[str]:
+        """Run one batched generate and return the decoded outputs in input order"""
+        batch_ids = [self.encode(model_input, truncation=True) for model_input in model_inputs]
+        return self.generate_ids(batch_ids, gen_kwargs)[0]
+
+    def generate_ids(self, batch_ids: List[List[int]], gen_kwargs: dict) -> Tuple[List[str], int, List[int]]:
+        """Run one batched generate from encoder token ids, skipping re-tokenization
+
+        Returns the decoded outputs in input order, the number of decoder
+        steps the batch ran and the number of tokens generated for each output
+        (padding and the decoder start token excluded).
+        """
+        import torch
+
+        encoded = self.tokenizer.pad({"input_ids": batch_ids}, return_tensors="pt")
+        encoded = {name: tensor.to(self.model.device) for name, tensor in encoded.items()}
+        with torch.inference_mode():
+            output_ids = self.model.generate(**encoded, **self.generation_kwargs(gen_kwargs))
+        texts = self.decode(output_ids)
+        pad_token_id = self.tokenizer.pad_token_id
+        if pad_token_id is None:
+            output_tokens = [int(output_ids.shape[1])] * len(texts)
+        else:
+            output_tokens = [int(count) for count in (output_ids != pad_token_id).sum(-1).tolist()]
+        return texts, int(output_ids.shape[1]), output_tokens
+
+    def open_stream(self, model_input: Any, gen_kwargs: dict, clean: Callable[[str], str]) -> "GenerationStream":
+        """Create a token-by-token generation for one input"""
+        from textCraftAI.components.generation_stream import GenerationStream
+
+        if isinstance(model_input, str):
+            model_input = self.prefix + model_input
+        return GenerationStream(self.model, self.tokenizer, model_input, self.generation_kwargs(gen_kwargs), clean)
+
+
+@register_backend
+class TorchBackend(InferenceBackend):
+    """PyTorch models run through ``transformers.pipeline``"""
+
+    name = "torch"
+
+    @classmethod
+    def load(cls, task: str, model_path: str, config: BackendLoadConfig) -> "TorchBackend":
+        return cls.from_pretrained(
+            task,
+            model_path,
+            config.tokenizer if config.tokenizer is not None else model_path,
+            quantizer=config.quantizer,
+            cache_dir=config.cache_dir,
+            mmap_weights=config.mmap_weights
+        )
+
+    @classmethod
+    def from_pretrained(cls, task: str, model_name_or_path: str, tokenizer: Any, quantizer: Optional[Any] = None,
+                        cache_dir: Optional[str] = None, mmap_weights: bool = False) -> "TorchBackend":
+        """Load ``model_name_or_path`` for ``task``
+
+        With ``mmap_weights``, safetensors checkpoints are loaded without first
+        materializing randomly initialized weights, so on CPU the parameters
+        stay backed by the memory-mapped file. Those pages are clean page cache
+        shared by every process on the host that loads the same file.
+        """
+        from transformers import AutoTokenizer, pipeline
+
+        pipeline_task = _PIPELINE_TASKS[task][0]
+        if isinstance(tokenizer, str):
+            # Requests are tokenized on the serving path, so insist on the fast (Rust) tokenizer
+            tokenizer = AutoTokenizer.from_pretrained(tokenizer, use_fast=True, cache_dir=cache_dir)
+        model_kwargs = {"cache_dir": cache_dir}
+        if mmap_weights:
+            model_kwargs["low_cpu_mem_usage"] = True
+        if quantizer is not None and quantizer.applies_to(task):
+            # Quantized linear layers only run on CPU
+            model = quantizer.load_model(task, model_name_or_path, **model_kwargs)
+            return cls(task, pipeline(pipeline_task, model=model, tokenizer=tokenizer, device=-1))
+
+        return cls(task, pipeline(
+            pipeline_task,
+            model=model_name_or_path,
+            tokenizer=tokenizer,
+            model_kwargs=model_kwargs
+        ))
+
+
+@register_backend
+class OnnxRuntimeBackend(InferenceBackend):
+    """Exported encoder, decoder and decoder-with-past graphs run by ONNX Runtime on CPU.
+
+    The first decoder step runs the plain decoder graph, every later step the
+    decoder-with-past graph fed with the cached key/values. Search itself
+    (beams, sampling, n-gram blocking, streaming) is the same ``generate`` the
+    PyTorch backend uses, so both backends accept identical kwargs. Graphs
+    are read from ``inference_backend.onnx_model_dir/<task>``, written there
+    from the task's model by export_onnx.py.
+    """
+
+    name = "onnxruntime"
+
+    def __init__(self, task: str, pipe: Any, model_dir: str):
+        super().__init__(task, pipe)
+        self.model_dir = model_dir
+
+    @classmethod
+    def load(cls, task: str, model_path: str, config: BackendLoadConfig) -> "OnnxRuntimeBackend":
+        return cls.from_export(
+            task,
+            os.path.join(config.backend.onnx_model_dir, task),
+            intra_op_num_threads=config.backend.intra_op_num_threads
+        )
+
+    @classmethod
+    def from_export(cls, task: str, model_dir: str, intra_op_num_threads: int = 0) -> "OnnxRuntimeBackend":
+        import onnxruntime
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+        from transformers import AutoTokenizer, pipeline
+
+        if not os.path.exists(os.path.join(model_dir, _EXPORT_METADATA)):
+            raise FileNotFoundError(f"No ONNX export found in {model_dir}. Run export_onnx.py first.")
+
+        session_options = onnxruntime.SessionOptions()
+        if intra_op_num_threads:
+            session_options.intra_op_num_threads = intra_op_num_threads
+        model = ORTModelForSeq2SeqLM.from_pretrained(
+            model_dir,
+            provider="CPUExecutionProvider",
+            session_options=session_options,
+            use_cache=True,
+            use_merged=False
+        )
+        tokenizer = AutoTokenizer.from_pretrained(model_dir, use_fast=True)
+        return cls(task, pipeline(_PIPELINE_TASKS[task][0], model=model, tokenizer=tokenizer), model_dir)
+
+    def size_bytes(self) -> int:
+        """On-disk size of the graphs and their external weights"""
+        return sum(os.path.getsize(path) for path in self._graph_files())
+
+    def fingerprint(self) -> str:
+        """Hash of the export metadata and a sample of every graph file"""
+        digest = hashlib.sha256(self.name.encode("utf-8"))
+        with open(os.path.join(self.model_dir, _EXPORT_METADATA), "rb") as f:
+            digest.update(f.read())
+        for path in self._graph_files():
+            size = os.path.getsize(path)
+            digest.update(f"{os.path.basename(path)}:{size}".encode("utf-8"))
+            with open(path, "rb") as f:
+                # Head and tail change with any re-export without hashing gigabytes
+                digest.update(f.read(1 << 16))
+                f.seek(max(0, size - (1 << 16)))
+                digest.update(f.read())
+        return digest.hexdigest()[:16]
+
+    def _graph_files(self) -> List[str]:
+        return sorted(
+            os.path.join(self.model_dir, name) for name in os.listdir(self.model_dir)
+            if name.endswith((".onnx", ".onnx_data"))
+        )
+
+
+def export_onnx(model_name_or_path: str, output_dir: str, tokenizer_name_or_path: Optional[str] = None,
+                cache_dir: Optional[str] = None):
+    """Export ``model_name_or_path`` to ONNX encoder, decoder and decoder-with-past graphs
+
+    The exporter validates each graph's outputs against the PyTorch model.
+    Decoders are kept as separate graphs (no merged decoder) for ONNX Runtime.
+    """
+    from optimum.exporters.onnx import main_export
+    from transformers import AutoTokenizer
+
+    logger.info(f"Exporting '{model_name_or_path}' to ONNX in {output_dir}")
+    main_export(
+        model_name_or_path,
+        output=output_dir,
+        task="text2text-generation-with-past",
+        no_post_process=True,
+        cache_dir=cache_dir
+    )
+    AutoTokenizer.from_pretrained(tokenizer_name_or_path or model_name_or_path, cache_dir=cache_dir).save_pretrained(output_dir)
+
+    with open(os.path.join(output_dir, _EXPORT_METADATA), "w") as f:
+        json.dump({
+            "source": str(model_name_or_path),
+            "tokenizer": str(tokenizer_name_or_path or model_name_or_path),
+            "graphs": sorted(name for name in os.listdir(output_dir) if name.endswith(".onnx")),
+        }, f, indent=2)
+
+
+def check_parity(reference: InferenceBackend, candidate: InferenceBackend, model_inputs: List[str],
+                 gen_kwargs: dict) -> dict:
+    """Compare the decoded outputs of two backends on the same inputs and kwargs"""
+    expected = reference.generate(model_inputs, gen_kwargs)
+    actual = candidate.generate(model_inputs, gen_kwargs)
+    mismatches = [
+        {"input": model_input, reference.name: want, candidate.name: got}
+        for model_input, want, got in zip(model_inputs, expected, actual)
+        if want != got
+    ]
+    return {
+        "samples": len(model_inputs),
+        "exact_matches": len(model_inputs) - len(mismatches),
+        "mismatches": mismatches,
+    }
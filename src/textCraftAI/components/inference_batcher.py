@@ -0,0 +1,172 @@
+import asyncio
+import bisect
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from textCraftAI.logging import logger
+from textCraftAI.entity.config_entity import InferenceBatcherConfig
+from textCraftAI.components.inference_executor import InferenceExecutor
+from textCraftAI.components.metrics import QUEUE_WAIT_SECONDS
+from textCraftAI.components.token_budget import TokenizedInput
+
+
+class _Pending:
+    __slots__ = ("model_input", "future", "enqueued_at")
+
+    def __init__(self, model_input: Union[str, TokenizedInput], future: asyncio.Future):
+        self.model_input = model_input
+        self.future = future
+        self.enqueued_at = time.perf_counter()
+
+
+class InferenceBatcher:
+    """Collects concurrent summarize/paraphrase requests into batched generate calls.
+
+    Requests are grouped by task, generation kwargs and token-length bucket so a
+    batch never mixes decoding settings and pads little. A group is flushed when
+    it reaches ``max_batch_size`` or when its oldest request has waited
+    ``max_wait_ms``, whichever comes first.
+    """
+
+    def __init__(self, config: InferenceBatcherConfig, predictor: Any, executor: InferenceExecutor):
+        self.config = config
+        self.predictor = predictor
+        self.executor = executor
+        self.length_buckets = sorted(int(b) for b in config.length_buckets)
+
+        self._groups: Dict[Tuple, List[_Pending]] = {}
+        self._timers: Dict[Tuple, asyncio.TimerHandle] = {}
+        self._stats = _BatcherStats()
+
+    async def summarize(self, text: str) -> str:
+        """Summarize ``text`` as part of the next summarization batch"""
+        # Tokenizing may trigger a model load on first use, keep it off the event loop.
+        # This is also the admission point: a full executor rejects the request here.
+        model_input, gen_kwargs = await self.executor.run(self.predictor.prepare_summarization, text)
+        return await self.submit("summarization", model_input, gen_kwargs)
+
+    async def paraphrase(self, text: str, length_factor: float = 1.0, seed: Optional[int] = None,
+                         truncate: bool = False) -> str:
+        """Paraphrase ``text`` as part of the next paraphrase batch"""
+        model_input, gen_kwargs = await self.executor.run(
+            self.predictor.prepare_paraphrase, text, length_factor, seed, truncate
+        )
+        return await self.submit("paraphrase", model_input, gen_kwargs)
+
+    async def submit(self, task: str, model_input: Union[str, TokenizedInput], gen_kwargs: dict) -> str:
+        """Queue a prepared input and wait for its generated text"""
+        loop = asyncio.get_running_loop()
+        if isinstance(model_input, TokenizedInput):
+            # Tokenized when it was prepared (and admitted by the executor)
+            num_tokens = len(model_input)
+        else:
+            # Tokenizing may trigger a model load on first use, keep it off the event loop.
+            # This is also the admission point: a full executor rejects the request here.
+            num_tokens = await self.executor.run(self.predictor.count_tokens, task, model_input)
+        bucket = self._bucket_for(num_tokens)
+        key = (task, bucket, tuple(sorted(gen_kwargs.items())))
+
+        pending = _Pending(model_input, loop.create_future())
+        group = self._groups.setdefault(key, [])
+        group.append(pending)
+
+        if len(group) >= self.config.max_batch_size:
+            self._flush(key)
+        elif len(group) == 1:
+            self._timers[key] = loop.call_later(self.config.max_wait_ms / 1000, self._flush, key)
+
+        return await pending.future
+
+    def stats(self) -> dict:
+        return self._stats.snapshot()
+
+    def _bucket_for(self, num_tokens: int) -> int:
+        index = bisect.bisect_left(self.length_buckets, num_tokens)
+        if index == len(self.length_buckets):
+            # Longer than the largest bucket, inputs never exceed the encoder window anyway
+            return self.length_buckets[-1] if self.length_buckets else 0
+        return self.length_buckets[index]
+
+    def _flush(self, key: Tuple):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._groups.pop(key, None)
+        if batch:
+            asyncio.get_running_loop().create_task(self._run_batch(key, batch))
+
+    async def _run_batch(self, key: Tuple, batch: List[_Pending]):
+        task, bucket, kwargs_items = key
+        started = time.perf_counter()
+        waits = [started - pending.enqueued_at for pending in batch]
+        for wait in waits:
+            QUEUE_WAIT_SECONDS.observe(wait, "batcher")
+
+        try:
+            # Every request in the batch was already admitted, so never reject the batch itself
+            results = await self.executor.run(
+                self.predictor.generate_batch, task,
+                [pending.model_input for pending in batch], dict(kwargs_items),
+                bypass_limit=True
+            )
+        except Exception as e:
+            logger.exception(f"Batched {task} generation failed for {len(batch)} requests: {e}")
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+            return
+
+        self._stats.record(task, bucket, len(batch), waits, time.perf_counter() - started)
+        for pending, result in zip(batch, results):
+            if not pending.future.done():
+                pending.future.set_result(result)
+
+
+class _BatcherStats:
+    """Rolling counters for batch size, queue wait and per-bucket throughput"""
+
+    def __init__(self, window: int = 1000):
+        self.batch_sizes: Dict[int, int] = {}
+        self.waits = deque(maxlen=window)
+        self.buckets: Dict[Tuple[str, int], Dict[str, float]] = {}
+        self.total_batches = 0
+        self.total_requests = 0
+
+    def record(self, task: str, bucket: int, batch_size: int, waits: List[float], seconds: float):
+        self.total_batches += 1
+        self.total_requests += batch_size
+        self.batch_sizes[batch_size] = self.batch_sizes.get(batch_size, 0) + 1
+        self.waits.extend(waits)
+
+        counters = self.buckets.setdefault((task, bucket), {"batches": 0, "requests": 0, "busy_seconds": 0.0})
+        counters["batches"] += 1
+        counters["requests"] += batch_size
+        counters["busy_seconds"] += seconds
+
+    def snapshot(self) -> dict:
+        waits_ms = sorted(wait * 1000 for wait in self.waits)
+
+        def percentile(q: float) -> Optional[float]:
+            if not waits_ms:
+                return None
+            return round(waits_ms[min(len(waits_ms) - 1, int(q * len(waits_ms)))], 2)
+
+        return {
+            "total_batches": self.total_batches,
+            "total_requests": self.total_requests,
+            "mean_batch_size": round(self.total_requests / self.total_batches, 2) if self.total_batches else None,
+            "batch_size_histogram": dict(sorted(self.batch_sizes.items())),
+            "queue_wait_ms": {"p50": percentile(0.5), "p99": percentile(0.99), "max": percentile(1.0)},
+            "buckets": [
+                {
+                    "task": task,
+                    "max_tokens": bucket,
+                    "batches": counters["batches"],
+                    "requests": counters["requests"],
+                    "requests_per_second": round(counters["requests"] / counters["busy_seconds"], 2)
+                    if counters["busy_seconds"] else None,
+                }
+                for (task, bucket), counters in sorted(self.buckets.items())
+            ],
+        }
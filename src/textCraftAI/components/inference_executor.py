@@ -0,0 +1,98 @@
+import asyncio
+import math
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from textCraftAI.entity.config_entity import InferenceExecutorConfig
+from textCraftAI.components.metrics import QUEUE_WAIT_SECONDS
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when the inference queue is full; callers should retry after ``retry_after`` seconds"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Inference queue is full, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class InferenceExecutor:
+    """Bounded thread pool that runs blocking model calls off the event loop.
+
+    At most ``max_workers`` calls run at once and at most ``max_queue_depth``
+    more may wait. Anything beyond that is rejected immediately with
+    ``ExecutorSaturatedError`` instead of piling up behind slow generations.
+    """
+
+    def __init__(self, config: InferenceExecutorConfig):
+        self.config = config
+        self.capacity = config.max_workers + config.max_queue_depth
+
+        self._pool = ThreadPoolExecutor(max_workers=config.max_workers, thread_name_prefix="inference")
+        self._lock = threading.Lock()
+        self._pending = 0  # queued + running
+        self._active = 0
+        self._completed = 0
+        self._rejected = 0
+        self._mean_task_seconds = 0.0
+
+    def submit(self, fn: Callable, *args: Any, bypass_limit: bool = False) -> Future:
+        """Schedule ``fn(*args)``; raises ``ExecutorSaturatedError`` when the queue is full
+
+        Work belonging to already admitted requests (e.g. a batch collected by
+        the batcher) passes ``bypass_limit=True`` so it is never dropped.
+        """
+        with self._lock:
+            if not bypass_limit and self._pending >= self.capacity:
+                self._rejected += 1
+                raise ExecutorSaturatedError(self._retry_after())
+            self._pending += 1
+        submitted = time.perf_counter()
+
+        def _run():
+            with self._lock:
+                self._active += 1
+            started = time.perf_counter()
+            QUEUE_WAIT_SECONDS.observe(started - submitted, "executor")
+            try:
+                return fn(*args)
+            finally:
+                elapsed = time.perf_counter() - started
+                with self._lock:
+                    self._active -= 1
+                    self._pending -= 1
+                    self._completed += 1
+                    # Exponential moving average, used to estimate Retry-After
+                    self._mean_task_seconds += 0.1 * (elapsed - self._mean_task_seconds)
+
+        try:
+            return self._pool.submit(_run)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+
+    async def run(self, fn: Callable, *args: Any, bypass_limit: bool = False) -> Any:
+        """Await ``fn(*args)`` on the pool without blocking the event loop"""
+        return await asyncio.wrap_future(self.submit(fn, *args, bypass_limit=bypass_limit))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_workers": self.config.max_workers,
+                "max_queue_depth": self.config.max_queue_depth,
+                "active_workers": self._active,
+                "queue_depth": self._pending - self._active,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "mean_task_seconds": round(self._mean_task_seconds, 3),
+            }
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _retry_after(self) -> int:
+        # Caller holds self._lock; time for the current backlog to drain
+        backlog_rounds = self._pending / max(1, self.config.max_workers)
+        return max(1, math.ceil(backlog_rounds * self._mean_task_seconds))
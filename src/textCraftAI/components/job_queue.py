@@ -0,0 +1,218 @@
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from textCraftAI.logging import logger
+from textCraftAI.entity.config_entity import JobQueueConfig
+
+
+JOB_STATUSES = ("queued", "running", "succeeded", "failed")
+
+# Columns returned by ``JobStore.get``; the uploaded file itself is only read by workers
+_PUBLIC_COLUMNS = (
+    "id", "status", "operation", "filename", "length_factor", "seed", "attempts", "max_attempts",
+    "error", "result", "created_at", "started_at", "finished_at",
+)
+
+
+class JobStore:
+    """SQLite-backed queue of file-processing jobs shared by the API and worker processes.
+
+    A job is ``queued`` until a worker claims it, ``running`` while the worker
+    holds its lease and ``succeeded`` or ``failed`` once done. Workers renew the
+    lease while they process; a job whose lease runs out (its worker died) is
+    claimable again. Failed attempts are retried after a linear backoff until
+    ``max_attempts`` is reached. The uploaded file is stored with the job and
+    dropped once it finishes; finished jobs are deleted after
+    ``result_ttl_hours``.
+    """
+
+    def __init__(self, config: JobQueueConfig):
+        self.config = config
+        self.db_path = os.path.join(config.root_dir, "jobs.sqlite3")
+        self._local = threading.local()
+        os.register_at_fork(after_in_child=self._after_fork)
+
+        with self._transaction() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "id TEXT PRIMARY KEY, status TEXT NOT NULL, operation TEXT NOT NULL, filename TEXT NOT NULL, "
+                "length_factor REAL, seed INTEGER, payload BLOB, attempts INTEGER NOT NULL DEFAULT 0, "
+                "max_attempts INTEGER NOT NULL, error TEXT, result TEXT, worker TEXT, "
+                "created_at REAL, started_at REAL, finished_at REAL, available_at REAL, lease_expires_at REAL)"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if "content_sha256" not in columns:
+                # Databases created before uploads were hashed
+                conn.execute("ALTER TABLE jobs ADD COLUMN content_sha256 TEXT")
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (status, available_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_finished ON jobs (finished_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_content ON jobs (content_sha256)")
+
+    def submit(self, file_content: bytes, filename: str, operation: str, length_factor: float = 1.0,
+               seed: Optional[int] = None, content_sha256: Optional[str] = None) -> Dict[str, str]:
+        """Queue a file for processing and return the job's ``id`` and ``status``
+
+        With ``content_sha256``, resubmitting the same file with the same
+        parameters while an earlier job is pending or succeeded returns that
+        job instead of queueing a duplicate.
+        """
+        now = time.time()
+        extension = os.path.splitext(filename.lower())[1]
+        with self._transaction() as conn:
+            if content_sha256 is not None:
+                for job_id, status, other_filename in conn.execute(
+                    "SELECT id, status, filename FROM jobs WHERE content_sha256 = ? AND operation = ? "
+                    "AND length_factor IS ? AND seed IS ? AND status != 'failed' ORDER BY created_at DESC",
+                    (content_sha256, operation, length_factor, seed),
+                ):
+                    # The extension picks the extractor, so it is part of what makes two jobs equal
+                    if os.path.splitext(other_filename.lower())[1] == extension:
+                        return {"id": job_id, "status": status}
+
+            job_id = uuid.uuid4().hex
+            conn.execute(
+                "INSERT INTO jobs (id, status, operation, filename, length_factor, seed, payload, content_sha256, "
+                "max_attempts, created_at, available_at) VALUES (?, 'queued', ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, operation, filename, length_factor, seed, sqlite3.Binary(file_content), content_sha256,
+                 self.config.max_attempts, now, now),
+            )
+        return {"id": job_id, "status": "queued"}
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connection().execute(
+            f"SELECT {', '.join(_PUBLIC_COLUMNS)} FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        return dict(zip(_PUBLIC_COLUMNS, row)) if row is not None else None
+
+    def claim(self, worker: str) -> Optional[Dict[str, Any]]:
+        """Take the oldest runnable job (including ones whose lease expired) or return None"""
+        now = time.time()
+        with self._transaction() as conn:
+            # A job whose worker died on every attempt (OOM, segfault) never reached fail(); stop retrying it
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'failed', error = 'worker died', payload = NULL, finished_at = ?, "
+                "lease_expires_at = NULL WHERE status = 'running' AND lease_expires_at < ? "
+                "AND attempts >= max_attempts",
+                (now, now),
+            )
+            if cursor.rowcount:
+                logger.info(f"Failed {cursor.rowcount} jobs whose worker died on their last attempt")
+            row = conn.execute(
+                "SELECT id, operation, filename, length_factor, seed, payload, content_sha256, attempts FROM jobs "
+                "WHERE (status = 'queued' AND available_at <= ?) "
+                "OR (status = 'running' AND lease_expires_at < ? AND attempts < max_attempts) "
+                "ORDER BY created_at LIMIT 1",
+                (now, now),
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE jobs SET status = 'running', worker = ?, attempts = attempts + 1, "
+                    "started_at = ?, lease_expires_at = ? WHERE id = ?",
+                    (worker, now, now + self.config.lease_seconds, row[0]),
+                )
+
+        if row is None:
+            return None
+        job_id, operation, filename, length_factor, seed, payload, content_sha256, attempts = row
+        return {
+            "id": job_id,
+            "operation": operation,
+            "filename": filename,
+            "length_factor": length_factor,
+            "seed": seed,
+            "file_content": bytes(payload),
+            "content_sha256": content_sha256,
+            "attempt": attempts + 1,
+        }
+
+    def heartbeat(self, job_id: str, worker: str) -> bool:
+        """Extend the lease of a running job; False if the worker no longer owns it"""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires_at = ? WHERE id = ? AND worker = ? AND status = 'running'",
+                (time.time() + self.config.lease_seconds, job_id, worker),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: str, worker: str, result: str):
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'succeeded', result = ?, error = NULL, payload = NULL, "
+                "finished_at = ?, lease_expires_at = NULL WHERE id = ? AND worker = ? AND status = 'running'",
+                (result, time.time(), job_id, worker),
+            )
+
+    def fail(self, job_id: str, worker: str, error: str, retryable: bool = True) -> bool:
+        """Record a failed attempt; returns True if the job was queued for another attempt"""
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM jobs WHERE id = ? AND worker = ? AND status = 'running'",
+                (job_id, worker)
+            ).fetchone()
+            if row is None:
+                return False
+            attempts, max_attempts = row
+            if retryable and attempts < max_attempts:
+                conn.execute(
+                    "UPDATE jobs SET status = 'queued', error = ?, available_at = ?, lease_expires_at = NULL "
+                    "WHERE id = ? AND worker = ?",
+                    (error, now + self.config.retry_backoff_seconds * attempts, job_id, worker),
+                )
+                return True
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', error = ?, payload = NULL, finished_at = ?, "
+                "lease_expires_at = NULL WHERE id = ? AND worker = ?",
+                (error, now, job_id, worker),
+            )
+            return False
+
+    def cleanup(self) -> int:
+        """Delete finished jobs older than ``result_ttl_hours``; returns how many were removed"""
+        cutoff = time.time() - self.config.result_ttl_hours * 3600
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "DELETE FROM jobs WHERE status IN ('succeeded', 'failed') AND finished_at < ?", (cutoff,)
+            )
+        if cursor.rowcount:
+            logger.info(f"Removed {cursor.rowcount} expired jobs")
+        return cursor.rowcount
+
+    def stats(self) -> dict:
+        counts = dict(self._connection().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+        return {status: counts.get(status, 0) for status in JOB_STATUSES}
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # BEGIN IMMEDIATE takes the write lock up front, so two workers never claim the same job
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _after_fork(self):
+        # A forked child (e.g. a serve.py worker) opens its own connections. The
+        # inherited ones are kept open, closing them could drop the parent's locks.
+        self._inherited_local = self._local
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread; WAL lets the API read while a worker writes
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(self.config.root_dir, exist_ok=True)
+            # Autocommit mode, writes use explicit transactions from ``_transaction``
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
@@ -0,0 +1,210 @@
+import json
+import os
+import random
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from torch.utils.data import DataLoader, Sampler
+from transformers import Trainer, TrainerCallback
+
+from textCraftAI.logging import logger
+
+
+def example_lengths(dataset: Any, column: str, ids_column: str) -> List[int]:
+    """Token counts of every example, from the column DataTransformation stores (or counted from the ids)"""
+    if column in dataset.column_names:
+        return list(dataset[column])
+    return [len(ids) for ids in dataset[ids_column]]
+
+
+def padded_tokens(batch: Sequence[int], input_lengths: Sequence[int], label_lengths: Sequence[int]) -> int:
+    """Encoder plus decoder tokens of ``batch`` once padded to its longest input and label"""
+    return len(batch) * (max(input_lengths[i] for i in batch) + max(label_lengths[i] for i in batch))
+
+
+def padding_stats(batches: Sequence[Sequence[int]], input_lengths: Sequence[int],
+                  label_lengths: Sequence[int]) -> Dict[str, float]:
+    """How much of the padded batches is real tokens"""
+    real = sum(input_lengths[i] + label_lengths[i] for batch in batches for i in batch)
+    padded = sum(padded_tokens(batch, input_lengths, label_lengths) for batch in batches)
+    return {
+        "batches": len(batches),
+        "mean_examples_per_batch": round(sum(map(len, batches)) / max(1, len(batches)), 2),
+        "mean_tokens_per_batch": round(real / max(1, len(batches)), 1),
+        "padding_efficiency": round(real / padded, 4) if padded else None,
+    }
+
+
+def matched_accumulation_steps(batches: Sequence[Sequence[int]], examples_per_step: int) -> int:
+    """Gradient accumulation steps that give ``batches`` about ``examples_per_step`` examples per optimizer step"""
+    mean_batch_size = sum(map(len, batches)) / max(1, len(batches))
+    return max(1, round(examples_per_step / mean_batch_size)) if mean_batch_size else 1
+
+
+class TokenBudgetBatchSampler(Sampler):
+    """Batches of similar-length examples holding at most ``max_tokens`` padded tokens each.
+
+    Examples are sorted by input length (then label length and index) and
+    packed greedily once, so each batch pads little and the number of batches
+    is the same every epoch; only the order of the batches is shuffled. An
+    example longer than the budget on its own forms a batch by itself.
+    """
+
+    def __init__(self, input_lengths: Sequence[int], label_lengths: Sequence[int], max_tokens: int,
+                 max_batch_size: int = 0, shuffle: bool = True, seed: int = 42):
+        self.input_lengths = list(input_lengths)
+        self.label_lengths = list(label_lengths)
+        self.max_tokens = max_tokens
+        self.max_batch_size = max_batch_size
+        self.shuffle = shuffle
+        self.seed = seed
+        self.epoch = 0
+        self._batches = self._pack()
+
+    def set_epoch(self, epoch: int):
+        self.epoch = epoch
+
+    def batches(self, epoch: int) -> List[List[int]]:
+        batches = [list(batch) for batch in self._batches]
+        if self.shuffle:
+            random.Random(self.seed + epoch).shuffle(batches)
+        return batches
+
+    def _pack(self) -> List[List[int]]:
+        order = sorted(range(len(self.input_lengths)), key=lambda i: (self.input_lengths[i], self.label_lengths[i], i))
+        batches, batch = [], []
+        max_input = max_label = 0
+        for i in order:
+            candidate_input = max(max_input, self.input_lengths[i])
+            candidate_label = max(max_label, self.label_lengths[i])
+            full = self.max_batch_size and len(batch) >= self.max_batch_size
+            if batch and (full or (len(batch) + 1) * (candidate_input + candidate_label) > self.max_tokens):
+                batches.append(batch)
+                batch = []
+                candidate_input, candidate_label = self.input_lengths[i], self.label_lengths[i]
+            batch.append(i)
+            max_input, max_label = candidate_input, candidate_label
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def __iter__(self) -> Iterator[List[int]]:
+        batches = self.batches(self.epoch)
+        # Trainer only sets the epoch through the data loader in some versions; advance it ourselves too
+        self.epoch += 1
+        return iter(batches)
+
+    def __len__(self) -> int:
+        return len(self._batches)
+
+
+class TokenCounter:
+    """Real (non-padding) encoder and label tokens the trainer has trained on"""
+
+    def __init__(self):
+        self.tokens = 0
+
+
+class ThroughputCallback(TrainerCallback):
+    """Logs optimizer step time and real tokens per second, and writes a summary when training ends
+
+    Time spent evaluating and saving checkpoints is left out. Run once with
+    token-budget batching and once without to compare the two setups.
+    """
+
+    def __init__(self, counter: TokenCounter, mode: str, report_file: str,
+                 padding: Optional[Dict[str, Dict[str, float]]] = None):
+        self.counter = counter
+        self.mode = mode
+        self.report_file = report_file
+        self.padding = padding or {}
+        self._step_seconds: List[float] = []
+        self._started = 0.0
+        self._last = 0.0
+        self._paused = 0.0
+        self._window = (0.0, 0.0, 0)  # start time, paused seconds and tokens when the logging window opened
+
+    def on_train_begin(self, args, state, control, **kwargs):
+        self._started = self._last = time.perf_counter()
+        self._window = (self._started, 0.0, self.counter.tokens)
+
+    def on_step_end(self, args, state, control, **kwargs):
+        now = time.perf_counter()
+        self._step_seconds.append(now - self._last)
+        self._last = now
+        if args.logging_steps and state.global_step % args.logging_steps == 0:
+            window_started, window_paused, window_tokens = self._window
+            seconds = now - window_started - (self._paused - window_paused)
+            tokens = self.counter.tokens - window_tokens
+            logger.info(f"[{self.mode}] step {state.global_step}: {seconds / args.logging_steps:.2f}s/step, "
+                        f"{tokens / seconds if seconds else 0:.0f} tokens/sec")
+            self._window = (now, self._paused, self.counter.tokens)
+
+    def on_evaluate(self, args, state, control, **kwargs):
+        self._pause()
+
+    def on_save(self, args, state, control, **kwargs):
+        self._pause()
+
+    def on_train_end(self, args, state, control, **kwargs):
+        seconds = time.perf_counter() - self._started - self._paused
+        steps = sorted(self._step_seconds)
+        report = {
+            "mode": self.mode,
+            "steps": len(steps),
+            "train_seconds": round(seconds, 1),
+            "mean_step_seconds": round(sum(steps) / len(steps), 3) if steps else None,
+            "median_step_seconds": round(steps[len(steps) // 2], 3) if steps else None,
+            "tokens": self.counter.tokens,
+            "tokens_per_second": round(self.counter.tokens / seconds, 1) if seconds else None,
+            "padding": self.padding,
+        }
+        logger.info(f"[{self.mode}] training throughput: {json.dumps(report)}")
+
+        # One entry per mode, so the latest run of each setup can be compared side by side
+        reports = {}
+        if os.path.exists(self.report_file):
+            with open(self.report_file) as f:
+                reports = json.load(f)
+        reports[self.mode] = report
+        with open(self.report_file, "w") as f:
+            json.dump(reports, f, indent=2)
+
+    def _pause(self):
+        # Everything since the last optimizer step was evaluation or checkpointing, not training
+        now = time.perf_counter()
+        self._paused += now - self._last
+        self._last = now
+
+
+class TokenCountingTrainer(Trainer):
+    """Trainer that adds the real tokens of every training batch to ``token_counter``"""
+
+    def __init__(self, *args, token_counter: TokenCounter, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.token_counter = token_counter
+
+    def training_step(self, model, inputs, *args, **kwargs):
+        tokens = int(inputs["attention_mask"].sum())
+        if "labels" in inputs:
+            tokens += int((inputs["labels"] != -100).sum())
+        self.token_counter.tokens += tokens
+        return super().training_step(model, inputs, *args, **kwargs)
+
+
+class TokenBudgetTrainer(TokenCountingTrainer):
+    """Trainer whose training batches come from a ``TokenBudgetBatchSampler``"""
+
+    def __init__(self, *args, batch_sampler: TokenBudgetBatchSampler, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batch_sampler = batch_sampler
+
+    def get_train_dataloader(self) -> DataLoader:
+        train_dataset = self._remove_unused_columns(self.train_dataset, description="training")
+        return self.accelerator.prepare(DataLoader(
+            train_dataset,
+            batch_sampler=self.batch_sampler,
+            collate_fn=self.data_collator,
+            num_workers=self.args.dataloader_num_workers,
+            pin_memory=self.args.dataloader_pin_memory,
+        ))
@@ -1,74 +1,187 @@
 from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
 from datasets import load_dataset, load_from_disk
+import hashlib
+import json
+import os
+import time
 import torch
 import pandas as pd
 from tqdm import tqdm
+from typing import Dict, List, Optional
 from textCraftAI.entity.config_entity import ModelEvaluationConfig
-import evaluate
+from textCraftAI.components.rouge_scoring import ROUGE_TYPES, score_examples, slice_scores, summarize
+from textCraftAI.logging import logger
+
+
+# Decoding used for every evaluation summary
+GEN_KWARGS = {"length_penalty": 0.8, "num_beams": 8, "max_length": 128}
+
 
 class ModelEvaluation:
     def __init__(self, config: ModelEvaluationConfig):  # Fixed __init__
         self.config = config
-    
+        # Throughput of the last generate_predictions call
+        self.generation_stats: Dict[str, float] = {}
+
     def generate_batch_sized_chunks(self, list_of_elements, batch_size):
         """split the dataset into smaller batches that we can process simultaneously
         Yield successive batch-sized chunks from list_of_elements."""
         for i in range(0, len(list_of_elements), batch_size):
             yield list_of_elements[i : i + batch_size]
-    
-    def calculate_metric_on_test_ds(self, dataset, metric, model, tokenizer, 
-                               batch_size=16, device="cuda" if torch.cuda.is_available() else "cpu", 
-                               column_text="dialogue",  
-                               column_summary="summary"):
-        article_batches = list(self.generate_batch_sized_chunks(dataset[column_text], batch_size))
-        target_batches = list(self.generate_batch_sized_chunks(dataset[column_summary], batch_size))
-        
-        for article_batch, target_batch in tqdm(
-            zip(article_batches, target_batches), total=len(article_batches)):
-            
-            inputs = tokenizer(article_batch, max_length=1024, truncation=True, 
-                            padding="max_length", return_tensors="pt")
-            
-            summaries = model.generate(input_ids=inputs["input_ids"].to(device),
-                            attention_mask=inputs["attention_mask"].to(device), 
-                            length_penalty=0.8, num_beams=8, max_length=128)
-            
-            # Finally, we decode the generated texts, 
-            # replace the token, and add the decoded texts with the references to the metric.
-            decoded_summaries = [tokenizer.decode(s, skip_special_tokens=True, 
-                                    clean_up_tokenization_spaces=True) 
-                for s in summaries]      
-            
-            decoded_summaries = [d.replace("", " ") for d in decoded_summaries]
-            
-            metric.add_batch(predictions=decoded_summaries, references=target_batch)
-            
-        # Finally compute and return the ROUGE scores.
-        score = metric.compute()
-        return score
-    
+
+    def generate_predictions(self, texts: List[str], model, tokenizer, batch_size: int = 16,
+                             device: str = "cpu", predictions_file: Optional[str] = None) -> List[str]:
+        """Summarize ``texts`` in batches of similar length, padded only to their longest input
+
+        With ``predictions_file``, every finished batch is appended to it, and a
+        later call for the same model, inputs and settings skips the examples
+        already there, so an interrupted evaluation resumes where it stopped.
+        """
+        input_ids = tokenizer(texts, max_length=self.config.max_input_length, truncation=True)["input_ids"]
+        predictions: Dict[int, str] = {}
+        checkpoint = None
+        if predictions_file:
+            run_key = self._run_key(model, texts)
+            predictions = self._load_predictions(predictions_file, run_key)
+            checkpoint = open(predictions_file, "a", encoding="utf-8")
+            if checkpoint.tell() == 0:
+                checkpoint.write(json.dumps({"run": run_key}) + "\n")
+            if predictions:
+                logger.info(f"Resuming evaluation: {len(predictions)} of {len(texts)} predictions already done")
+
+        # Longest first, so similar lengths share a batch and memory peaks at the start
+        remaining = sorted((i for i in range(len(texts)) if i not in predictions), key=lambda i: -len(input_ids[i]))
+        generated_tokens = 0
+        seconds = 0.0
+        model.eval()
+        try:
+            for batch in tqdm(list(self.generate_batch_sized_chunks(remaining, batch_size))):
+                inputs = tokenizer.pad({"input_ids": [input_ids[i] for i in batch]}, return_tensors="pt")
+
+                started = time.perf_counter()
+                with torch.inference_mode():
+                    summaries = model.generate(input_ids=inputs["input_ids"].to(device),
+                                               attention_mask=inputs["attention_mask"].to(device), **GEN_KWARGS)
+                seconds += time.perf_counter() - started
+                generated_tokens += int((summaries != tokenizer.pad_token_id).sum())
+
+                decoded_summaries = tokenizer.batch_decode(summaries, skip_special_tokens=True,
+                                                           clean_up_tokenization_spaces=True)
+                for i, summary in zip(batch, decoded_summaries):
+                    predictions[i] = summary
+                if checkpoint is not None:
+                    checkpoint.write("".join(
+                        json.dumps({"index": i, "prediction": summary}) + "\n"
+                        for i, summary in zip(batch, decoded_summaries)
+                    ))
+                    checkpoint.flush()
+                    os.fsync(checkpoint.fileno())
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+
+        # Only examples generated in this call count towards throughput
+        generated = len(remaining)
+        self.generation_stats = {
+            "examples": len(texts),
+            "generated_examples": generated,
+            "generation_seconds": round(seconds, 2),
+            "examples_per_second": round(generated / seconds, 3) if seconds else None,
+            "tokens_per_second": round(generated_tokens / seconds, 1) if seconds else None,
+        }
+        return [predictions[i] for i in range(len(texts))]
+
+    def calculate_metric_on_test_ds(self, dataset, model, tokenizer,
+                               batch_size=16, device="cuda" if torch.cuda.is_available() else "cpu",
+                               column_text="dialogue",
+                               column_summary="summary",
+                               predictions_file=None) -> pd.DataFrame:
+        """Generate a summary for every example and score it; one row of ROUGE F-measures per example"""
+        texts = list(dataset[column_text])
+        references = list(dataset[column_summary])
+        predictions = self.generate_predictions(texts, model, tokenizer, batch_size, device, predictions_file)
+
+        scores = score_examples(predictions, references, num_proc=self.config.rouge_num_proc)
+        frame = pd.DataFrame(scores, columns=list(ROUGE_TYPES))
+        frame.insert(0, "index", range(len(texts)))
+        # Lengths to slice the scores by later, without generating or scoring again
+        frame["dialogue_words"] = [len(text.split()) for text in texts]
+        frame["summary_words"] = [len(text.split()) for text in references]
+        frame["prediction_words"] = [len(text.split()) for text in predictions]
+        columns = dataset.column_names if hasattr(dataset, "column_names") else list(dataset)
+        if "input_length" in columns:
+            frame["dialogue_tokens"] = list(dataset["input_length"])
+        return frame
+
     def evaluate(self):
         device = "cuda" if torch.cuda.is_available() else "cpu"
         tokenizer = AutoTokenizer.from_pretrained(self.config.tokenizer_path)
         model_pegasus = AutoModelForSeq2SeqLM.from_pretrained(self.config.model_path).to(device)
-       
-        # Loading data 
+
+        # Loading data
         dataset_dialogsum_pt = load_from_disk(self.config.data_path)  # Fixed variable name
-        rouge_names = ["rouge1", "rouge2", "rougeL", "rougeLsum"]
-  
-        # Updated for newer versions of evaluate library
-        try:
-            rouge_metric = evaluate.load('rouge')
-        except:
-            # Fallback for older versions
-            from datasets import load_metric
-            rouge_metric = load_metric('rouge')
-        
-        score = self.calculate_metric_on_test_ds(
-            dataset_dialogsum_pt['test'][0:10], rouge_metric, model_pegasus, tokenizer, 
-            batch_size=2, column_text='dialogue', column_summary='summary'
+
+        test_dataset = dataset_dialogsum_pt['test']
+        if self.config.max_samples:
+            test_dataset = test_dataset.select(range(min(self.config.max_samples, len(test_dataset))))
+        example_scores = self.calculate_metric_on_test_ds(
+            test_dataset, model_pegasus, tokenizer,
+            batch_size=self.config.batch_size, device=device, column_text='dialogue', column_summary='summary',
+            predictions_file=self.config.predictions_file
         )
-        
-        rouge_dict = dict((rn, score[rn].mid.fmeasure) for rn in rouge_names)
+
+        example_scores.to_csv(self.config.example_scores_file, index=False)
+        logger.info(f"ROUGE by dialogue length:\n{slice_scores(example_scores, 'dialogue_words').to_string()}")
+
+        # Mean over the test split with bootstrap confidence bounds
+        rouge_dict = summarize(example_scores, self.config.bootstrap_resamples, self.config.confidence_level)
+        # Throughput next to quality, so a faster but worse model is visible in one place
+        rouge_dict.update(self.generation_stats)
+        logger.info(f"Evaluation on {len(test_dataset)} test examples: {rouge_dict}")
         df = pd.DataFrame(rouge_dict, index=['pegasus'])
-        df.to_csv(self.config.metric_file_name, index=False)
\ No newline at end of file
+        df.to_csv(self.config.metric_file_name, index=False)
+
+    def _run_key(self, model, texts: List[str]) -> str:
+        """Identifies the model weights, inputs and settings a predictions file belongs to"""
+        digest = hashlib.sha256()
+        source = getattr(model.config, "_name_or_path", "")
+        digest.update(str(source).encode("utf-8"))
+        if os.path.isdir(source):
+            # Retraining into the same directory changes the files' sizes and times
+            for name in sorted(os.listdir(source)):
+                stat = os.stat(os.path.join(source, name))
+                digest.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns}".encode("utf-8"))
+        digest.update(json.dumps([GEN_KWARGS, self.config.max_input_length], sort_keys=True).encode("utf-8"))
+        for text in texts:
+            digest.update(text.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()[:16]
+
+    def _load_predictions(self, predictions_file: str, run_key: str) -> Dict[int, str]:
+        """Predictions already in ``predictions_file`` for ``run_key``; anything else is discarded"""
+        if not os.path.exists(predictions_file):
+            return {}
+        predictions = {}
+        good_bytes = 0
+        with open(predictions_file, "rb") as f:
+            for number, line in enumerate(f):
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A batch cut off mid-write; everything from here on is rewritten
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                if number == 0:
+                    if record.get("run") != run_key:
+                        logger.info(f"{predictions_file} belongs to another model or test set, starting over")
+                        good_bytes = 0
+                        break
+                else:
+                    predictions[record["index"]] = record["prediction"]
+                good_bytes += len(line)
+        with open(predictions_file, "r+b") as f:
+            f.truncate(good_bytes)
+        if good_bytes == 0:
+            return {}
+        return predictions
@@ -0,0 +1,112 @@
+import json
+import os
+import time
+from typing import Any, Optional
+
+from textCraftAI.logging import logger
+from textCraftAI.entity.config_entity import ModelQuantizationConfig
+
+
+QUANTIZATION_MODES = ("none", "dynamic_int8")
+
+_WEIGHTS_FILE = "quantized_state_dict.pt"
+_METADATA_FILE = "quantization.json"
+
+
+def quantize_dynamic_int8(model: Any, inplace: bool = False) -> Any:
+    """Quantize every ``nn.Linear`` of ``model`` to int8
+
+    Weights are quantized once, activations per call (dynamic quantization), so
+    no calibration data is needed. Quantized layers only run on CPU. Unless
+    ``inplace`` is set, a quantized copy is returned and ``model`` is kept.
+    """
+    import torch
+
+    model = model.to("cpu").eval()
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=inplace)
+
+
+class ModelQuantizer:
+    """Applies the configured quantization mode to models as the registry loads them.
+
+    A pre-quantized artifact under ``quantized_model_dir/<task>`` is used when it
+    was built from the same source model with the same quantized engine; otherwise
+    the fp32 weights are loaded and quantized at load time.
+    """
+
+    def __init__(self, config: ModelQuantizationConfig):
+        if config.mode not in QUANTIZATION_MODES:
+            raise ValueError(f"Unknown quantization mode '{config.mode}', expected one of {QUANTIZATION_MODES}")
+        self.config = config
+
+    def applies_to(self, task: str) -> bool:
+        return self.config.mode != "none" and task in self.config.tasks
+
+    def artifact_dir(self, task: str) -> str:
+        return os.path.join(self.config.quantized_model_dir, task)
+
+    def load_model(self, task: str, model_name_or_path: str, **from_pretrained_kwargs) -> Any:
+        """Load the model for ``task``, quantized when the configured mode applies to it"""
+        from transformers import AutoModelForSeq2SeqLM
+
+        if not self.applies_to(task):
+            return AutoModelForSeq2SeqLM.from_pretrained(model_name_or_path, **from_pretrained_kwargs)
+
+        model = self.load_artifact(task, model_name_or_path)
+        if model is not None:
+            return model
+
+        start = time.perf_counter()
+        model = AutoModelForSeq2SeqLM.from_pretrained(model_name_or_path, **from_pretrained_kwargs)
+        model = quantize_dynamic_int8(model, inplace=True)
+        logger.info(f"Quantized '{model_name_or_path}' to int8 in {time.perf_counter() - start:.2f}s")
+        return model
+
+    def save_artifact(self, task: str, model: Any, source: str):
+        """Store a quantized model so later loads skip the fp32 weights entirely"""
+        import torch
+
+        artifact_dir = self.artifact_dir(task)
+        os.makedirs(artifact_dir, exist_ok=True)
+        model.config.save_pretrained(artifact_dir)
+        torch.save(model.state_dict(), os.path.join(artifact_dir, _WEIGHTS_FILE))
+        with open(os.path.join(artifact_dir, _METADATA_FILE), "w") as f:
+            json.dump(self._metadata(source), f, indent=2)
+        logger.info(f"Saved int8 '{task}' model to {artifact_dir}")
+
+    def load_artifact(self, task: str, source: str) -> Optional[Any]:
+        """Load the pre-quantized model for ``task``, or None if it is missing or stale"""
+        import torch
+        from transformers import AutoConfig, AutoModelForSeq2SeqLM
+
+        artifact_dir = self.artifact_dir(task)
+        metadata_path = os.path.join(artifact_dir, _METADATA_FILE)
+        if not os.path.exists(metadata_path):
+            return None
+
+        with open(metadata_path) as f:
+            metadata = json.load(f)
+        expected = self._metadata(source)
+        # Packed int8 weights are specific to the engine (fbgemm/qnnpack) they were built with
+        if any(metadata.get(key) != expected[key] for key in ("source", "mode", "quantized_engine")):
+            logger.warning(f"Ignoring int8 artifact in {artifact_dir}, it was built for {metadata.get('source')}")
+            return None
+
+        start = time.perf_counter()
+        # Build the int8 module structure from the config, then fill it with the stored weights
+        model = AutoModelForSeq2SeqLM.from_config(AutoConfig.from_pretrained(artifact_dir))
+        model = quantize_dynamic_int8(model, inplace=True)
+        # Written by save_artifact, so fully unpickling the packed int8 params is safe
+        model.load_state_dict(torch.load(os.path.join(artifact_dir, _WEIGHTS_FILE), weights_only=False))
+        logger.info(f"Loaded int8 '{task}' model from {artifact_dir} in {time.perf_counter() - start:.2f}s")
+        return model
+
+    def _metadata(self, source: str) -> dict:
+        import torch
+
+        return {
+            "source": str(source),
+            "mode": "dynamic_int8",
+            "quantized_engine": torch.backends.quantized.engine,
+            "torch_version": torch.__version__,
+        }
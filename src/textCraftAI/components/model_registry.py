@@ -0,0 +1,252 @@
+import gc
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from textCraftAI.logging import logger
+from textCraftAI.entity.config_entity import ModelRegistryConfig
+
+
+def _iter_state(module: Any):
+    """Yield ``(name, value)`` state dict entries, flattening the packed tuples of quantized layers"""
+    for name, value in module.state_dict().items():
+        if isinstance(value, (tuple, list)):
+            for i, item in enumerate(value):
+                yield f"{name}.{i}", item
+        else:
+            yield name, value
+
+
+def _estimate_size_bytes(model: Any) -> int:
+    """Approximate resident size of a model (or pipeline wrapping one) from its tensors"""
+    if callable(getattr(model, "size_bytes", None)):
+        # Backends whose weights are not torch tensors (e.g. ONNX Runtime) report their own size
+        return model.size_bytes()
+    module = getattr(model, "model", model)
+    if not hasattr(module, "state_dict"):
+        return 0
+
+    # The state dict rather than parameters(), so int8 packed weights of quantized layers count too
+    seen = set()
+    size = 0
+    for _, tensor in _iter_state(module):
+        if not hasattr(tensor, "data_ptr"):
+            continue
+        # Tied weights share storage, count them once
+        key = tensor.data_ptr()
+        if key in seen:
+            continue
+        seen.add(key)
+        size += tensor.numel() * tensor.element_size()
+    return size
+
+
+def _fingerprint(model: Any) -> str:
+    """Stable hash of a model's architecture and weights
+
+    Hashes every tensor's name, shape and dtype plus a strided sample of its
+    values, which changes whenever the weights are retrained or swapped
+    without reading gigabytes of parameters.
+    """
+    if callable(getattr(model, "fingerprint", None)):
+        return model.fingerprint()
+    module = getattr(model, "model", model)
+    digest = hashlib.sha256()
+
+    config = getattr(module, "config", None)
+    if config is not None and hasattr(config, "to_json_string"):
+        digest.update(config.to_json_string().encode("utf-8"))
+    if hasattr(module, "state_dict"):
+        for name, tensor in _iter_state(module):
+            if not hasattr(tensor, "shape"):
+                # e.g. the dtype entry of a quantized linear layer
+                digest.update(f"{name}:{tensor}".encode("utf-8"))
+                continue
+            digest.update(f"{name}:{tuple(tensor.shape)}:{tensor.dtype}".encode("utf-8"))
+            quantized = getattr(tensor, "is_quantized", False)
+            if quantized:
+                # Sample int8 weights through their integer representation
+                tensor = tensor.int_repr()
+            flat = tensor.detach().reshape(-1)
+            if flat.numel() and (quantized or flat.dtype.is_floating_point):
+                step = max(1, flat.numel() // 64)
+                digest.update(flat[::step][:64].float().cpu().numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+class ModelRegistry:
+    """Process-wide store of loaded models shared by every prediction pipeline.
+
+    Models are registered by name with a zero-argument loader. The first call to
+    ``get`` loads the model under a per-model lock so concurrent requests never
+    load the same weights twice. When ``memory_budget_mb`` is set, the least
+    recently used models are evicted until the resident set fits the budget.
+    """
+
+    def __init__(self, config: ModelRegistryConfig):
+        self.config = config
+        self.memory_budget_bytes = int(config.memory_budget_mb) * 1024 * 1024
+
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self._load_history: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, loader: Callable[[], Any]):
+        """Register a loader for ``name``; the first registration wins"""
+        with self._lock:
+            if name not in self._loaders:
+                self._loaders[name] = loader
+                self._load_locks[name] = threading.Lock()
+
+    def is_registered(self, name: str) -> bool:
+        with self._lock:
+            return name in self._loaders
+
+    def is_resident(self, name: str) -> bool:
+        with self._lock:
+            return name in self._entries
+
+    def get(self, name: str) -> Any:
+        """Return the model registered as ``name``, loading it on first use"""
+        model = self._get_resident(name)
+        if model is not None:
+            return model
+
+        with self._lock:
+            if name not in self._loaders:
+                raise KeyError(f"Model '{name}' is not registered")
+            loader = self._loaders[name]
+            load_lock = self._load_locks[name]
+
+        with load_lock:
+            # Another thread may have finished loading while we waited
+            model = self._get_resident(name)
+            if model is not None:
+                return model
+
+            logger.info(f"Loading model '{name}'")
+            start = time.perf_counter()
+            model = loader()
+            load_seconds = time.perf_counter() - start
+            size_bytes = _estimate_size_bytes(model)
+            fingerprint = _fingerprint(model)
+
+            with self._lock:
+                now = time.time()
+                self._entries[name] = {
+                    "model": model,
+                    "size_bytes": size_bytes,
+                    "load_seconds": load_seconds,
+                    "loaded_at": now,
+                    "last_used": now,
+                }
+                history = self._load_history.setdefault(name, {"load_count": 0})
+                history["load_count"] += 1
+                history["last_load_seconds"] = load_seconds
+                history["fingerprint"] = fingerprint
+                evicted = self._evict_over_budget(keep=name)
+
+            logger.info(f"Model '{name}' loaded in {load_seconds:.2f}s (~{size_bytes / (1024 * 1024):.0f} MB)")
+
+        if evicted:
+            logger.info(f"Evicted models {evicted} to stay within {self.config.memory_budget_mb} MB budget")
+            gc.collect()
+        return model
+
+    def fingerprint(self, name: str) -> str:
+        """Hash identifying the weights of model ``name``, loading it if needed"""
+        self.get(name)
+        with self._lock:
+            # Kept in the load history so it survives eviction
+            return self._load_history[name]["fingerprint"]
+
+    def warmup(self, names: Optional[List[str]] = None):
+        """Eagerly load ``names`` (defaults to the configured warm-up list)"""
+        for name in (self.config.warmup_models if names is None else names):
+            try:
+                self.get(name)
+            except Exception as e:
+                # A failed warm-up is not fatal, the model is retried lazily on first request
+                logger.exception(f"Warm-up of model '{name}' failed: {e}")
+
+    def evict(self, name: str) -> bool:
+        """Drop ``name`` from memory; it is reloaded on next use"""
+        with self._lock:
+            entry = self._entries.pop(name, None)
+        if entry is None:
+            return False
+        del entry
+        gc.collect()
+        logger.info(f"Evicted model '{name}'")
+        return True
+
+    def status(self) -> dict:
+        """Describe registered models, which are resident and how long each took to load"""
+        with self._lock:
+            models = []
+            for name in self._loaders:
+                entry = self._entries.get(name)
+                history = self._load_history.get(name, {})
+                models.append({
+                    "name": name,
+                    "resident": entry is not None,
+                    "size_mb": round(entry["size_bytes"] / (1024 * 1024), 1) if entry else None,
+                    "fingerprint": history.get("fingerprint"),
+                    "load_seconds": round(entry["load_seconds"], 3) if entry else history.get("last_load_seconds"),
+                    "loaded_at": entry["loaded_at"] if entry else None,
+                    "last_used": entry["last_used"] if entry else None,
+                    "load_count": history.get("load_count", 0),
+                })
+            resident_bytes = sum(entry["size_bytes"] for entry in self._entries.values())
+
+        return {
+            "memory_budget_mb": self.config.memory_budget_mb,
+            "resident_mb": round(resident_bytes / (1024 * 1024), 1),
+            "models": models,
+        }
+
+    def _get_resident(self, name: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                return None
+            self._entries.move_to_end(name)
+            entry["last_used"] = time.time()
+            return entry["model"]
+
+    def _evict_over_budget(self, keep: str) -> List[str]:
+        # Caller holds self._lock
+        if self.memory_budget_bytes <= 0:
+            return []
+
+        evicted = []
+        total = sum(entry["size_bytes"] for entry in self._entries.values())
+        for name in list(self._entries):
+            if total <= self.memory_budget_bytes:
+                break
+            if name == keep:
+                continue
+            total -= self._entries.pop(name)["size_bytes"]
+            evicted.append(name)
+        return evicted
+
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry(config: Optional[ModelRegistryConfig] = None) -> ModelRegistry:
+    """Return the process-wide registry, creating it on first call"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                if config is None:
+                    from textCraftAI.config.configuration import ConfigurationManager
+                    config = ConfigurationManager().get_model_registry_config()
+                _registry = ModelRegistry(config)
+    return _registry
@@ -1,8 +1,13 @@
-from transformers import TrainingArguments, Trainer
+from transformers import TrainingArguments
 from transformers import DataCollatorForSeq2Seq
 from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
 from datasets import load_dataset, load_from_disk
 from textCraftAI.entity.config_entity import ModelTrainerConfig
+from textCraftAI.components.length_batching import (ThroughputCallback, TokenBudgetBatchSampler,
+                                                    TokenBudgetTrainer, TokenCounter, TokenCountingTrainer,
+                                                    example_lengths, matched_accumulation_steps, padding_stats)
+from textCraftAI.logging import logger
+import random
 import torch
 import os
 
@@ -22,6 +27,31 @@ class ModelTrainer:
         #loading data 
         dataset_diaglogsum_pt = load_from_disk(self.config.data_path)
 
+        # Padding of the current fixed-size batches, compared with token-budget batches below
+        train_dataset = dataset_diaglogsum_pt["train"]
+        input_lengths = example_lengths(train_dataset, "input_length", "input_ids")
+        label_lengths = example_lengths(train_dataset, "labels_length", "labels")
+        order = list(range(len(train_dataset)))
+        random.Random(self.config.batching_seed).shuffle(order)
+        size = self.config.per_device_train_batch_size
+        padding = {"fixed_size": padding_stats(
+            [order[i:i + size] for i in range(0, len(order), size)], input_lengths, label_lengths
+        )}
+
+        gradient_accumulation_steps = self.config.gradient_accumulation_steps
+        if self.config.token_batching:
+            batch_sampler = TokenBudgetBatchSampler(
+                input_lengths, label_lengths, self.config.max_tokens_per_batch,
+                max_batch_size=self.config.max_batch_size, seed=self.config.batching_seed
+            )
+            padding["token_budget"] = padding_stats(batch_sampler.batches(0), input_lengths, label_lengths)
+            # A token-budget batch already holds many examples; keep the examples per optimizer step
+            # of the fixed-size setup instead of multiplying them by gradient_accumulation_steps
+            examples_per_step = size * self.config.gradient_accumulation_steps
+            gradient_accumulation_steps = matched_accumulation_steps(batch_sampler.batches(0), examples_per_step)
+            logger.info(f"Token-budget batches: gradient_accumulation_steps {self.config.gradient_accumulation_steps} "
+                        f"-> {gradient_accumulation_steps} for about {examples_per_step} examples per optimizer step")
+
         trainer_args = TrainingArguments(
             output_dir=self.config.root_dir, num_train_epochs=self.config.num_train_epochs,
             warmup_steps=self.config.warmup_steps, per_device_train_batch_size=self.config.per_device_train_batch_size, 
@@ -29,18 +59,31 @@ class ModelTrainer:
             weight_decay=self.config.weight_decay, logging_steps=self.config.logging_steps,
             eval_strategy=self.config.evaluation_strategy, eval_steps=self.config.eval_steps,
             save_strategy=self.config.save_strategy, save_steps=self.config.save_steps,
-            gradient_accumulation_steps=self.config.gradient_accumulation_steps
+            gradient_accumulation_steps=gradient_accumulation_steps
         ) 
 
-
-        trainer = Trainer(model=model_pegasus, args=trainer_args,
-                  processing_class=tokenizer, data_collator=seq2seq_data_collator,
-                  train_dataset=dataset_diaglogsum_pt["train"], 
-                  eval_dataset=dataset_diaglogsum_pt["validation"])
+        token_counter = TokenCounter()
+        trainer_kwargs = dict(
+            model=model_pegasus, args=trainer_args,
+            processing_class=tokenizer, data_collator=seq2seq_data_collator,
+            train_dataset=train_dataset,
+            eval_dataset=dataset_diaglogsum_pt["validation"],
+            token_counter=token_counter
+        )
+        if self.config.token_batching:
+            mode = "token_budget"
+            trainer = TokenBudgetTrainer(batch_sampler=batch_sampler, **trainer_kwargs)
+        else:
+            mode = "fixed_size"
+            trainer = TokenCountingTrainer(**trainer_kwargs)
+        for name, stats in padding.items():
+            logger.info(f"{name} batches: {stats}")
+        trainer.add_callback(ThroughputCallback(token_counter, mode, self.config.throughput_report_file, padding))
         
         trainer.train()
 
         ## Save model
-        model_pegasus.save_pretrained(os.path.join(self.config.root_dir,"pegasus-diaglogsum-model"))
+        # safetensors, so the API can serve the weights memory-mapped
+        model_pegasus.save_pretrained(os.path.join(self.config.root_dir,"pegasus-diaglogsum-model"), safe_serialization=True)
         ## Save tokenizer
         tokenizer.save_pretrained(os.path.join(self.config.root_dir,"tokenizer"))
\ No newline at end of file
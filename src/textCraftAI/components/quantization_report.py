@@ -0,0 +1,116 @@
+import os
+import statistics
+import time
+from typing import Any, List, Optional
+
+import pandas as pd
+import torch
+from datasets import load_from_disk
+from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+from textCraftAI.logging import logger
+from textCraftAI.components.model_evaluation import ModelEvaluation
+from textCraftAI.components.rouge_scoring import ROUGE_TYPES
+from textCraftAI.components.model_quantization import ModelQuantizer, quantize_dynamic_int8
+from textCraftAI.components.model_registry import _estimate_size_bytes
+from textCraftAI.entity.config_entity import (ModelQuantizationConfig,
+                                              ModelEvaluationConfig,
+                                              ModelRegistryConfig)
+
+
+# Decoding used for the latency benchmark, matching what the API serves
+_LATENCY_GEN_KWARGS = {
+    "summarization": {"length_penalty": 0.8, "num_beams": 8, "max_length": 128, "no_repeat_ngram_size": 3},
+    "paraphrase": {"num_beams": 4, "max_length": 64, "early_stopping": True},
+}
+
+
+class QuantizationReport:
+    """Compares fp32 and int8 models side by side and writes the pre-quantized artifacts.
+
+    The summarization model is scored with ``ModelEvaluation``'s ROUGE computation
+    on the test split. Both models are timed on single-request generate calls.
+    """
+
+    def __init__(self, config: ModelQuantizationConfig, evaluation_config: ModelEvaluationConfig,
+                 registry_config: ModelRegistryConfig):
+        self.config = config
+        self.evaluation_config = evaluation_config
+        self.registry_config = registry_config
+        self.quantizer = ModelQuantizer(config)
+
+    def compare(self) -> pd.DataFrame:
+        test_split = load_from_disk(self.evaluation_config.data_path)["test"][0:self.config.report_samples]
+        rows = []
+
+        if os.path.exists(self.evaluation_config.model_path):
+            source, tokenizer_source = self.evaluation_config.model_path, self.evaluation_config.tokenizer_path
+        else:
+            source = tokenizer_source = self.registry_config.summarization_fallback_model
+        rows.extend(self._compare_task(
+            "summarization", source, tokenizer_source, test_split["dialogue"], test_split
+        ))
+
+        # Reference summaries are single sentences, which makes them realistic paraphrase inputs
+        paraphrase_model = self.registry_config.paraphrase_model
+        rows.extend(self._compare_task(
+            "paraphrase", paraphrase_model, paraphrase_model,
+            [f"paraphrase: {summary}" for summary in test_split["summary"]]
+        ))
+
+        report = pd.DataFrame(rows)
+        report.to_csv(self.config.report_file, index=False)
+        logger.info(f"Quantization report written to {self.config.report_file}\n{report.to_string(index=False)}")
+        return report
+
+    def _compare_task(self, task: str, source: str, tokenizer_source: str, latency_inputs: List[str],
+                      rouge_split: Optional[dict] = None) -> List[dict]:
+        tokenizer = AutoTokenizer.from_pretrained(tokenizer_source)
+        fp32_model = AutoModelForSeq2SeqLM.from_pretrained(source).eval()
+
+        start = time.perf_counter()
+        int8_model = quantize_dynamic_int8(fp32_model)
+        quantize_seconds = time.perf_counter() - start
+        self.quantizer.save_artifact(task, int8_model, source)
+
+        rows = []
+        for precision, model in (("fp32", fp32_model), ("int8", int8_model)):
+            row = {
+                "task": task,
+                "precision": precision,
+                "size_mb": round(_estimate_size_bytes(model) / (1024 * 1024), 1),
+                "quantize_seconds": round(quantize_seconds, 2) if precision == "int8" else None,
+            }
+            row.update(self._latency(task, model, tokenizer, latency_inputs))
+            if rouge_split is not None:
+                row.update(self._rouge(model, tokenizer, rouge_split))
+            rows.append(row)
+            logger.info(f"{task}/{precision}: {row}")
+        return rows
+
+    def _latency(self, task: str, model: Any, tokenizer: Any, inputs: List[str]) -> dict:
+        gen_kwargs = _LATENCY_GEN_KWARGS[task]
+        timings = []
+        with torch.inference_mode():
+            # The first call pays one-off allocation costs, keep it out of the numbers
+            for run in range(self.config.latency_runs + 1):
+                text = inputs[run % len(inputs)]
+                encoded = tokenizer(text, truncation=True, return_tensors="pt")
+                start = time.perf_counter()
+                model.generate(**encoded, **gen_kwargs)
+                if run:
+                    timings.append(time.perf_counter() - start)
+
+        timings.sort()
+        return {
+            "latency_mean_s": round(statistics.mean(timings), 3),
+            "latency_p50_s": round(timings[len(timings) // 2], 3),
+            "latency_p95_s": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 3),
+        }
+
+    def _rouge(self, model: Any, tokenizer: Any, split: dict) -> dict:
+        example_scores = ModelEvaluation(self.evaluation_config).calculate_metric_on_test_ds(
+            split, model, tokenizer,
+            batch_size=2, device="cpu", column_text="dialogue", column_summary="summary"
+        )
+        return {rn: round(float(example_scores[rn].mean()), 4) for rn in ROUGE_TYPES}
@@ -0,0 +1,163 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Optional
+
+from textCraftAI.logging import logger
+from textCraftAI.entity.config_entity import ResultCacheConfig
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form of an input for cache keys: NFC and collapsed whitespace"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class ResultCache:
+    """Two-tier cache of generated outputs.
+
+    The first tier is an in-process LRU of ``memory_max_entries`` results. The
+    second is a SQLite database under ``root_dir`` that survives restarts and is
+    shared by every worker process on the host. It is trimmed to
+    ``disk_max_entries`` by least recent access.
+    """
+
+    # Trim the disk tier every this many writes rather than on each one
+    _TRIM_EVERY = 100
+
+    def __init__(self, config: ResultCacheConfig):
+        self.config = config
+        self.db_path = os.path.join(config.root_dir, "results.sqlite3")
+
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        os.register_at_fork(after_in_child=self._after_fork)
+        self._writes = 0
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "memory_evictions": 0,
+            "disk_evictions": 0,
+        }
+
+        if config.enabled:
+            with self._connection() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS results ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL, accessed_at REAL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed_at)")
+
+    @staticmethod
+    def make_key(operation: str, payload: str, gen_kwargs: dict, model_fingerprint: str) -> str:
+        """Key over the normalized input, decoding parameters and model weights"""
+        material = json.dumps(
+            {
+                "operation": operation,
+                "input": normalize_text(payload),
+                "gen_kwargs": gen_kwargs,
+                "model": model_fingerprint,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        if not self.config.enabled:
+            return None
+
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return value
+
+        try:
+            with self._connection() as conn:
+                row = conn.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    conn.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        except sqlite3.Error as e:
+            logger.warning(f"Result cache read failed: {e}")
+            row = None
+
+        with self._lock:
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["disk_hits"] += 1
+            self._remember(key, row[0])
+        return row[0]
+
+    def put(self, key: str, value: str):
+        if not self.config.enabled:
+            return
+
+        with self._lock:
+            self._remember(key, value)
+            self._writes += 1
+            trim = self._writes % self._TRIM_EVERY == 0
+
+        now = time.time()
+        try:
+            with self._connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO results (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, value, now, now),
+                )
+                if trim:
+                    self._trim_disk(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"Result cache write failed: {e}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 4) if lookups else None
+        stats["enabled"] = self.config.enabled
+        return stats
+
+    def _remember(self, key: str, value: str):
+        # Caller holds self._lock
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.config.memory_max_entries:
+            self._memory.popitem(last=False)
+            self._stats["memory_evictions"] += 1
+
+    def _trim_disk(self, conn: sqlite3.Connection):
+        (count,) = conn.execute("SELECT COUNT(*) FROM results").fetchone()
+        excess = count - self.config.disk_max_entries
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY accessed_at LIMIT ?)",
+                (excess,),
+            )
+            with self._lock:
+                self._stats["disk_evictions"] += excess
+
+    def _after_fork(self):
+        # A forked child (e.g. a serve.py worker) opens its own connections. The
+        # inherited ones are kept open, closing them could drop the parent's locks.
+        self._inherited_local = self._local
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread; WAL lets readers in other processes proceed during writes
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(self.config.root_dir, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
@@ -0,0 +1,114 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+ROUGE_TYPES = ("rouge1", "rouge2", "rougeL", "rougeLsum")
+
+# Set in each scoring process by _init_worker
+_scorer = None
+
+
+def _make_scorer():
+    from rouge_score import rouge_scorer
+
+    # Same settings as evaluate's "rouge" metric, so scores stay comparable with earlier runs
+    return rouge_scorer.RougeScorer(list(ROUGE_TYPES), use_stemmer=False)
+
+
+def _init_worker():
+    global _scorer
+    _scorer = _make_scorer()
+
+
+def _score_chunk(pairs: List[tuple]) -> List[List[float]]:
+    scores = []
+    for prediction, reference in pairs:
+        result = _scorer.score(reference, prediction)
+        scores.append([result[rouge_type].fmeasure for rouge_type in ROUGE_TYPES])
+    return scores
+
+
+def score_examples(predictions: Sequence[str], references: Sequence[str], num_proc: int = 0,
+                   chunk_size: int = 256) -> np.ndarray:
+    """Per-example ROUGE F-measures as an ``(examples, len(ROUGE_TYPES))`` matrix
+
+    Chunks of examples are scored on ``num_proc`` processes (0 uses one per
+    CPU); inputs smaller than two chunks are scored in this process.
+    """
+    global _scorer
+    if len(predictions) != len(references):
+        raise ValueError(f"{len(predictions)} predictions but {len(references)} references")
+    pairs = list(zip(predictions, references))
+    chunks = [pairs[i:i + chunk_size] for i in range(0, len(pairs), chunk_size)]
+    num_proc = num_proc or os.cpu_count() or 1
+
+    if num_proc <= 1 or len(chunks) < 2:
+        if _scorer is None:
+            _scorer = _make_scorer()
+        rows = [row for chunk in chunks for row in _score_chunk(chunk)]
+    else:
+        # spawn: the evaluating process has torch threads that must not be forked
+        with ProcessPoolExecutor(max_workers=min(num_proc, len(chunks)), initializer=_init_worker,
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            rows = [row for chunk_rows in pool.map(_score_chunk, chunks) for row in chunk_rows]
+    return np.asarray(rows, dtype=np.float64).reshape(len(pairs), len(ROUGE_TYPES))
+
+
+def bootstrap_ci(scores: np.ndarray, num_resamples: int = 1000, confidence: float = 0.95, seed: int = 0,
+                 max_block_elements: int = 1 << 24) -> Dict[str, np.ndarray]:
+    """Mean of each column of ``scores`` with a percentile bootstrap confidence interval
+
+    Every resample draws ``len(scores)`` row indices with replacement; the
+    resampled column means are computed as one gather and reduction per
+    block of resamples, sized so the gathered block stays under
+    ``max_block_elements`` values.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    num_examples = scores.shape[0]
+    if num_examples == 0:
+        nan = np.full(scores.shape[1], np.nan)
+        return {"mean": nan, "low": nan, "high": nan}
+
+    rng = np.random.default_rng(seed)
+    block = max(1, max_block_elements // (num_examples * scores.shape[1]))
+    means = np.empty((num_resamples, scores.shape[1]))
+    for start in range(0, num_resamples, block):
+        stop = min(num_resamples, start + block)
+        indices = rng.integers(0, num_examples, size=(stop - start, num_examples))
+        means[start:stop] = scores[indices].mean(axis=1)
+
+    tail = (1.0 - confidence) / 2 * 100
+    low, high = np.percentile(means, [tail, 100 - tail], axis=0)
+    return {"mean": scores.mean(axis=0), "low": low, "high": high}
+
+
+def summarize(frame: pd.DataFrame, num_resamples: int = 1000, confidence: float = 0.95,
+              seed: int = 0) -> Dict[str, float]:
+    """``{rouge1: mean, rouge1_low: ..., rouge1_high: ...}`` for each ROUGE type in ``frame``"""
+    interval = bootstrap_ci(frame[list(ROUGE_TYPES)].to_numpy(), num_resamples, confidence, seed)
+    summary = {}
+    for column, rouge_type in enumerate(ROUGE_TYPES):
+        summary[rouge_type] = round(float(interval["mean"][column]), 4)
+        summary[f"{rouge_type}_low"] = round(float(interval["low"][column]), 4)
+        summary[f"{rouge_type}_high"] = round(float(interval["high"][column]), 4)
+    return summary
+
+
+def slice_scores(frame: pd.DataFrame, column: str, bins: Optional[Sequence[float]] = None,
+                 quantiles: int = 4) -> pd.DataFrame:
+    """Mean ROUGE per bin of ``column`` (e.g. dialogue length), from saved per-example scores
+
+    Without ``bins``, the column is split into ``quantiles`` equally populated bins.
+    """
+    if bins is None:
+        groups = pd.qcut(frame[column], q=quantiles, duplicates="drop")
+    else:
+        groups = pd.cut(frame[column], bins=list(bins), include_lowest=True)
+    sliced = frame.groupby(groups, observed=True)[list(ROUGE_TYPES)].mean().round(4)
+    sliced.insert(0, "examples", frame.groupby(groups, observed=True).size())
+    return sliced
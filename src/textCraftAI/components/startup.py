@@ -0,0 +1,136 @@
+import importlib
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from textCraftAI.logging import logger
+
+
+# Heavy modules imported up front by the warm-up thread, so their cost shows as its own phase
+_HEAVY_MODULES = ("torch", "transformers")
+
+
+def _process_age_seconds() -> Optional[float]:
+    """Seconds since this process started, from /proc (None where it is not available)"""
+    try:
+        with open("/proc/self/stat") as f:
+            # The command name may contain spaces, the fields after it do not
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+
+
+class StartupTracer:
+    """Records the duration of each cold-start phase, relative to process start.
+
+    Phases may overlap (e.g. model loading runs in the background while the
+    server binds), so each one keeps its own start offset.
+    """
+
+    def __init__(self):
+        self._created = time.perf_counter()
+        age = _process_age_seconds()
+        # Time spent before the tracer existed: interpreter start-up and the server's own imports
+        self._offset = age if age is not None else 0.0
+        self._phases: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(name, started, time.perf_counter() - started)
+
+    def mark(self, name: str):
+        """Record an instant, e.g. the moment the service became ready"""
+        self._record(name, time.perf_counter(), 0.0)
+
+    def report(self) -> dict:
+        with self._lock:
+            phases = list(self._phases)
+        return {
+            "before_tracing_s": round(self._offset, 3),
+            "phases": phases,
+        }
+
+    def _record(self, name: str, started: float, seconds: float):
+        entry = {
+            "phase": name,
+            "started_s": round(self._offset + started - self._created, 3),
+            "seconds": round(seconds, 3),
+        }
+        with self._lock:
+            self._phases.append(entry)
+        logger.info(f"Startup phase '{name}' took {seconds:.2f}s (at {entry['started_s']:.2f}s)")
+
+
+class ModelWarmup:
+    """Loads models on a background thread and warms each with a tiny generate.
+
+    The server binds and answers liveness probes right away; ``ready`` turns
+    true once every model in ``names`` is loaded and has run one generate, so
+    the first real request does not pay for lazy initialization. A model that
+    fails to warm up stays unready; requests still load it lazily.
+    """
+
+    def __init__(self, predictor: Any, names: List[str], tracer: StartupTracer):
+        self.predictor = predictor
+        self.names = list(names)
+        self.tracer = tracer
+        self._states: Dict[str, Dict[str, Any]] = {name: {"state": "pending"} for name in self.names}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="model-warmup", daemon=True)
+            self._thread.start()
+
+    @property
+    def ready(self) -> bool:
+        with self._lock:
+            return all(entry["state"] == "ready" for entry in self._states.values())
+
+    def status(self) -> dict:
+        with self._lock:
+            models = {name: dict(entry) for name, entry in self._states.items()}
+        return {
+            "ready": all(entry["state"] == "ready" for entry in models.values()),
+            "models": models,
+        }
+
+    def _run(self):
+        for module in _HEAVY_MODULES:
+            try:
+                with self.tracer.phase(f"import:{module}"):
+                    importlib.import_module(module)
+            except ImportError as e:
+                # Loading the models below fails with the full error
+                logger.warning(f"Could not import {module}: {e}")
+
+        for name in self.names:
+            try:
+                self._set(name, "loading")
+                with self.tracer.phase(f"load:{name}"):
+                    self.predictor.registry.get(name)
+                self._set(name, "warming")
+                with self.tracer.phase(f"warmup:{name}"):
+                    self.predictor.warmup_generate(name)
+                self._set(name, "ready")
+            except Exception as e:
+                logger.exception(f"Warm-up of model '{name}' failed: {e}")
+                self._set(name, "failed", error=f"{type(e).__name__}: {e}")
+
+        if self.ready:
+            self.tracer.mark("ready")
+
+    def _set(self, name: str, state: str, error: Optional[str] = None):
+        with self._lock:
+            self._states[name] = {"state": state, "error": error} if error else {"state": state}
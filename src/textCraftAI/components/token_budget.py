@@ -0,0 +1,96 @@
+import threading
+from typing import Any, List, Union
+
+from textCraftAI.logging import logger
+from textCraftAI.entity.config_entity import TokenBudgetConfig
+from textCraftAI.components.metrics import STAGE_SECONDS
+
+
+class InputTooLongError(ValueError):
+    """Raised when an input exceeds the token (or raw character) limit of its task"""
+
+    def __init__(self, task: str, num_tokens: int, max_tokens: int, unit: str = "tokens"):
+        self.task = task
+        self.num_tokens = num_tokens
+        self.max_tokens = max_tokens
+        super().__init__(f"Text too long: {num_tokens:,} {unit}, maximum {max_tokens:,} {unit} allowed for {task}.")
+
+
+class TokenizedInput:
+    """A model input together with its encoder token ids, so it is tokenized only once"""
+
+    __slots__ = ("text", "input_ids")
+
+    def __init__(self, text: str, input_ids: List[int]):
+        self.text = text
+        self.input_ids = input_ids
+
+    def __len__(self) -> int:
+        return len(self.input_ids)
+
+    def __repr__(self) -> str:
+        return f"TokenizedInput({self.text[:40]!r}, {len(self.input_ids)} tokens)"
+
+
+def input_text(model_input: Union[str, TokenizedInput]) -> str:
+    """Text of a model input, whether or not it is already tokenized"""
+    return model_input.text if isinstance(model_input, TokenizedInput) else model_input
+
+
+class TokenBudget:
+    """Tokenizes inputs with the task's fast tokenizer and enforces limits in tokens.
+
+    Inputs longer than the encoder window are rejected instead of being
+    silently truncated. ``max_input_chars`` only guards the tokenizer itself
+    against pathological request bodies.
+    """
+
+    def __init__(self, config: TokenBudgetConfig, registry: Any):
+        self.config = config
+        self.registry = registry
+        self._warned_slow = set()
+        self._lock = threading.Lock()
+
+    def tokenizer(self, task: str) -> Any:
+        tokenizer = self.registry.get(task).tokenizer
+        if not getattr(tokenizer, "is_fast", False):
+            with self._lock:
+                if task not in self._warned_slow:
+                    self._warned_slow.add(task)
+                    logger.warning(f"The {task} tokenizer is not a fast (Rust) tokenizer, tokenization will be slow")
+        return tokenizer
+
+    def max_input_tokens(self, task: str) -> int:
+        """Configured limit, capped by what the model's encoder accepts"""
+        limit = int(self.config.max_input_tokens[task])
+        model_max = getattr(self.tokenizer(task), "model_max_length", None)
+        # Tokenizers without a limit report a huge sentinel value
+        if model_max and model_max < 1_000_000:
+            limit = min(limit, int(model_max))
+        return limit
+
+    def encode(self, task: str, text: str, truncate: bool = False) -> TokenizedInput:
+        """Tokenize ``text`` once, raising ``InputTooLongError`` if it does not fit the encoder
+
+        With ``truncate``, text past the limits is cut off instead (used for
+        file content, which has no request-sized bound).
+        """
+        if len(text) > self.config.max_input_chars:
+            if not truncate:
+                raise InputTooLongError(task, len(text), self.config.max_input_chars, unit="characters")
+            text = text[:self.config.max_input_chars]
+
+        limit = self.max_input_tokens(task)
+        backend = self.registry.get(task)
+        with STAGE_SECONDS.time("tokenization", task, ""):
+            input_ids = backend.encode(text)
+        if len(input_ids) > limit:
+            if not truncate:
+                raise InputTooLongError(task, len(input_ids), limit)
+            logger.info(f"Truncating {task} input from {len(input_ids):,} to {limit:,} tokens")
+            input_ids = backend.encode(text, truncation=True, max_length=limit)
+        return TokenizedInput(text, input_ids)
+
+    def count_content_tokens(self, task: str, text: str) -> int:
+        """Tokens of ``text`` itself, without special tokens"""
+        return len(self.tokenizer(task)(text, add_special_tokens=False)["input_ids"])
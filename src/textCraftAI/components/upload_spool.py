@@ -0,0 +1,97 @@
+import hashlib
+import io
+import os
+import tempfile
+from typing import Any, BinaryIO, Optional
+
+from textCraftAI.entity.config_entity import UploadConfig
+
+
+class UploadTooLargeError(ValueError):
+    """Raised as soon as an upload crosses the size limit, before the rest is read"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        super().__init__(f"File too large. Maximum {max_bytes / (1024 * 1024):g}MB allowed.")
+
+
+class SpooledUpload:
+    """An uploaded file read once, in chunks, with its size and SHA-256 computed on the way.
+
+    Content stays in memory up to ``spool_threshold_mb`` and then moves to a
+    named temporary file, whose ``path`` other processes can open. ``file``
+    is a binary file object positioned at the start, which is what the
+    extractors read from; no extra bytes copy of the upload is made.
+    """
+
+    def __init__(self, filename: str, spool_bytes: int):
+        self.filename = filename
+        self.size = 0
+        self._spool_bytes = spool_bytes
+        self._digest = hashlib.sha256()
+        self._file: BinaryIO = io.BytesIO()
+        self._on_disk = False
+
+    @property
+    def sha256(self) -> str:
+        return self._digest.hexdigest()
+
+    @property
+    def path(self) -> Optional[str]:
+        """Path of the spooled file, or None while the upload is held in memory"""
+        return self._file.name if self._on_disk else None
+
+    @property
+    def file(self) -> BinaryIO:
+        self._file.seek(0)
+        return self._file
+
+    def write(self, chunk: bytes):
+        self.size += len(chunk)
+        self._digest.update(chunk)
+        if not self._on_disk and self.size > self._spool_bytes:
+            spooled = tempfile.NamedTemporaryFile(prefix="upload-", suffix=os.path.splitext(self.filename)[1])
+            spooled.write(self._file.getvalue())
+            self._file = spooled
+            self._on_disk = True
+        self._file.write(chunk)
+
+    def read_bytes(self) -> bytes:
+        return self.file.read()
+
+    def close(self):
+        # Deletes the temporary file, if there is one
+        self._file.close()
+
+    def __enter__(self) -> "SpooledUpload":
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.close()
+
+
+async def spool_upload(upload: Any, config: UploadConfig) -> SpooledUpload:
+    """Read a FastAPI ``UploadFile`` in chunks into a ``SpooledUpload``
+
+    Raises ``UploadTooLargeError`` once ``max_file_mb`` is crossed without
+    reading the remainder of the file.
+    """
+    max_bytes = int(config.max_file_mb * 1024 * 1024)
+    # Starlette reports the size of the part it already received, when it knows it
+    size = getattr(upload, "size", None)
+    if size is not None and size > max_bytes:
+        raise UploadTooLargeError(max_bytes)
+
+    spooled = SpooledUpload(upload.filename, int(config.spool_threshold_mb * 1024 * 1024))
+    try:
+        while True:
+            chunk = await upload.read(config.chunk_kb * 1024)
+            if not chunk:
+                break
+            if spooled.size + len(chunk) > max_bytes:
+                raise UploadTooLargeError(max_bytes)
+            spooled.write(chunk)
+    except BaseException:
+        spooled.close()
+        raise
+    return spooled
@@ -4,7 +4,21 @@ from textCraftAI.entity.config_entity import (DataIngestionConfig,
                                               DataValidationConfig,
                                               DataTransformationConfig,
                                               ModelTrainerConfig,
-                                              ModelEvaluationConfig)
+                                              ModelEvaluationConfig,
+                                              ModelRegistryConfig,
+                                              InferenceBatcherConfig,
+                                              InferenceExecutorConfig,
+                                              LongDocumentConfig,
+                                              ResultCacheConfig,
+                                              ModelQuantizationConfig,
+                                              InferenceBackendConfig,
+                                              AdaptiveDecodingConfig,
+                                              TokenBudgetConfig,
+                                              BatchApiConfig,
+                                              JobQueueConfig,
+                                              DocumentExtractionConfig,
+                                              UploadConfig,
+                                              ServingConfig)
 
 
 class ConfigurationManager:
@@ -26,7 +40,9 @@ class ConfigurationManager:
         return DataIngestionConfig(
             root_dir=config.root_dir,
             dataset_name=config.dataset_name,
-            save_path=config.save_path
+            data_files=config.data_files,
+            save_path=config.save_path,
+            shard_rows=config.shard_rows
         )
 
         
@@ -39,6 +55,8 @@ class ConfigurationManager:
             root_dir=config.root_dir,
             STATUS_FILE=config.STATUS_FILE,
             ALL_REQUIRED_FILES=config.ALL_REQUIRED_FILES,
+            data_path=config.data_path,
+            verify_checksums=config.verify_checksums,
         )
 
         return data_validation_config
@@ -51,7 +69,12 @@ class ConfigurationManager:
         data_transformation_config = DataTransformationConfig(
             root_dir=config.root_dir,
             data_path=config.data_path,
-            tokenizer_name = config.tokenizer_name
+            tokenizer_name = config.tokenizer_name,
+            num_proc=config.num_proc,
+            batch_size=config.batch_size,
+            max_input_length=config.max_input_length,
+            max_target_length=config.max_target_length,
+            state_file=config.state_file
         )
 
         return data_transformation_config
@@ -60,6 +83,7 @@ class ConfigurationManager:
     def get_model_trainer_config(self) -> ModelTrainerConfig:
         config = self.config.model_trainer
         params = self.params.TrainingArguments
+        batching = self.params.TokenBudgetBatching
 
         create_directories([config.root_dir])
 
@@ -76,7 +100,12 @@ class ConfigurationManager:
             eval_steps = params.eval_steps,
             save_strategy=params.save_strategy,
             save_steps = params.save_steps,
-            gradient_accumulation_steps = params.gradient_accumulation_steps
+            gradient_accumulation_steps = params.gradient_accumulation_steps,
+            token_batching = batching.enabled,
+            max_tokens_per_batch = batching.max_tokens,
+            max_batch_size = batching.max_batch_size,
+            batching_seed = batching.seed,
+            throughput_report_file = config.throughput_report_file
         )
 
         return model_trainer_config
@@ -90,6 +119,181 @@ class ConfigurationManager:
             data_path=config.data_path,
             model_path=config.model_path,
             tokenizer_path=config.tokenizer_path,
-            metric_file_name=config.metric_file_name
+            metric_file_name=config.metric_file_name,
+            predictions_file=config.predictions_file,
+            batch_size=config.batch_size,
+            max_input_length=config.max_input_length,
+            max_samples=config.max_samples,
+            example_scores_file=config.example_scores_file,
+            rouge_num_proc=config.rouge_num_proc,
+            bootstrap_resamples=config.bootstrap_resamples,
+            confidence_level=config.confidence_level
+        )
+        return model_evaluation_config
+
+    def get_model_registry_config(self) -> ModelRegistryConfig:
+        config = self.config.model_registry
+
+        model_registry_config = ModelRegistryConfig(
+            summarization_fallback_model=config.summarization_fallback_model,
+            paraphrase_model=config.paraphrase_model,
+            warmup_models=list(config.warmup_models),
+            memory_budget_mb=config.memory_budget_mb,
+            mmap_weights=config.mmap_weights
+        )
+        return model_registry_config
+
+    def get_inference_batcher_config(self) -> InferenceBatcherConfig:
+        config = self.config.inference_batcher
+
+        inference_batcher_config = InferenceBatcherConfig(
+            max_batch_size=config.max_batch_size,
+            max_wait_ms=config.max_wait_ms,
+            length_buckets=list(config.length_buckets)
+        )
+        return inference_batcher_config
+
+    def get_inference_executor_config(self) -> InferenceExecutorConfig:
+        config = self.config.inference_executor
+
+        inference_executor_config = InferenceExecutorConfig(
+            max_workers=config.max_workers,
+            max_queue_depth=config.max_queue_depth
+        )
+        return inference_executor_config
+
+    def get_long_document_config(self) -> LongDocumentConfig:
+        config = self.config.long_document
+
+        long_document_config = LongDocumentConfig(
+            chunk_tokens=config.chunk_tokens,
+            overlap_tokens=config.overlap_tokens,
+            max_depth=config.max_depth,
+            chunk_batch_size=config.chunk_batch_size,
+            max_document_chars=config.max_document_chars
+        )
+        return long_document_config
+
+    def get_result_cache_config(self) -> ResultCacheConfig:
+        config = self.config.result_cache
+        create_directories([config.root_dir])
+
+        result_cache_config = ResultCacheConfig(
+            root_dir=config.root_dir,
+            enabled=config.enabled,
+            memory_max_entries=config.memory_max_entries,
+            disk_max_entries=config.disk_max_entries,
+            paraphrase_seed=config.paraphrase_seed
+        )
+        return result_cache_config
+
+    def get_model_quantization_config(self) -> ModelQuantizationConfig:
+        config = self.config.model_quantization
+        create_directories([config.root_dir])
+
+        model_quantization_config = ModelQuantizationConfig(
+            root_dir=config.root_dir,
+            mode=config.mode,
+            tasks=list(config.tasks),
+            quantized_model_dir=config.quantized_model_dir,
+            report_file=config.report_file,
+            report_samples=config.report_samples,
+            latency_runs=config.latency_runs
+        )
+        return model_quantization_config
+
+    def get_inference_backend_config(self) -> InferenceBackendConfig:
+        config = self.config.inference_backend
+
+        inference_backend_config = InferenceBackendConfig(
+            backend=config.backend,
+            onnx_model_dir=config.onnx_model_dir,
+            intra_op_num_threads=config.intra_op_num_threads
+        )
+        return inference_backend_config
+
+    def get_adaptive_decoding_config(self) -> AdaptiveDecodingConfig:
+        config = self.config.adaptive_decoding
+
+        adaptive_decoding_config = AdaptiveDecodingConfig(
+            deadline_fraction=config.deadline_fraction,
+            min_max_length=config.min_max_length,
+            initial_ms_per_step=config.initial_ms_per_step,
+            cost_smoothing=config.cost_smoothing,
+            # Plain dicts in the order written, highest quality first
+            profiles={
+                task: {name: dict(profile) for name, profile in profiles.items()}
+                for task, profiles in config.profiles.items()
+            }
+        )
+        return adaptive_decoding_config
+
+    def get_token_budget_config(self) -> TokenBudgetConfig:
+        config = self.config.token_budget
+
+        token_budget_config = TokenBudgetConfig(
+            max_input_chars=config.max_input_chars,
+            max_input_tokens=dict(config.max_input_tokens)
+        )
+        return token_budget_config
+
+    def get_batch_api_config(self) -> BatchApiConfig:
+        config = self.config.batch_api
+
+        batch_api_config = BatchApiConfig(
+            max_items=config.max_items,
+            max_total_tokens=config.max_total_tokens,
+            max_body_mb=config.max_body_mb,
+            batch_size=config.batch_size
+        )
+        return batch_api_config
+
+    def get_job_queue_config(self) -> JobQueueConfig:
+        config = self.config.job_queue
+        create_directories([config.root_dir])
+
+        job_queue_config = JobQueueConfig(
+            root_dir=config.root_dir,
+            num_workers=config.num_workers,
+            max_attempts=config.max_attempts,
+            retry_backoff_seconds=config.retry_backoff_seconds,
+            lease_seconds=config.lease_seconds,
+            result_ttl_hours=config.result_ttl_hours,
+            poll_interval_seconds=config.poll_interval_seconds,
+            cleanup_interval_seconds=config.cleanup_interval_seconds,
+            max_worker_restarts=config.max_worker_restarts
+        )
+        return job_queue_config
+
+    def get_document_extraction_config(self) -> DocumentExtractionConfig:
+        config = self.config.document_extraction
+
+        document_extraction_config = DocumentExtractionConfig(
+            max_workers=config.max_workers,
+            parallel_min_pages=config.parallel_min_pages,
+            pages_per_task=config.pages_per_task,
+            max_pages=config.max_pages,
+            docx_headers_footers=config.docx_headers_footers
+        )
+        return document_extraction_config
+
+    def get_upload_config(self) -> UploadConfig:
+        config = self.config.upload
+
+        upload_config = UploadConfig(
+            max_file_mb=config.max_file_mb,
+            chunk_kb=config.chunk_kb,
+            spool_threshold_mb=config.spool_threshold_mb
+        )
+        return upload_config
+
+    def get_serving_config(self) -> ServingConfig:
+        config = self.config.serving
+
+        serving_config = ServingConfig(
+            workers=config.workers,
+            threads_per_worker=config.threads_per_worker,
+            graceful_timeout_seconds=config.graceful_timeout_seconds,
+            backlog=config.backlog
         )
-        return model_evaluation_config
\ No newline at end of file
+        return serving_config
@@ -1,11 +1,14 @@
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 @dataclass(frozen=True)
 class DataIngestionConfig:
     root_dir: Path
     dataset_name: str  
+    data_files: dict
     save_path: Path
+    shard_rows: int
 
 
 @dataclass(frozen=True)
@@ -13,12 +16,19 @@ class DataValidationConfig:
     root_dir: Path
     STATUS_FILE: str
     ALL_REQUIRED_FILES: list
+    data_path: Path
+    verify_checksums: bool
 
 @dataclass(frozen=True)
 class DataTransformationConfig:
     root_dir: Path
     data_path: Path
     tokenizer_name: Path
+    num_proc: int
+    batch_size: int
+    max_input_length: int
+    max_target_length: int
+    state_file: Path
 
 
 @dataclass(frozen=True)
@@ -36,6 +46,11 @@ class ModelTrainerConfig:
     save_strategy: str
     save_steps: float
     gradient_accumulation_steps: int
+    token_batching: bool
+    max_tokens_per_batch: int
+    max_batch_size: int
+    batching_seed: int
+    throughput_report_file: Path
 
 @dataclass(frozen=True)
 class ModelEvaluationConfig:
@@ -43,4 +58,129 @@ class ModelEvaluationConfig:
     data_path: Path
     model_path: Path
     tokenizer_path: Path
-    metric_file_name: Path
\ No newline at end of file
+    metric_file_name: Path
+    predictions_file: Path
+    batch_size: int
+    max_input_length: int
+    max_samples: Optional[int]
+    example_scores_file: Path
+    rouge_num_proc: int
+    bootstrap_resamples: int
+    confidence_level: float
+
+@dataclass(frozen=True)
+class ModelRegistryConfig:
+    summarization_fallback_model: str
+    paraphrase_model: str
+    warmup_models: list
+    memory_budget_mb: int
+    mmap_weights: bool
+
+
+@dataclass(frozen=True)
+class InferenceBatcherConfig:
+    max_batch_size: int
+    max_wait_ms: float
+    length_buckets: list
+
+
+@dataclass(frozen=True)
+class InferenceExecutorConfig:
+    max_workers: int
+    max_queue_depth: int
+
+
+@dataclass(frozen=True)
+class LongDocumentConfig:
+    chunk_tokens: int
+    overlap_tokens: int
+    max_depth: int
+    chunk_batch_size: int
+    max_document_chars: int
+
+
+@dataclass(frozen=True)
+class ResultCacheConfig:
+    root_dir: Path
+    enabled: bool
+    memory_max_entries: int
+    disk_max_entries: int
+    paraphrase_seed: Optional[int]
+
+
+@dataclass(frozen=True)
+class ModelQuantizationConfig:
+    root_dir: Path
+    mode: str
+    tasks: list
+    quantized_model_dir: Path
+    report_file: Path
+    report_samples: int
+    latency_runs: int
+
+
+@dataclass(frozen=True)
+class InferenceBackendConfig:
+    backend: str
+    onnx_model_dir: Path
+    intra_op_num_threads: int
+
+
+@dataclass(frozen=True)
+class AdaptiveDecodingConfig:
+    deadline_fraction: float
+    min_max_length: int
+    initial_ms_per_step: float
+    cost_smoothing: float
+    profiles: dict
+
+
+@dataclass(frozen=True)
+class TokenBudgetConfig:
+    max_input_chars: int
+    max_input_tokens: dict
+
+
+@dataclass(frozen=True)
+class BatchApiConfig:
+    max_items: int
+    max_total_tokens: int
+    max_body_mb: float
+    batch_size: int
+
+
+@dataclass(frozen=True)
+class JobQueueConfig:
+    root_dir: Path
+    num_workers: int
+    max_attempts: int
+    retry_backoff_seconds: float
+    lease_seconds: float
+    result_ttl_hours: float
+    poll_interval_seconds: float
+    cleanup_interval_seconds: float
+    max_worker_restarts: int
+
+
+@dataclass(frozen=True)
+class DocumentExtractionConfig:
+    max_workers: int
+    parallel_min_pages: Optional[int]
+    pages_per_task: int
+    max_pages: Optional[int]
+    docx_headers_footers: bool
+
+
+@dataclass(frozen=True)
+class UploadConfig:
+    max_file_mb: float
+    chunk_kb: int
+    spool_threshold_mb: float
+
+
+@dataclass(frozen=True)
+class ServingConfig:
+    workers: int
+    threads_per_worker: int
+    graceful_timeout_seconds: float
+    backlog: int
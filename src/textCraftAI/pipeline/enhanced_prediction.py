@@ -1,75 +1,131 @@
 from textCraftAI.config.configuration import ConfigurationManager
-from transformers import AutoTokenizer, pipeline
+from textCraftAI.components.model_registry import get_model_registry
+from textCraftAI.components.hierarchical_summarizer import HierarchicalSummarizer
+from textCraftAI.components.result_cache import ResultCache
+from textCraftAI.components.model_quantization import ModelQuantizer
+from textCraftAI.components.adaptive_decoding import AdaptiveDecoder
+from textCraftAI.components.token_budget import TokenBudget, TokenizedInput, input_text
+from textCraftAI.components.document_extraction import DocumentExtractor, group_blocks
+from textCraftAI.components.inference_backend import BackendLoadConfig, InferenceBackend, get_backend_class
+from textCraftAI.components.metrics import (GENERATED_TOKENS, INPUT_TOKENS, OUTPUT_TOKENS, STAGE_SECONDS,
+                                            TOKENS_PER_SECOND, timed_iter)
+from textCraftAI.utils.text_cleaner import clean_text, clean_texts
+from textCraftAI.logging import logger
+import hashlib
+import threading
+import time
 import os
-import PyPDF2
-import docx
 import io
-from typing import Union
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from textCraftAI.components.generation_stream import GenerationStream
+
+
+# Uploaded file content, either in memory or as a binary file object (e.g. a spooled upload)
+FileSource = Union[bytes, BinaryIO]
+
+# Seeded runs reseed torch's global RNG, so two of them must not interleave. Unseeded
+# sampling is not serialized; fork_rng hands it back the state the seeded run found.
+_SAMPLING_LOCK = threading.Lock()
+
+# Paraphrase max_length is rounded up and min_length down to these steps (in tokens)
+_PARAPHRASE_MAX_LENGTH_STEP = 32
+_PARAPHRASE_MIN_LENGTH_STEP = 8
+
+
+def _sha256(stream: BinaryIO, chunk_size: int = 1 << 16) -> str:
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
 
 
 class EnhancedPredictionPipeline:
     def __init__(self):
-        self.config = ConfigurationManager().get_model_evaluation_config()
-        self.max_file_size = 5 * 1024 * 1024  # 5MB limit
-        self.max_text_length = 10000  # Character limit for processing
+        config_manager = ConfigurationManager()
+        self.config = config_manager.get_model_evaluation_config()
+        self.registry_config = config_manager.get_model_registry_config()
+        self.max_file_size = int(config_manager.get_upload_config().max_file_mb * 1024 * 1024)
+        
+        # Pages are extracted lazily, large PDFs on a process pool
+        self.document_extractor = DocumentExtractor(config_manager.get_document_extraction_config())
         
-        # Cache for models to avoid reloading
-        self._summarization_pipeline = None
-        self._paraphrase_pipeline = None
+        # Quantization is applied by the loaders, before the registry sees the model
+        self.quantizer = ModelQuantizer(config_manager.get_model_quantization_config())
 
-    def _get_model_and_tokenizer(self):
-        """Get model and tokenizer with fallback logic and caching"""
+        self.backend_config = config_manager.get_inference_backend_config()
+        self.backend_class = get_backend_class(self.backend_config.backend)
+        if self.backend_class.name != "torch" and self.quantizer.config.mode != "none":
+            logger.warning("model_quantization only applies to the torch backend and is ignored")
+
+        # Models are shared process-wide through the registry, so creating
+        # another pipeline instance never reloads weights
+        self.registry = get_model_registry(self.registry_config)
+        self.registry.register("summarization", self._load_summarization_backend)
+        self.registry.register("paraphrase", self._load_paraphrase_backend)
+
+        # Inputs are tokenized once, checked against token limits and generated from their ids
+        self.token_budget = TokenBudget(config_manager.get_token_budget_config(), self.registry)
+
+        # Documents longer than one encoder window are summarized chunk by chunk
+        self.long_document_summarizer = HierarchicalSummarizer(
+            config_manager.get_long_document_config(), self
+        )
+
+        # Outputs keyed by input, decoding parameters and model fingerprint
+        self.result_cache = ResultCache(config_manager.get_result_cache_config())
+
+        # Picks decoding settings per request from its quality tier or latency budget
+        self.adaptive_decoder = AdaptiveDecoder(config_manager.get_adaptive_decoding_config())
+
+    def _get_model_and_tokenizer(self) -> Tuple[str, str]:
+        """Get model and tokenizer paths with fallback logic"""
         if os.path.exists(self.config.model_path) and os.path.exists(self.config.tokenizer_path):
             # Use trained model
-            tokenizer = AutoTokenizer.from_pretrained(
-                self.config.tokenizer_path,
-                cache_dir=os.environ.get('TRANSFORMERS_CACHE', '/root/.cache/huggingface/transformers')
-            )
-            model_path = self.config.model_path
-            print("Using trained model for prediction...")
-        else:
-            # Fallback to base model
-            model_path = "google/pegasus-cnn_dailymail"
-            tokenizer = AutoTokenizer.from_pretrained(
-                model_path,
-                cache_dir=os.environ.get('TRANSFORMERS_CACHE', '/root/.cache/huggingface/transformers')
-            )
-            print("Trained model not found. Using base model for prediction...")
-        
-        return model_path, tokenizer
-
-    def _get_summarization_pipeline(self):
-        """Get cached summarization pipeline"""
-        if self._summarization_pipeline is None:
-            model_path, tokenizer = self._get_model_and_tokenizer()
-            self._summarization_pipeline = pipeline(
-                "summarization", 
-                model=model_path, 
-                tokenizer=tokenizer,
-                model_kwargs={
-                    "cache_dir": os.environ.get('TRANSFORMERS_CACHE', '/root/.cache/huggingface/transformers')
-                }
-            )
-        return self._summarization_pipeline
-
-    def _get_paraphrase_pipeline(self):
-        """Get cached paraphrase pipeline"""
-        if self._paraphrase_pipeline is None:
-            self._paraphrase_pipeline = pipeline(
-                "text2text-generation", 
-                model="t5-base",
-                tokenizer="t5-base",
-                model_kwargs={
-                    "cache_dir": os.environ.get('TRANSFORMERS_CACHE', '/root/.cache/huggingface/transformers')
-                }            )
-        return self._paraphrase_pipeline
-
-    def summarize_text(self, text: str) -> str:
-        """Summarize input text using cached pipeline"""
-        if len(text) > self.max_text_length:
-            text = text[:self.max_text_length] + "..."
-        
-        gen_kwargs = {
+            logger.info("Using trained model for prediction")
+            return str(self.config.model_path), str(self.config.tokenizer_path)
+
+        # Fallback to base model
+        logger.info("Trained model not found. Using base model for prediction")
+        model_path = self.registry_config.summarization_fallback_model
+        return model_path, model_path
+
+    def _load_summarization_backend(self) -> InferenceBackend:
+        """Build the summarization backend (called once per process by the registry)"""
+        model_path, tokenizer = self._get_model_and_tokenizer()
+        return self.backend_class.load("summarization", model_path, self._backend_load_config(tokenizer))
+
+    def _load_paraphrase_backend(self) -> InferenceBackend:
+        """Build the paraphrase backend (called once per process by the registry)"""
+        model_path = self.registry_config.paraphrase_model
+        return self.backend_class.load("paraphrase", model_path, self._backend_load_config(model_path))
+
+    def _backend_load_config(self, tokenizer) -> BackendLoadConfig:
+        return BackendLoadConfig(
+            backend=self.backend_config,
+            tokenizer=tokenizer,
+            cache_dir=os.environ.get('TRANSFORMERS_CACHE', '/root/.cache/huggingface/transformers'),
+            mmap_weights=self.registry_config.mmap_weights,
+            quantizer=self.quantizer
+        )
+
+    def warmup_generate(self, task: str):
+        """Run one tiny generate on ``task``'s model so lazy initialization happens before real requests"""
+        backend = self.registry.get(task)
+        backend.generate(["Warm-up."], {"max_length": 8, "num_beams": 1, "do_sample": False})
+
+    def _get_summarization_pipeline(self) -> InferenceBackend:
+        """Get shared summarization backend"""
+        return self.registry.get("summarization")
+
+    def _get_paraphrase_pipeline(self) -> InferenceBackend:
+        """Get shared paraphrase backend"""
+        return self.registry.get("paraphrase")
+
+    def summarization_gen_kwargs(self) -> dict:
+        """Generation kwargs used for every summary"""
+        return {
             "length_penalty": 0.8, 
             "num_beams": 8, 
             "max_length": 128,
@@ -78,158 +134,359 @@ class EnhancedPredictionPipeline:
             "early_stopping": True
         }
 
-        pipe = self._get_summarization_pipeline()
-        output = pipe(text, **gen_kwargs)[0]["summary_text"]
+    def prepare_summarization(self, text: str) -> Tuple[TokenizedInput, dict]:
+        """Return the tokenized model input and generation kwargs for summarizing ``text``
         
-        return self._clean_text(output)
+        Raises ``InputTooLongError`` if ``text`` does not fit the encoder.
+        """
+        return self.token_budget.encode("summarization", text), self.summarization_gen_kwargs()
 
-    def paraphrase_text(self, text: str, length_factor: float = 1.0) -> str:
-        """Paraphrase input text using T5 model with configurable length using cached pipeline
+    def prepare_paraphrase(self, text: str, length_factor: float = 1.0, seed: Optional[int] = None,
+                           truncate: bool = False) -> Tuple[TokenizedInput, dict]:
+        """Return the tokenized model input and generation kwargs for paraphrasing ``text``
         
-        Args:
-            text: Input text to paraphrase
-            length_factor: Length multiplier (0.5 = shorter, 1.0 = same, 1.5 = longer)
+        A ``seed`` (or ``result_cache.paraphrase_seed``) makes sampling deterministic,
+        which is what allows paraphrases to be cached. Raises ``InputTooLongError``
+        if ``text`` does not fit the encoder, unless ``truncate`` is set (file
+        content), in which case only what fits is paraphrased.
         """
-        if len(text) > self.max_text_length:
-            text = text[:self.max_text_length] + "..."
-        
-        # Get cached pipeline
-        paraphrase_pipe = self._get_paraphrase_pipeline()
-        
         # Format input for T5 paraphrasing
-        input_text = f"paraphrase: {text}"
+        prefix = "paraphrase: "
+        model_input = self.token_budget.encode("paraphrase", f"{prefix}{text}", truncate=truncate)
         
-        # Calculate dynamic max_length based on input and user preference
-        input_word_count = len(text.split())
-        target_length = max(10, int(input_word_count * length_factor))
+        # Calculate dynamic max_length based on the input's own tokens and user preference
+        tokenizer = self.token_budget.tokenizer("paraphrase")
+        input_token_count = max(1, len(model_input) - tokenizer.num_special_tokens_to_add()
+                                - len(self.registry.get("paraphrase").prefix_ids)
+                                - self.token_budget.count_content_tokens("paraphrase", prefix))
+        target_length = max(10, int(input_token_count * length_factor))
         
         # Ensure reasonable bounds
-        min_length = max(5, int(input_word_count * 0.3))
-        max_length = min(512, int(input_word_count * 2.0))
+        min_length = max(5, int(input_token_count * 0.3))
+        max_length = min(512, int(input_token_count * 2.0))
         target_length = max(min_length, min(target_length, max_length))
+
+        # Rounded so paraphrases of similar inputs get the same generation kwargs and can share a batch
+        target_length = min(512, -(-target_length // _PARAPHRASE_MAX_LENGTH_STEP) * _PARAPHRASE_MAX_LENGTH_STEP)
+        min_length = max(5, min_length // _PARAPHRASE_MIN_LENGTH_STEP * _PARAPHRASE_MIN_LENGTH_STEP)
         
-        result = paraphrase_pipe(
-            input_text,
-            max_length=target_length,
-            min_length=min_length,
-            num_beams=4,
-            early_stopping=True,
-            do_sample=True,
-            temperature=0.7
-        )[0]["generated_text"]
+        gen_kwargs = {
+            "max_length": target_length,
+            "min_length": min_length,
+            "num_beams": 4,
+            "early_stopping": True,
+            "do_sample": True,
+            "temperature": 0.7
+        }
+        if seed is None:
+            seed = self.result_cache.config.paraphrase_seed
+        if seed is not None:
+            gen_kwargs["seed"] = seed
+        return model_input, gen_kwargs
+
+    def count_tokens(self, task: str, model_input: Union[str, TokenizedInput]) -> int:
+        """Number of encoder tokens ``model_input`` produces for ``task``"""
+        if isinstance(model_input, TokenizedInput):
+            return len(model_input)
+        backend = self.registry.get(task)
+        return len(backend.encode(model_input, truncation=True))
+
+    def plan_decoding(self, task: str, model_input: Union[str, TokenizedInput], gen_kwargs: dict, quality: Optional[str] = None,
+                      latency_budget_ms: Optional[float] = None) -> Tuple[dict, dict]:
+        """Adapt prepared ``gen_kwargs`` to a quality tier and/or latency budget
         
-        return self._clean_text(result)
+        Returns the kwargs to generate with and a description of the chosen
+        decoding profile. Without a quality or budget the kwargs are unchanged.
+        """
+        if quality is None and latency_budget_ms is None:
+            return gen_kwargs, self.adaptive_decoder.describe_default(gen_kwargs)
+        input_tokens = self.count_tokens(task, model_input)
+        return self.adaptive_decoder.plan(task, gen_kwargs, input_tokens, quality, latency_budget_ms)
 
-    def extract_text_from_pdf(self, file_content: bytes) -> str:
-        """Extract text from PDF file"""
-        if len(file_content) > self.max_file_size:
+    def generate_batch(self, task: str, model_inputs: List[Union[str, TokenizedInput]], gen_kwargs: dict) -> List[str]:
+        """Run one batched generate over prepared inputs sharing ``gen_kwargs``
+        
+        Deterministic requests (no sampling, or seeded sampling) are served from
+        the result cache when possible; only the misses are generated.
+        
+        Args:
+            task: Registry name of the model, "summarization" or "paraphrase"
+            model_inputs: Inputs returned by ``prepare_summarization``/``prepare_paraphrase``
+            gen_kwargs: Generation kwargs shared by every input in the batch
+        """
+        gen_kwargs = dict(gen_kwargs)
+        seed = gen_kwargs.pop("seed", None)
+        cacheable = self.result_cache.config.enabled and (not gen_kwargs.get("do_sample") or seed is not None)
+        
+        results: List[Optional[str]] = [None] * len(model_inputs)
+        if cacheable:
+            fingerprint = self.registry.fingerprint(task)
+            # A finished result is valid whatever deadline it was generated under
+            key_kwargs = {key: value for key, value in gen_kwargs.items() if key != "max_time"}
+            keys = [
+                ResultCache.make_key(task, input_text(model_input), {**key_kwargs, "seed": seed}, fingerprint)
+                for model_input in model_inputs
+            ]
+            results = [self.result_cache.get(key) for key in keys]
+        
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            started = time.perf_counter()
+            generated = self._generate_uncached(task, [model_inputs[i] for i in missing], gen_kwargs, seed)
+            # Output cut off by the deadline depends on timing, so it is never cached
+            deadline = gen_kwargs.get("max_time")
+            cut_off = deadline is not None and time.perf_counter() - started >= deadline
+            for i, text in zip(missing, generated):
+                results[i] = text
+                if cacheable and not cut_off:
+                    self.result_cache.put(keys[i], text)
+        return results
+
+    def _generate_uncached(self, task: str, model_inputs: List[Union[str, TokenizedInput]], gen_kwargs: dict,
+                           seed: Optional[int]) -> List[str]:
+        import torch
+
+        backend = self.registry.get(task)
+        
+        if seed is not None:
+            # Seed every input separately so its output does not depend on the rest of the batch
+            outputs = []
+            with _SAMPLING_LOCK, torch.random.fork_rng():
+                for model_input in model_inputs:
+                    torch.manual_seed(seed)
+                    outputs.extend(self._timed_generate(task, backend, [model_input], gen_kwargs))
+        else:
+            outputs = self._timed_generate(task, backend, model_inputs, gen_kwargs)
+        with STAGE_SECONDS.time("cleaning", task, ""):
+            return clean_texts(outputs)
+
+    def _timed_generate(self, task: str, backend: InferenceBackend, model_inputs: List[Union[str, TokenizedInput]],
+                        gen_kwargs: dict) -> List[str]:
+        """Generate from token ids and feed the measured per-step cost to the adaptive decoder"""
+        if all(isinstance(model_input, TokenizedInput) for model_input in model_inputs):
+            batch_ids = [model_input.input_ids for model_input in model_inputs]
+        else:
+            # Inputs prepared by TokenBudget are timed there; tokenize the rest here
+            with STAGE_SECONDS.time("tokenization", task, ""):
+                batch_ids = [
+                    model_input.input_ids if isinstance(model_input, TokenizedInput)
+                    else backend.encode(model_input, truncation=True)
+                    for model_input in model_inputs
+                ]
+        started = time.perf_counter()
+        outputs, steps, output_tokens = backend.generate_ids(batch_ids, gen_kwargs)
+        seconds = time.perf_counter() - started
+        
+        self.adaptive_decoder.record(
+            task, seconds, gen_kwargs.get("num_beams", 1), steps, [len(ids) for ids in batch_ids]
+        )
+        STAGE_SECONDS.observe(seconds, "generation", task, "")
+        for ids in batch_ids:
+            INPUT_TOKENS.observe(len(ids), task)
+        for count in output_tokens:
+            OUTPUT_TOKENS.observe(count, task)
+        GENERATED_TOKENS.inc(task, amount=sum(output_tokens))
+        if seconds > 0:
+            TOKENS_PER_SECOND.observe(sum(output_tokens) / seconds, task)
+        return outputs
+
+    def open_stream(self, task: str, model_input: Union[str, TokenizedInput], gen_kwargs: dict) -> "GenerationStream":
+        """Create a token-by-token generation for one prepared input
+        
+        The caller schedules ``stream.run`` on a worker thread and iterates the
+        stream for cleaned text as it is decoded. Streaming uses a single
+        hypothesis (``num_beams=1``), so output can differ from the beam-search
+        result of ``generate_batch``.
+        """
+        gen_kwargs = {key: value for key, value in gen_kwargs.items() if key != "seed"}
+        
+        def clean(text: str) -> str:
+            with STAGE_SECONDS.time("cleaning", task, ""):
+                return self._clean_text(text)
+        
+        return self.registry.get(task).open_stream(model_input, gen_kwargs, clean)
+
+    def summarize_text(self, text: str, quality: Optional[str] = None,
+                       latency_budget_ms: Optional[float] = None) -> str:
+        """Summarize input text using the shared pipeline
+        
+        Args:
+            text: Input text to summarize
+            quality: Decoding profile from ``adaptive_decoding.profiles``
+            latency_budget_ms: Generation budget; decoding is adapted to fit it
+        """
+        model_input, gen_kwargs = self.prepare_summarization(text)
+        gen_kwargs, _ = self.plan_decoding("summarization", model_input, gen_kwargs, quality, latency_budget_ms)
+        return self.generate_batch("summarization", [model_input], gen_kwargs)[0]
+
+    def summarize_long_text(self, document: Union[str, Iterable[str]]) -> str:
+        """Summarize a document of any length with hierarchical map-reduce
+        
+        Args:
+            document: Full text, or an iterable of text pieces (e.g. pages) consumed lazily
+        """
+        return self.long_document_summarizer.summarize(document)
+
+    def paraphrase_text(self, text: str, length_factor: float = 1.0, seed: Optional[int] = None,
+                        quality: Optional[str] = None, latency_budget_ms: Optional[float] = None,
+                        truncate: bool = False) -> str:
+        """Paraphrase input text using T5 model with configurable length using the shared pipeline
+        
+        Args:
+            text: Input text to paraphrase
+            length_factor: Length multiplier (0.5 = shorter, 1.0 = same, 1.5 = longer)
+            seed: Seed for deterministic (and therefore cacheable) sampling
+            quality: Decoding profile from ``adaptive_decoding.profiles``
+            latency_budget_ms: Generation budget; decoding is adapted to fit it
+            truncate: Cut text past the token limit instead of rejecting it
+        """
+        model_input, gen_kwargs = self.prepare_paraphrase(text, length_factor, seed, truncate)
+        gen_kwargs, _ = self.plan_decoding("paraphrase", model_input, gen_kwargs, quality, latency_budget_ms)
+        return self.generate_batch("paraphrase", [model_input], gen_kwargs)[0]
+
+    def _open_file(self, source: FileSource) -> BinaryIO:
+        """Binary stream over uploaded file content, rewound and checked against the size limit"""
+        stream = io.BytesIO(source) if isinstance(source, (bytes, bytearray, memoryview)) else source
+        size = stream.seek(0, io.SEEK_END)
+        if size > self.max_file_size:
             raise ValueError(f"File size exceeds {self.max_file_size // (1024*1024)}MB limit")
+        stream.seek(0)
+        return stream
+
+    def extract_text_from_pdf(self, source: FileSource, task: str = "") -> str:
+        """Extract text from PDF file"""
+        return "\n".join(self.iter_pdf_pages(source, task)).strip()
+
+    def iter_pdf_pages(self, source: FileSource, task: str = "") -> Iterator[str]:
+        """Yield the text of each PDF page in order, as it is extracted"""
+        stream = self._open_file(source)
         
         try:
-            pdf_file = io.BytesIO(file_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            
-            text = ""
-            max_pages = 10  # Limit to first 10 pages
-            
-            for page_num in range(min(len(pdf_reader.pages), max_pages)):
-                page = pdf_reader.pages[page_num]
-                text += page.extract_text() + "\n"
-            
-            return text.strip()
-        
+            yield from timed_iter(
+                self.document_extractor.iter_pdf_pages(stream), STAGE_SECONDS, "extraction", task, "pdf"
+            )
         except Exception as e:
             raise ValueError(f"Error processing PDF: {str(e)}")
 
-    def extract_text_from_docx(self, file_content: bytes) -> str:
-        """Extract text from DOCX file"""
-        if len(file_content) > self.max_file_size:
-            raise ValueError(f"File size exceeds {self.max_file_size // (1024*1024)}MB limit")
+    def extract_text_from_docx(self, source: FileSource, task: str = "") -> str:
+        """Extract text from DOCX file (paragraphs and table cells)"""
+        return "\n".join(self.iter_docx_blocks(source, task)).strip()
+
+    def iter_docx_blocks(self, source: FileSource, task: str = "") -> Iterator[str]:
+        """Yield the paragraphs and table cells of a DOCX in document order, as they are parsed"""
+        stream = self._open_file(source)
         
         try:
-            docx_file = io.BytesIO(file_content)
-            doc = docx.Document(docx_file)
-            
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            
-            return text.strip()
-        
+            yield from timed_iter(
+                self.document_extractor.iter_docx_blocks(stream), STAGE_SECONDS, "extraction", task, "docx"
+            )
         except Exception as e:
             raise ValueError(f"Error processing DOCX: {str(e)}")
 
-    def process_file(self, file_content: bytes, filename: str, operation: str, length_factor: float = 1.0) -> str:
-        """Process uploaded file and perform operation"""
-        # Extract text based on file type
+    def extract_text(self, source: FileSource, filename: str, task: str = "") -> str:
+        """Extract text from an uploaded PDF, DOCX or TXT file (bytes or a binary file object)
+
+        ``task`` (``summarization`` or ``paraphrase``) labels the extraction metric.
+        """
         if filename.lower().endswith('.pdf'):
-            text = self.extract_text_from_pdf(file_content)
+            text = self.extract_text_from_pdf(source, task)
         elif filename.lower().endswith('.docx'):
-            text = self.extract_text_from_docx(file_content)
+            text = self.extract_text_from_docx(source, task)
         elif filename.lower().endswith('.txt'):
-            text = file_content.decode('utf-8')
+            with STAGE_SECONDS.time("extraction", task, "txt"):
+                text = self._open_file(source).read().decode('utf-8')
         else:
             raise ValueError("Unsupported file type. Please upload PDF, DOCX, or TXT files.")
         
         if not text.strip():
             raise ValueError("No readable text found in the uploaded file.")
         
-        # Perform requested operation
-        if operation == "summarize":
-            return self.summarize_text(text)
-        elif operation == "paraphrase":
-            return self.paraphrase_text(text, length_factor)
-        else:
-            raise ValueError("Invalid operation. Choose 'summarize' or 'paraphrase'.")
+        return text
 
-    def _clean_text(self, text: str) -> str:
-        """Clean the generated text by removing special tokens and formatting issues"""
-        import re
-        
-        # Remove common special tokens and artifacts
-        special_tokens = [
-            '<n>', '</s>', '<pad>', '<unk>', '<s>', '<mask>',
-            '<|endoftext|>', '<|startoftext|>', '<bos>', '<eos>',
-            '[UNK]', '[PAD]', '[CLS]', '[SEP]', '[MASK]',
-            '<extra_id_0>', '<extra_id_1>', '<extra_id_2>',
-            '<<UNK>>', '##', '<|im_start|>', '<|im_end|>'
-        ]
-        
-        cleaned_text = text
-        
-        # Remove special tokens (case insensitive)
-        for token in special_tokens:
-            cleaned_text = re.sub(re.escape(token), '', cleaned_text, flags=re.IGNORECASE)
+    def iter_document(self, source: FileSource, filename: str, task: str = "summarization") -> Iterator[str]:
+        """Yield the text of an uploaded file in pieces (pages for PDFs, runs of paragraphs for DOCX) as it is extracted
         
-        # Remove HTML/XML-like tags
-        cleaned_text = re.sub(r'<[^>]+>', '', cleaned_text)
+        Feeding this to ``summarize_long_text`` overlaps extraction with summarization.
+        """
+        if filename.lower().endswith('.pdf'):
+            pieces = self.iter_pdf_pages(source, task)
+        elif filename.lower().endswith('.docx'):
+            pieces = group_blocks(self.iter_docx_blocks(source, task))
+        else:
+            pieces = iter([self.extract_text(source, filename, task)])
         
-        # Remove unusual whitespace characters and normalize
-        cleaned_text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', cleaned_text)
-        cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
-        cleaned_text = re.sub(r'\n+', ' ', cleaned_text)
+        found_text = False
+        for piece in pieces:
+            found_text = found_text or bool(piece.strip())
+            yield piece
+        if not found_text:
+            raise ValueError("No readable text found in the uploaded file.")
+
+    def summarize_file(self, source: FileSource, filename: str) -> str:
+        """Summarize an uploaded file in full, summarizing pages while later ones are extracted"""
+        return self.summarize_long_text(self.iter_document(source, filename))
+
+    def file_cache_key(self, content_sha256: str, filename: str, operation: str,
+                       length_factor: float = 1.0, seed: Optional[int] = None) -> Optional[str]:
+        """Result cache key for a processed file, or None when the result is not cacheable
         
-        # Remove leading/trailing whitespace
-        cleaned_text = cleaned_text.strip()
+        ``content_sha256`` is the hex SHA-256 of the file, computed while it was uploaded.
+        """
+        if not self.result_cache.config.enabled or operation not in ("summarize", "paraphrase"):
+            return None
         
-        # Remove leading/trailing punctuation that might be artifacts
-        cleaned_text = re.sub(r'^[^\w\'"]*', '', cleaned_text)
-        cleaned_text = re.sub(r'[^\w\'".,!?;:]*$', '', cleaned_text)
+        if operation == "summarize":
+            # Files are summarized chunk by chunk, so the chunking changes the summary too
+            long_document = self.long_document_summarizer.config
+            task, params = "summarization", {
+                **self.summarization_gen_kwargs(),
+                "chunk_tokens": long_document.chunk_tokens,
+                "overlap_tokens": long_document.overlap_tokens,
+                "max_depth": long_document.max_depth,
+                "chunk_batch_size": long_document.chunk_batch_size,
+            }
+        else:
+            if seed is None:
+                seed = self.result_cache.config.paraphrase_seed
+            if seed is None:
+                # Unseeded sampling gives a different paraphrase every time
+                return None
+            task, params = "paraphrase", {"length_factor": length_factor, "seed": seed}
         
-        # Fix common spacing issues around punctuation
-        cleaned_text = re.sub(r'\s+([.,!?;:])', r'\1', cleaned_text)
-        cleaned_text = re.sub(r'([.,!?;:])([A-Za-z])', r'\1 \2', cleaned_text)
+        params["extension"] = os.path.splitext(filename.lower())[1]
+        return ResultCache.make_key(f"file:{operation}", content_sha256, params, self.registry.fingerprint(task))
+
+    def process_file(self, source: FileSource, filename: str, operation: str, length_factor: float = 1.0,
+                     seed: Optional[int] = None, content_sha256: Optional[str] = None) -> str:
+        """Process uploaded file and perform operation
         
-        # Ensure proper sentence capitalization
-        if cleaned_text and not cleaned_text[0].isupper():
-            cleaned_text = cleaned_text[0].upper() + cleaned_text[1:]
+        ``content_sha256`` avoids hashing the file again when the caller already did.
+        """
+        if content_sha256 is None:
+            content_sha256 = _sha256(self._open_file(source))
+        cache_key = self.file_cache_key(content_sha256, filename, operation, length_factor, seed)
+        if cache_key is not None:
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                return cached
         
-        # Handle multiple consecutive punctuation
-        cleaned_text = re.sub(r'[.]{2,}', '.', cleaned_text)
-        cleaned_text = re.sub(r'[!]{2,}', '!', cleaned_text)
-        cleaned_text = re.sub(r'[?]{2,}', '?', cleaned_text)
+        # Perform requested operation
+        if operation == "summarize":
+            result = self.summarize_file(source, filename)
+        elif operation == "paraphrase":
+            result = self.paraphrase_text(
+                self.extract_text(source, filename, "paraphrase"), length_factor, seed, truncate=True
+            )
+        else:
+            raise ValueError("Invalid operation. Choose 'summarize' or 'paraphrase'.")
         
-        return cleaned_text
+        if cache_key is not None:
+            self.result_cache.put(cache_key, result)
+        return result
+
+    def _clean_text(self, text: str) -> str:
+        """Clean the generated text by removing special tokens and formatting issues"""
+        return clean_text(text)
 
 
 # Backward compatibility - keep the original class for existing code
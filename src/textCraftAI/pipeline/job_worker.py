@@ -0,0 +1,177 @@
+import multiprocessing
+import os
+import socket
+import threading
+import time
+from typing import Any, List, Optional
+
+from textCraftAI.entity.config_entity import JobQueueConfig
+from textCraftAI.components.job_queue import JobStore
+from textCraftAI.logging import logger
+
+
+def _renew_lease(store: JobStore, job_id: str, worker: str, interval: float, done: threading.Event):
+    while not done.wait(interval):
+        if not store.heartbeat(job_id, worker):
+            logger.warning(f"Worker {worker} lost the lease on job {job_id}")
+            return
+
+
+def run_worker(config: JobQueueConfig, stop_event: Optional[Any] = None):
+    """Process queued jobs until ``stop_event`` is set (runs inside a worker process)
+
+    The prediction pipeline is created and its models warmed up once, so
+    every job after the first runs on loaded models.
+    """
+    # Imported here so the parent process (the API) does not pay for it twice
+    from textCraftAI.pipeline.enhanced_prediction import EnhancedPredictionPipeline
+
+    worker = f"{socket.gethostname()}-{os.getpid()}"
+    store = JobStore(config)
+    predictor = EnhancedPredictionPipeline()
+    predictor.registry.warmup()
+    logger.info(f"Job worker {worker} ready")
+
+    last_cleanup = 0.0
+    while stop_event is None or not stop_event.is_set():
+        if time.time() - last_cleanup >= config.cleanup_interval_seconds:
+            store.cleanup()
+            last_cleanup = time.time()
+
+        job = store.claim(worker)
+        if job is None:
+            if stop_event is not None:
+                stop_event.wait(config.poll_interval_seconds)
+            else:
+                time.sleep(config.poll_interval_seconds)
+            continue
+
+        logger.info(f"Worker {worker} processing job {job['id']} ({job['operation']} {job['filename']}, "
+                    f"attempt {job['attempt']})")
+        done = threading.Event()
+        heartbeat = threading.Thread(
+            target=_renew_lease, args=(store, job["id"], worker, config.lease_seconds / 3, done), daemon=True
+        )
+        heartbeat.start()
+        started = time.perf_counter()
+        try:
+            result = predictor.process_file(
+                job["file_content"], job["filename"], job["operation"], job["length_factor"], job["seed"],
+                content_sha256=job["content_sha256"]
+            )
+        except ValueError as e:
+            # Bad input (unsupported file, no text, too long) fails the same way on every attempt
+            store.fail(job["id"], worker, str(e), retryable=False)
+            logger.info(f"Job {job['id']} failed: {e}")
+        except Exception as e:
+            retrying = store.fail(job["id"], worker, f"{type(e).__name__}: {e}")
+            logger.exception(f"Job {job['id']} attempt {job['attempt']} failed{', will retry' if retrying else ''}: {e}")
+        else:
+            store.complete(job["id"], worker, result)
+            logger.info(f"Job {job['id']} finished in {time.perf_counter() - started:.1f}s")
+        finally:
+            done.set()
+            heartbeat.join()
+
+    logger.info(f"Job worker {worker} stopped")
+
+
+class JobWorkerPool:
+    """Worker processes that execute queued jobs with their own warm models.
+
+    Processes are started with ``spawn`` so they never inherit the parent's
+    threads or model state half-initialized; each loads its models once. A
+    monitor thread replaces workers that die (e.g. killed while processing a
+    file that exhausts memory), up to ``max_worker_restarts`` times.
+    """
+
+    def __init__(self, config: JobQueueConfig, num_workers: Optional[int] = None):
+        self.config = config
+        self.num_workers = config.num_workers if num_workers is None else num_workers
+        self.restarts = 0
+        self._context = multiprocessing.get_context("spawn")
+        self._stop_event = self._context.Event()
+        self._processes: List[multiprocessing.Process] = []
+        self._lock = threading.Lock()
+        self._monitor: Optional[threading.Thread] = None
+
+    def start(self):
+        for index in range(self.num_workers):
+            self._processes.append(self._spawn(index))
+        if self._processes:
+            logger.info(f"Started {len(self._processes)} job worker processes")
+            self._monitor = threading.Thread(target=self._supervise, name="job-worker-monitor", daemon=True)
+            self._monitor.start()
+
+    def stop(self, timeout: float = 30.0):
+        """Let workers finish their current job, then terminate any that do not exit in time
+
+        An interrupted job keeps its lease until it expires and is then retried.
+        """
+        self._stop_event.set()
+        if self._monitor is not None:
+            self._monitor.join()
+            self._monitor = None
+        deadline = time.monotonic() + timeout
+        for process in self._processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning(f"Terminating {process.name}, its job will be retried after the lease expires")
+                process.terminate()
+        self._processes = []
+
+    def detach(self):
+        """Forget the workers in a forked child; the process that started them keeps managing them"""
+        self.num_workers = 0
+        self._processes = []
+        # The monitor thread does not exist in the child
+        self._monitor = None
+        # Setting the inherited event would stop the parent's workers when this process shuts down
+        self._stop_event = threading.Event()
+
+    def join(self):
+        # The monitor runs until the pool is stopped or no worker is left to replace
+        if self._monitor is not None:
+            self._monitor.join()
+        for process in self._processes:
+            process.join()
+
+    def status(self) -> dict:
+        return {
+            "workers": len(self._processes),
+            "alive": sum(process.is_alive() for process in self._processes),
+            "restarts": self.restarts,
+        }
+
+    def restart_dead_workers(self) -> int:
+        """Replace workers that exited while the pool is running; returns how many were restarted"""
+        restarted = 0
+        with self._lock:
+            for index, process in enumerate(self._processes):
+                if process.is_alive() or self._stop_event.is_set():
+                    continue
+                if self.restarts >= self.config.max_worker_restarts:
+                    break
+                process.join()
+                self.restarts += 1
+                restarted += 1
+                logger.warning(f"{process.name} exited with code {process.exitcode}, restarting it "
+                               f"(restart {self.restarts} of {self.config.max_worker_restarts})")
+                self._processes[index] = self._spawn(index)
+        return restarted
+
+    def _supervise(self):
+        while not self._stop_event.wait(self.config.poll_interval_seconds):
+            self.restart_dead_workers()
+            if self.restarts >= self.config.max_worker_restarts and not any(
+                process.is_alive() for process in self._processes
+            ):
+                logger.error(f"All job workers died after {self.restarts} restarts, no longer restarting them")
+                return
+
+    def _spawn(self, index: int) -> multiprocessing.Process:
+        process = self._context.Process(
+            target=run_worker, args=(self.config, self._stop_event), name=f"job-worker-{index}", daemon=True
+        )
+        process.start()
+        return process
@@ -0,0 +1,134 @@
+import gc
+import os
+import signal
+import socket
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import uvicorn
+
+from textCraftAI.entity.config_entity import ServingConfig
+from textCraftAI.logging import logger
+
+
+class PreforkServer:
+    """Serves an ASGI app from worker processes forked after the app is preloaded.
+
+    ``preload`` runs once in the master (e.g. to load the models), then the
+    master binds the listening socket and forks ``workers`` processes that run
+    uvicorn on it. Workers share the master's memory copy-on-write, so model
+    weights are read by all of them but held once. The garbage collector is
+    frozen before forking so collections in the workers do not write to the
+    inherited objects. A worker that dies is replaced by a fresh fork of the
+    master, which is still preloaded, so the replacement starts in
+    milliseconds without loading anything. ``when_ready`` runs in the master
+    once the first workers are forked, for work that starts threads or
+    processes the workers must not inherit.
+    """
+
+    def __init__(self, config: ServingConfig, app: Any, host: str = "0.0.0.0", port: int = 8080,
+                 preload: Optional[Callable[[], None]] = None,
+                 post_fork: Optional[Callable[[int], None]] = None,
+                 when_ready: Optional[Callable[[], None]] = None):
+        self.config = config
+        self.app = app
+        self.host = host
+        self.port = port
+        self.preload = preload
+        self.post_fork = post_fork
+        self.when_ready = when_ready
+
+        self._workers: Dict[int, Tuple[int, float]] = {}  # pid -> (worker index, start time)
+        self._stopping = False
+
+    def run(self):
+        """Preload, fork the workers and supervise them until SIGINT or SIGTERM"""
+        if self.preload is not None:
+            started = time.perf_counter()
+            self.preload()
+            logger.info(f"Preloaded app in {time.perf_counter() - started:.1f}s")
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(self.config.backlog)
+        sock.set_inheritable(True)
+
+        # Everything allocated so far is shared with the workers; keep the GC off it
+        gc.collect()
+        gc.freeze()
+
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        for index in range(self.config.workers):
+            self._fork(index, sock)
+        logger.info(f"Serving on {self.host}:{self.port} with {self.config.workers} workers (master {os.getpid()})")
+
+        try:
+            if self.when_ready is not None:
+                self.when_ready()
+            self._supervise(sock)
+        finally:
+            self._stop_workers()
+            sock.close()
+
+    def _fork(self, index: int, sock: socket.socket):
+        pid = os.fork()
+        if pid:
+            self._workers[pid] = (index, time.monotonic())
+            return
+
+        # Worker process: never return into the master's code
+        exit_code = 1
+        try:
+            # Own process group, so a terminal's Ctrl+C reaches only the master, which stops the workers
+            os.setpgid(0, 0)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            if self.post_fork is not None:
+                self.post_fork(index)
+            server = uvicorn.Server(uvicorn.Config(self.app, host=self.host, port=self.port, lifespan="on"))
+            server.run(sockets=[sock])
+            exit_code = 0
+        except BaseException:
+            logger.exception(f"Worker {index} (pid {os.getpid()}) crashed")
+        finally:
+            os._exit(exit_code)
+
+    def _supervise(self, sock: socket.socket):
+        # Reap only our workers by pid: the master may have other children (e.g. job workers)
+        while not self._stopping:
+            time.sleep(0.5)
+            for pid, (index, started) in list(self._workers.items()):
+                if self._stopping or os.waitpid(pid, os.WNOHANG)[0] == 0:
+                    continue
+                del self._workers[pid]
+                logger.warning(f"Worker {index} (pid {pid}) exited, restarting it")
+                if time.monotonic() - started < 1.0:
+                    # Do not spin if workers die right after starting
+                    time.sleep(1.0)
+                self._fork(index, sock)
+
+    def _handle_stop(self, signum: int, frame: Any):
+        self._stopping = True
+
+    def _stop_workers(self):
+        """Let workers finish in-flight requests, then kill any that do not exit in time"""
+        logger.info(f"Stopping {len(self._workers)} workers")
+        for pid in self._workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        deadline = time.monotonic() + self.config.graceful_timeout_seconds
+        while self._workers and time.monotonic() < deadline:
+            for pid in list(self._workers):
+                if os.waitpid(pid, os.WNOHANG)[0]:
+                    del self._workers[pid]
+            time.sleep(0.1)
+        for pid in list(self._workers):
+            logger.warning(f"Killing worker pid {pid}, it did not stop within "
+                           f"{self.config.graceful_timeout_seconds}s")
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        self._workers = {}
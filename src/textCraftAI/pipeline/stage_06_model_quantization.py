@@ -0,0 +1,16 @@
+from textCraftAI.config.configuration import ConfigurationManager
+from textCraftAI.components.quantization_report import QuantizationReport
+from textCraftAI.logging import logger
+
+class ModelQuantizationTrainingPipeline:
+    def __init__(self):
+        pass
+    
+    def main(self):
+        config = ConfigurationManager()
+        quantization_report = QuantizationReport(
+            config=config.get_model_quantization_config(),
+            evaluation_config=config.get_model_evaluation_config(),
+            registry_config=config.get_model_registry_config()
+        )
+        quantization_report.compare()
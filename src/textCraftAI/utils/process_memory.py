@@ -0,0 +1,59 @@
+import os
+from typing import Dict, List
+
+
+# Fields of /proc/<pid>/smaps_rollup summed into a memory breakdown, in kB
+_SMAPS_FIELDS = ("Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty", "Anonymous", "Swap")
+
+
+def read_smaps(pid: int) -> Dict[str, int]:
+    """Memory counters of process ``pid`` in bytes, from ``smaps_rollup`` (or ``smaps`` on older kernels)"""
+    totals = dict.fromkeys(_SMAPS_FIELDS, 0)
+    path = f"/proc/{pid}/smaps_rollup"
+    if not os.path.exists(path):
+        path = f"/proc/{pid}/smaps"
+    with open(path) as f:
+        for line in f:
+            field, _, value = line.partition(":")
+            if field in totals:
+                totals[field] += int(value.split()[0]) * 1024
+    return totals
+
+
+def process_memory(pid: int) -> dict:
+    """Unique, shared and proportional memory of process ``pid`` in MB
+
+    ``unique_mb`` (USS) is what the process alone holds and what exiting it
+    would free. ``shared_mb`` is resident memory also mapped by other
+    processes, such as model weights inherited through fork or memory-mapped
+    files. ``pss_mb`` splits shared pages evenly between the processes mapping
+    them, so the PSS of all processes adds up to their real footprint.
+    """
+    counters = read_smaps(pid)
+    mb = 1024 * 1024
+    return {
+        "pid": pid,
+        "rss_mb": round(counters["Rss"] / mb, 1),
+        "pss_mb": round(counters["Pss"] / mb, 1),
+        "unique_mb": round((counters["Private_Clean"] + counters["Private_Dirty"]) / mb, 1),
+        "shared_mb": round((counters["Shared_Clean"] + counters["Shared_Dirty"]) / mb, 1),
+        "anonymous_mb": round(counters["Anonymous"] / mb, 1),
+        "swap_mb": round(counters["Swap"] / mb, 1),
+    }
+
+
+def child_pids(pid: int) -> List[int]:
+    """Direct children of process ``pid``"""
+    children = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The command name may contain spaces, the fields after it do not
+                fields = f.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        if int(fields[1]) == pid:
+            children.append(int(entry))
+    return sorted(children)
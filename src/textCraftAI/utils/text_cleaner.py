@@ -0,0 +1,79 @@
+import re
+from typing import Iterable, List
+
+
+# Special tokens and artifacts models leave in decoded text
+SPECIAL_TOKENS = (
+    '<n>', '</s>', '<pad>', '<unk>', '<s>', '<mask>',
+    '<|endoftext|>', '<|startoftext|>', '<bos>', '<eos>',
+    '[UNK]', '[PAD]', '[CLS]', '[SEP]', '[MASK]',
+    '<extra_id_0>', '<extra_id_1>', '<extra_id_2>',
+    '<<UNK>>', '##', '<|im_start|>', '<|im_end|>'
+)
+
+# Removal is order dependent (removing one token can form or break another), so the
+# per-token patterns are applied in list order to keep the original semantics. A
+# substring test on the case-folded text skips the regex scan for absent tokens.
+_SPECIAL_TOKEN_PATTERNS = tuple(
+    (token.casefold(), re.compile(re.escape(token), re.IGNORECASE)) for token in SPECIAL_TOKENS
+)
+
+
+def _fold(text: str) -> str:
+    # re.IGNORECASE also matches dotless "ı" to "i", which casefold() keeps distinct
+    return text.casefold().replace('ı', 'i')
+
+_TAGS = re.compile(r'<[^>]+>')
+_CONTROL_CHARS = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+_WHITESPACE = re.compile(r'\s+')
+
+# Leading artifacts and trailing non-sentence punctuation. An end-anchored ``...*$``
+# is retried from every position, so the trailing run is matched on the reversed text.
+_LEADING_ARTIFACTS = re.compile(r'[^\w\'"]*')
+_TRAILING_ARTIFACTS = re.compile(r'[^\w\'".,!?;:]*')
+
+_SPACE_BEFORE_PUNCTUATION = re.compile(r'\s+([.,!?;:])')
+_MISSING_SPACE_AFTER_PUNCTUATION = re.compile(r'([.,!?;:])([A-Za-z])')
+
+# Runs of the same terminal punctuation ("...", "!!", "??") collapse to one
+_REPEATED_PUNCTUATION = re.compile(r'([.!?])\1+')
+
+
+def clean_text(text: str) -> str:
+    """Clean the generated text by removing special tokens and formatting issues"""
+    cleaned_text = text
+
+    # Remove special tokens (case insensitive)
+    folded = _fold(cleaned_text)
+    for folded_token, pattern in _SPECIAL_TOKEN_PATTERNS:
+        if folded_token in folded:
+            cleaned_text = pattern.sub('', cleaned_text)
+            folded = _fold(cleaned_text)
+
+    # Remove HTML/XML-like tags and control characters, then normalize whitespace.
+    # Newlines are control characters, so no separate newline pass is needed.
+    cleaned_text = _TAGS.sub('', cleaned_text)
+    cleaned_text = _CONTROL_CHARS.sub('', cleaned_text)
+    cleaned_text = _WHITESPACE.sub(' ', cleaned_text).strip()
+
+    # Remove leading/trailing punctuation that might be artifacts
+    cleaned_text = cleaned_text[_LEADING_ARTIFACTS.match(cleaned_text).end():]
+    trailing = _TRAILING_ARTIFACTS.match(cleaned_text[::-1]).end()
+    if trailing:
+        cleaned_text = cleaned_text[:-trailing]
+
+    # Fix common spacing issues around punctuation
+    cleaned_text = _SPACE_BEFORE_PUNCTUATION.sub(r'\1', cleaned_text)
+    cleaned_text = _MISSING_SPACE_AFTER_PUNCTUATION.sub(r'\1 \2', cleaned_text)
+
+    # Ensure proper sentence capitalization
+    if cleaned_text and not cleaned_text[0].isupper():
+        cleaned_text = cleaned_text[0].upper() + cleaned_text[1:]
+
+    # Handle multiple consecutive punctuation
+    return _REPEATED_PUNCTUATION.sub(r'\1', cleaned_text)
+
+
+def clean_texts(texts: Iterable[str]) -> List[str]:
+    """Clean a batch of generated texts"""
+    return [clean_text(text) for text in texts]
@@ -0,0 +1,22 @@
+import os
+import sys
+
+import pytest
+
+# Tests run against the source tree (``src`` layout) and import the benchmark helpers from the repo root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (os.path.join(ROOT, "src"), ROOT):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+@pytest.fixture(scope="session")
+def tiny_model_dir(tmp_path_factory):
+    """A randomly initialized T5 model with a word-level tokenizer, built locally"""
+    pytest.importorskip("torch")
+    pytest.importorskip("transformers")
+    from benchmarks.suite.tiny_models import build_tiny_model
+
+    path = str(tmp_path_factory.mktemp("tiny_model"))
+    build_tiny_model(path)
+    return path
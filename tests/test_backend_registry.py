@@ -0,0 +1,44 @@
+import pytest
+
+from textCraftAI.components import inference_backend
+from textCraftAI.components.inference_backend import (BackendLoadConfig, InferenceBackend, get_backend_class,
+                                                      register_backend)
+from textCraftAI.entity.config_entity import InferenceBackendConfig
+
+
+CONFIG = InferenceBackendConfig(backend="echo", onnx_model_dir="artifacts/onnx_models", intra_op_num_threads=0)
+
+
+def test_builtin_backends_are_registered():
+    assert get_backend_class("torch").name == "torch"
+    assert get_backend_class("onnxruntime").name == "onnxruntime"
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="Unknown inference backend 'tvm'"):
+        get_backend_class("tvm")
+
+
+def test_registered_backend_is_loaded_through_the_contract(monkeypatch):
+    monkeypatch.setattr(inference_backend, "_BACKENDS", dict(inference_backend._BACKENDS))
+    loaded = []
+
+    @register_backend
+    class EchoBackend(InferenceBackend):
+        name = "echo"
+
+        @classmethod
+        def load(cls, task, model_path, config):
+            loaded.append((task, model_path, config.tokenizer, config.backend.backend))
+            return cls.__new__(cls)
+
+    config = BackendLoadConfig(backend=CONFIG, tokenizer="t5-small")
+    backend = get_backend_class(CONFIG.backend).load("paraphrase", "t5-small", config)
+
+    assert isinstance(backend, EchoBackend)
+    assert loaded == [("paraphrase", "t5-small", "t5-small", "echo")]
+
+
+def test_base_class_has_no_loader():
+    with pytest.raises(NotImplementedError):
+        InferenceBackend.load("paraphrase", "t5-small", BackendLoadConfig(backend=CONFIG))
@@ -0,0 +1,79 @@
+import json
+import os
+
+import pytest
+
+datasets = pytest.importorskip("datasets")
+pytest.importorskip("pyarrow")
+pytest.importorskip("huggingface_hub")
+
+from textCraftAI.components.data_ingestion import DataIngestion  # noqa: E402
+from textCraftAI.entity.config_entity import DataIngestionConfig  # noqa: E402
+
+ROWS = [{"dialogue": f"#Person1#: message {i}", "summary": f"summary {i}"} for i in range(25)]
+
+
+@pytest.fixture
+def config(tmp_path):
+    data_file = tmp_path / "train.jsonl"
+    data_file.write_text("".join(json.dumps(row) + "\n" for row in ROWS))
+    return DataIngestionConfig(
+        root_dir=str(tmp_path), dataset_name="unused", data_files={"train": str(data_file)},
+        save_path=str(tmp_path / "dataset"), shard_rows=10
+    )
+
+
+def _record_reads(monkeypatch, skips, fail_after=None):
+    """Record where each read of the source starts; optionally drop the connection after ``fail_after`` rows"""
+    original = DataIngestion._iter_rows
+
+    def iter_rows(self, split, skip):
+        skips.append(skip)
+        for i, row in enumerate(original(self, split, skip)):
+            if i == fail_after:
+                raise ConnectionError("stream interrupted")
+            yield row
+
+    monkeypatch.setattr(DataIngestion, "_iter_rows", iter_rows)
+
+
+def _manifest(config):
+    with open(os.path.join(config.save_path, "manifest.json")) as f:
+        return json.load(f)
+
+
+def test_interrupted_ingestion_resumes_after_the_last_complete_shard(config, monkeypatch):
+    skips = []
+    with monkeypatch.context() as patch:
+        _record_reads(patch, skips, fail_after=15)
+        with pytest.raises(ConnectionError):
+            DataIngestion(config).load_and_save_dataset()
+    manifest = _manifest(config)
+    assert not manifest["complete"]
+    assert manifest["splits"]["train"]["rows"] == 10
+
+    _record_reads(monkeypatch, skips)
+    DataIngestion(config).load_and_save_dataset()
+
+    assert skips == [0, 10]
+    manifest = _manifest(config)
+    assert manifest["complete"]
+    assert [shard["rows"] for shard in manifest["splits"]["train"]["shards"]] == [10, 10, 5]
+    assert datasets.load_from_disk(config.save_path)["train"].to_list() == ROWS
+
+
+def test_complete_ingestion_is_kept_until_the_file_content_changes(config, monkeypatch):
+    DataIngestion(config).load_and_save_dataset()
+    skips = []
+    _record_reads(monkeypatch, skips)
+
+    # Same content with a new mtime, as after a checkout: nothing is read
+    os.utime(config.data_files["train"])
+    DataIngestion(config).load_and_save_dataset()
+    assert skips == []
+
+    with open(config.data_files["train"], "a") as f:
+        f.write(json.dumps({"dialogue": "new", "summary": "row"}) + "\n")
+    DataIngestion(config).load_and_save_dataset()
+    assert skips == [0]
+    assert _manifest(config)["splits"]["train"]["rows"] == len(ROWS) + 1
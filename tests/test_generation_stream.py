@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+pytest.importorskip("transformers")
+
+from textCraftAI.components.generation_stream import IncrementalCleaner
+from textCraftAI.utils.text_cleaner import clean_text
+
+
+PIECES = ["the", "The", "Cat", "sat", ".", "!", "?", ",", " ", "  ", "\n", "<n>", "</s>", "<b", ">", "<", "##",
+          "Mr", "A", "...", "[UNK]", "\x00", "É", "'", '"', "(", ")", "word."]
+
+
+def _stream(chunks):
+    """What a client ends up with after applying every delta and replacement"""
+    cleaner = IncrementalCleaner(clean_text)
+    text = ""
+    for chunk in list(chunks) + [None]:
+        delta, replaced = cleaner.feed(chunk) if chunk is not None else cleaner.finish()
+        text = delta if replaced else text + delta
+        assert text == cleaner.emitted
+    return text
+
+
+def test_streamed_text_matches_cleaning_the_whole_output():
+    rng = random.Random(0)
+    for _ in range(2000):
+        chunks = ["".join(rng.choice(PIECES) for _ in range(rng.randint(1, 3))) for _ in range(rng.randint(1, 30))]
+        assert _stream(chunks) == clean_text("".join(chunks))
+
+
+def test_finished_sentences_are_not_cleaned_again():
+    cleaned = []
+
+    def clean(text):
+        cleaned.append(text)
+        return clean_text(text)
+
+    cleaner = IncrementalCleaner(clean)
+    for word in ("First sentence here. " * 50).split(" "):
+        cleaner.feed(word + " ")
+    # Each call sees at most the current sentence plus the one being frozen
+    assert max(len(text) for text in cleaned) < 2 * len("First sentence here. ")
+    assert cleaner.emitted.startswith("First sentence here. First sentence here.")
@@ -0,0 +1,40 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+
+from textCraftAI.components.inference_backend import _PIPELINE_TASKS, InferenceBackend  # noqa: E402
+
+TEXT = "the customer asks about the refund and the agent explains the policy"
+
+
+def _backend(task, model_dir):
+    pipe = transformers.pipeline(_PIPELINE_TASKS[task][0], model=model_dir, tokenizer=model_dir, device=-1)
+    return pipe, InferenceBackend(task, pipe)
+
+
+@pytest.mark.parametrize("task", ["summarization", "paraphrase"])
+def test_token_id_path_matches_pipeline(tiny_model_dir, task):
+    pipe, backend = _backend(task, tiny_model_dir)
+    gen_kwargs = {"num_beams": 2, "max_length": 12, "do_sample": False}
+
+    expected = pipe(TEXT, **gen_kwargs)[0][backend.output_key]
+    assert backend.generate([TEXT], gen_kwargs) == [expected]
+
+
+def test_task_specific_params_and_prefix_match_pipeline(tiny_model_dir, tmp_path):
+    model = transformers.AutoModelForSeq2SeqLM.from_pretrained(tiny_model_dir)
+    model.config.task_specific_params = {
+        "summarization": {"prefix": "summary ", "num_beams": 3, "max_length": 9, "no_repeat_ngram_size": 2}
+    }
+    model.save_pretrained(tmp_path)
+    transformers.AutoTokenizer.from_pretrained(tiny_model_dir).save_pretrained(tmp_path)
+
+    pipe, backend = _backend("summarization", str(tmp_path))
+    assert backend.prefix == "summary "
+    assert backend.task_gen_kwargs == {"num_beams": 3, "max_length": 9, "no_repeat_ngram_size": 2}
+
+    expected = pipe(TEXT, do_sample=False)[0]["summary_text"]
+    assert backend.generate([TEXT], {"do_sample": False}) == [expected]
+    # Prepared inputs carry the prefix too
+    assert backend.generate_ids([backend.encode(TEXT)], {"do_sample": False})[0] == [expected]
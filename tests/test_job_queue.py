@@ -0,0 +1,68 @@
+import types
+
+import pytest
+
+from textCraftAI.components import job_queue
+from textCraftAI.components.job_queue import JobStore
+from textCraftAI.entity.config_entity import JobQueueConfig
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(job_queue, "time", types.SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def store(tmp_path, clock):
+    return JobStore(JobQueueConfig(
+        root_dir=tmp_path, num_workers=0, max_attempts=2, retry_backoff_seconds=10, lease_seconds=60,
+        result_ttl_hours=1, poll_interval_seconds=1, cleanup_interval_seconds=300, max_worker_restarts=0
+    ))
+
+
+def test_leased_job_is_not_claimed_twice(store, clock):
+    job_id = store.submit(b"text", "a.txt", "summarize")["id"]
+
+    assert store.claim("worker-1")["id"] == job_id
+    clock[0] += 59
+    assert store.claim("worker-2") is None
+
+
+def test_expired_lease_is_claimed_again(store, clock):
+    job_id = store.submit(b"text", "a.txt", "summarize")["id"]
+    store.claim("worker-1")
+
+    clock[0] += 61
+    job = store.claim("worker-2")
+    assert job["id"] == job_id
+    assert job["attempt"] == 2
+    assert job["file_content"] == b"text"
+    # The first worker lost the job and can no longer renew or finish it
+    assert not store.heartbeat(job_id, "worker-1")
+    store.complete(job_id, "worker-1", "stale")
+    assert store.get(job_id)["status"] == "running"
+
+
+def test_heartbeat_extends_the_lease(store, clock):
+    job_id = store.submit(b"text", "a.txt", "summarize")["id"]
+    store.claim("worker-1")
+
+    clock[0] += 50
+    assert store.heartbeat(job_id, "worker-1")
+    clock[0] += 50
+    assert store.claim("worker-2") is None
+
+
+def test_job_whose_worker_died_on_every_attempt_fails(store, clock):
+    job_id = store.submit(b"text", "a.txt", "summarize")["id"]
+    for worker in ("worker-1", "worker-2"):
+        assert store.claim(worker)["id"] == job_id
+        clock[0] += 61
+
+    assert store.claim("worker-3") is None
+    job = store.get(job_id)
+    assert job["status"] == "failed"
+    assert job["error"] == "worker died"
+    assert job["attempts"] == 2
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from textCraftAI.components.length_batching import (TokenBudgetBatchSampler, matched_accumulation_steps,  # noqa: E402
+                                                    padded_tokens)
+
+
+def _lengths(count=500, seed=0):
+    rng = random.Random(seed)
+    return [rng.randint(5, 300) for _ in range(count)], [rng.randint(3, 60) for _ in range(count)]
+
+
+def test_batches_cover_every_example_once_within_the_budget():
+    inputs, labels = _lengths()
+    sampler = TokenBudgetBatchSampler(inputs, labels, max_tokens=1024, max_batch_size=16)
+
+    batches = sampler.batches(0)
+    assert sorted(i for batch in batches for i in batch) == list(range(len(inputs)))
+    for batch in batches:
+        assert len(batch) <= 16
+        assert len(batch) == 1 or padded_tokens(batch, inputs, labels) <= 1024
+
+
+def test_example_over_the_budget_forms_its_own_batch():
+    sampler = TokenBudgetBatchSampler([10, 2000, 12], [5, 5, 5], max_tokens=256)
+    assert [1] in sampler.batches(0)
+
+
+def test_epochs_shuffle_the_same_batches():
+    inputs, labels = _lengths()
+    sampler = TokenBudgetBatchSampler(inputs, labels, max_tokens=1024, seed=7)
+
+    first, second = list(sampler), list(sampler)
+    assert len(first) == len(second) == len(sampler)
+    assert first != second
+    assert sorted(map(sorted, first)) == sorted(map(sorted, second))
+    assert TokenBudgetBatchSampler(inputs, labels, max_tokens=1024, seed=7).batches(0) == first
+
+
+def test_accumulation_keeps_examples_per_optimizer_step():
+    # 16 examples per step with batch size 1 and 16 accumulation steps
+    assert matched_accumulation_steps([[0, 1, 2, 3]] * 10, examples_per_step=16) == 4
+    assert matched_accumulation_steps([list(range(32))] * 10, examples_per_step=16) == 1
+    assert matched_accumulation_steps([], examples_per_step=16) == 1
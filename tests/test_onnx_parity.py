@@ -0,0 +1,33 @@
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+pytest.importorskip("onnxruntime")
+pytest.importorskip("optimum.onnxruntime")
+
+from export_onnx import PARITY_GEN_KWARGS  # noqa: E402
+from textCraftAI.components.inference_backend import (OnnxRuntimeBackend, TorchBackend,  # noqa: E402
+                                                      check_parity, export_onnx)
+
+INPUTS = [
+    "person1 says hi and asks about the refund policy",
+    "the agent explains the invoice and the team will call tomorrow",
+    "we need the project review report for the quarter results today please",
+]
+
+
+@pytest.fixture(scope="module")
+def onnx_model_dir(tiny_model_dir, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("onnx_model"))
+    export_onnx(tiny_model_dir, path)
+    return path
+
+
+@pytest.mark.parametrize("task", ["summarization", "paraphrase"])
+def test_onnx_runtime_matches_torch(tiny_model_dir, onnx_model_dir, task):
+    reference = TorchBackend.from_pretrained(task, tiny_model_dir, tiny_model_dir)
+    candidate = OnnxRuntimeBackend.from_export(task, onnx_model_dir)
+
+    for gen_kwargs in PARITY_GEN_KWARGS[task]:
+        result = check_parity(reference, candidate, INPUTS, gen_kwargs)
+        assert result["mismatches"] == [], gen_kwargs
@@ -0,0 +1,25 @@
+import random
+
+import pytest
+
+from benchmarks.text_cleaner_benchmark import _FUZZ_ATOMS, GOLDEN_CASES, legacy_clean_text
+from textCraftAI.utils.text_cleaner import clean_text, clean_texts
+
+
+@pytest.mark.parametrize("text, expected", GOLDEN_CASES)
+def test_golden_cases(text, expected):
+    assert clean_text(text) == expected
+    assert legacy_clean_text(text) == expected
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_matches_the_original_cleaner_on_random_inputs(seed):
+    rng = random.Random(seed)
+    for _ in range(2500):
+        text = "".join(rng.choice(_FUZZ_ATOMS) for _ in range(rng.randint(0, 25)))
+        assert clean_text(text) == legacy_clean_text(text), text
+
+
+def test_clean_texts_cleans_each_text():
+    texts = [text for text, _ in GOLDEN_CASES]
+    assert clean_texts(texts) == [expected for _, expected in GOLDEN_CASES]
@@ -0,0 +1,61 @@
+import pytest
+
+from textCraftAI.components.token_budget import InputTooLongError, TokenBudget
+from textCraftAI.entity.config_entity import TokenBudgetConfig
+
+
+class _WordTokenizer:
+    """One token per word plus an end-of-sequence token"""
+
+    is_fast = True
+    model_max_length = 512
+
+    def __call__(self, text, add_special_tokens=True, truncation=False, max_length=None):
+        ids = [len(word) for word in text.split()]
+        if truncation and max_length is not None:
+            ids = ids[:max_length - 1]
+        return {"input_ids": ids + [1] if add_special_tokens else ids}
+
+
+class _Backend:
+    def __init__(self):
+        self.tokenizer = _WordTokenizer()
+
+    def encode(self, text, **kwargs):
+        return self.tokenizer(text, **kwargs)["input_ids"]
+
+
+class _Registry:
+    def get(self, task):
+        return _Backend()
+
+
+@pytest.fixture
+def budget():
+    config = TokenBudgetConfig(max_input_chars=200, max_input_tokens={"paraphrase": 8, "summarization": 16})
+    return TokenBudget(config, _Registry())
+
+
+def test_input_within_limit_is_tokenized_once(budget):
+    model_input = budget.encode("paraphrase", "one two three")
+    assert model_input.input_ids == [3, 3, 5, 1]
+
+
+def test_too_many_tokens_is_rejected(budget):
+    with pytest.raises(InputTooLongError) as error:
+        budget.encode("paraphrase", "word " * 20)
+    assert error.value.num_tokens == 21 and error.value.max_tokens == 8
+
+
+def test_too_many_characters_is_rejected_before_tokenizing(budget):
+    with pytest.raises(InputTooLongError, match="characters"):
+        budget.encode("summarization", "x" * 201)
+
+
+def test_truncate_keeps_what_fits(budget):
+    model_input = budget.encode("paraphrase", "word " * 20, truncate=True)
+    assert len(model_input) == 8
+    assert model_input.input_ids[-1] == 1
+
+    long_text = "ab " * 100
+    assert len(budget.encode("summarization", long_text, truncate=True)) == 16
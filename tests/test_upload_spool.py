@@ -0,0 +1,71 @@
+import asyncio
+import hashlib
+import os
+
+import pytest
+
+from textCraftAI.components.upload_spool import UploadTooLargeError, spool_upload
+from textCraftAI.entity.config_entity import UploadConfig
+
+MB = 1024 * 1024
+CONFIG = UploadConfig(max_file_mb=1, chunk_kb=64, spool_threshold_mb=0.25)
+
+
+class _Upload:
+    """The part of FastAPI's UploadFile that spool_upload reads"""
+
+    def __init__(self, content: bytes, filename: str = "notes.txt", size=None):
+        self.content = content
+        self.filename = filename
+        self.size = size
+        self.read_bytes = 0
+
+    async def read(self, size: int) -> bytes:
+        chunk = self.content[self.read_bytes:self.read_bytes + size]
+        self.read_bytes += len(chunk)
+        return chunk
+
+
+def _spool(upload):
+    return asyncio.run(spool_upload(upload, CONFIG))
+
+
+def test_small_upload_stays_in_memory():
+    content = b"a" * 1000
+    with _spool(_Upload(content)) as spooled:
+        assert spooled.path is None
+        assert spooled.size == len(content)
+        assert spooled.sha256 == hashlib.sha256(content).hexdigest()
+        assert spooled.read_bytes() == content
+
+
+def test_upload_over_the_threshold_is_spooled_to_disk():
+    content = os.urandom(MB // 2)
+    with _spool(_Upload(content, "report.pdf")) as spooled:
+        path = spooled.path
+        assert path is not None and path.endswith(".pdf")
+        assert spooled.sha256 == hashlib.sha256(content).hexdigest()
+        with open(path, "rb") as f:
+            assert f.read() == content
+        assert spooled.file.read() == content
+    assert not os.path.exists(path)
+
+
+def test_upload_at_the_limit_is_accepted():
+    with _spool(_Upload(b"a" * MB)) as spooled:
+        assert spooled.size == MB
+
+
+def test_upload_over_the_limit_stops_reading():
+    upload = _Upload(b"a" * (3 * MB))
+    with pytest.raises(UploadTooLargeError):
+        _spool(upload)
+    # Rejected at the first chunk that crosses the limit, the rest is never read
+    assert upload.read_bytes <= MB + CONFIG.chunk_kb * 1024
+
+
+def test_reported_size_over_the_limit_reads_nothing():
+    upload = _Upload(b"a" * (2 * MB), size=2 * MB)
+    with pytest.raises(UploadTooLargeError):
+        _spool(upload)
+    assert upload.read_bytes == 0